@@ -1,33 +1,232 @@
 from __future__ import annotations
 
+import logging
+import os
+import time
 import uuid
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock, Thread, local
 from typing import Any
 
 import joblib
+import numpy as np
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from pydantic import BaseModel, Field, ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
 
 from balanceops.common.config import get_settings
 from balanceops.common.version import get_build_info
-from balanceops.registry.current import get_current_model_info
+from balanceops.models.feature_stats import FeatureStats
+from balanceops.registry.current import (
+    DEFAULT_MODEL_NAME,
+    current_model_path_for,
+    get_current_model_info,
+    is_valid_model_name,
+)
+from balanceops.registry.watch import CurrentModelWatcher, ModelPointer
+from balanceops.serving.batching import MicroBatcher
+from balanceops.serving.codec import (
+    BINARY_CONTENT_TYPES,
+    NPY_CONTENT_TYPE,
+    RAW_CONTENT_TYPE,
+    PayloadError,
+    decode_npy,
+    decode_raw,
+    encode_npy,
+    encode_raw,
+    media_type,
+)
+from balanceops.serving.compile import LinearScorer, compile_model, source_model
+from balanceops.serving.config import get_serving_settings
+from balanceops.serving.drift import DriftMonitor
+from balanceops.serving.http_cache import (
+    ResultCache,
+    etag_matches,
+    http_date,
+    make_etag,
+    not_modified_since,
+)
+from balanceops.serving.metrics import PROMETHEUS_CONTENT_TYPE, MetricsRegistry
+from balanceops.serving.model_cache import ModelLRU
+from balanceops.serving.prediction_log import (
+    PredictionLogger,
+    PredictionRecord,
+    finite_rows,
+    make_sink,
+    utc_now_iso,
+)
+from balanceops.serving.response_cache import ResponseCache, feature_key
+from balanceops.serving.shadow import ShadowScorer
+from balanceops.serving.stream import (
+    CsvRowParser,
+    DuplexStreamingResponse,
+    NdjsonRowParser,
+    RowError,
+    StreamError,
+    iter_lines,
+    make_row_parser,
+)
+from balanceops.tracking.history import get_metric_series, list_metric_history_keys
 from balanceops.tracking.init_db import init_db
-from balanceops.tracking.read import get_latest_run_id, get_run_detail, list_runs_summary
+from balanceops.tracking.read import (
+    decode_run_cursor,
+    encode_run_cursor,
+    get_latest_run_id,
+    get_run_detail,
+    get_tracking_generation,
+    list_runs_summary,
+)
+
+# uvicorn이 설정하는 로거를 그대로 사용(별도 logging 설정 없이 서버 로그에 함께 출력)
+_LOG = logging.getLogger("uvicorn.error")
+_METRICS = MetricsRegistry()
+_BATCHER: MicroBatcher | None = None
+_SHADOW: ShadowScorer | None = None
+_RESPONSE_CACHE: ResponseCache | None = None
+_PRED_LOG: PredictionLogger | None = None
+_DRIFT: DriftMonitor | None = None
+_HTTP_CACHE: ResultCache | None = None
+# 미들웨어가 설정: (request_id, 요청 시작 perf_counter). threadpool/배치 대기 중에도 전달됨
+_REQUEST_CTX: ContextVar[tuple[str, float] | None] = ContextVar("balanceops_request", default=None)
+
+# route 라벨은 경로 템플릿(/runs/{run_id})을 사용해 cardinality를 고정
+_HTTP_REQUESTS = _METRICS.counter(
+    "balanceops_http_requests_total",
+    "HTTP requests by route template, method and status.",
+    ["route", "method", "status"],
+)
+_HTTP_LATENCY = _METRICS.histogram(
+    "balanceops_http_request_duration_seconds",
+    "HTTP request latency until response start (seconds).",
+    ["route", "method"],
+)
+_STAGE_LATENCY = _METRICS.histogram(
+    "balanceops_predict_stage_seconds",
+    "Predict latency by stage: lookup, load, validation, inference (seconds).",
+    ["stage"],
+)
+
+
+_STARTUP_SECONDS = _METRICS.gauge(
+    "balanceops_startup_seconds",
+    "Startup duration until the app accepts traffic (from balanceops-serve launch if set).",
+)
+
+
+def _startup_origin(t0: float) -> float:
+    """기동 시간 측정 기준(time.time()). balanceops-serve가 남긴 launch 시각이 있으면 그것."""
+    try:
+        return float(os.environ["BALANCEOPS_SERVE_LAUNCHED_AT"])
+    except (KeyError, ValueError):
+        return t0
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    global _BATCHER, _SHADOW, _RESPONSE_CACHE, _PRED_LOG, _DRIFT, _WATCH_INTERVAL_S
+
     # startup
+    origin = _startup_origin(time.time())
     s = get_settings()
     init_db(s.db_path)
+
+    # 빌드 정보(git subprocess 포함)는 기동 시 1회 계산 후 메모리에서 제공
+    get_build_info()
+
+    ss = get_serving_settings()
+    if ss.microbatch_enabled:
+        _BATCHER = MicroBatcher(
+            max_batch_size=ss.microbatch_max_batch_size,
+            max_wait_ms=ss.microbatch_max_wait_ms,
+            metrics=_METRICS,
+        )
+        await _BATCHER.start()
+
+    if ss.response_cache_max_entries > 0:
+        _RESPONSE_CACHE = ResponseCache(
+            max_entries=ss.response_cache_max_entries,
+            ttl_s=ss.response_cache_ttl_s,
+            metrics=_METRICS,
+        )
+
+    sink = make_sink(
+        ss.prediction_log,
+        db_path=s.db_path,
+        directory=ss.prediction_log_dir or Path(s.artifacts_dir) / "prediction_logs",
+        rotate_bytes=int(ss.prediction_log_rotate_mb * 1024 * 1024),
+    )
+    if sink is not None:
+        _PRED_LOG = PredictionLogger(
+            sink,
+            capacity_rows=ss.prediction_log_capacity_rows,
+            batch_rows=ss.prediction_log_batch_rows,
+            flush_interval_s=ss.prediction_log_flush_ms / 1000.0,
+            metrics=_METRICS,
+        )
+        _PRED_LOG.start()
+
+    if ss.drift_monitor:
+        # 모델 로딩 전에 만들어 두어야 첫 로딩(preload/eager)에서 기준 통계가 설정됨
+        _DRIFT = DriftMonitor(metrics=_METRICS)
+
+    if ss.shadow_enabled:
+        _SHADOW = ShadowScorer(
+            s.db_path,
+            loader=_load_model_file,
+            sample_rate=ss.shadow_sample_rate,
+            run_id=ss.shadow_run_id,
+            queue_size=ss.shadow_queue_size,
+            metrics=_METRICS,
+        )
+        _SHADOW.start()
+
+    if ss.model_watch_interval_ms > 0:
+        _WATCH_INTERVAL_S = ss.model_watch_interval_ms / 1000.0
+        _get_watcher().start(_WATCH_INTERVAL_S, on_change=_on_pointer_change)
+
+    if ss.preload_model:
+        # uvicorn은 lifespan startup이 끝난 뒤에야 요청을 받으므로, 첫 요청이 cold load를 하지 않음
+        await run_in_threadpool(_preload_current_model)
+    elif ss.eager_load:
+        # 기동은 막지 않고 백그라운드로 로딩 시작(/ready는 워밍업이 끝나야 200)
+        _start_background_load()
+
+    startup = max(0.0, time.time() - origin)
+    _STARTUP_SECONDS.set(startup)
+    entry = _MODEL_CACHE
+    _LOG.info(
+        "balanceops api ready in %.3fs (pid=%d, model run_id=%s, load=%s)",
+        startup,
+        os.getpid(),
+        entry.run_id if entry.model is not None else None,
+        f"{entry.last_load_seconds:.3f}s" if entry.last_load_seconds is not None else "-",
+    )
+
     yield
-    # shutdown: 필요하면 정리 작업
+
+    # shutdown
+    _WATCH_INTERVAL_S = None
+    _close_watchers()
+    if _BATCHER is not None:
+        await _BATCHER.stop()
+        _BATCHER = None
+    if _SHADOW is not None:
+        _SHADOW.stop()
+        _SHADOW = None
+    _RESPONSE_CACHE = None
+    _DRIFT = None
+    if _PRED_LOG is not None:
+        # 남은 버퍼를 모두 기록한 뒤 종료
+        await run_in_threadpool(_PRED_LOG.stop)
+        _PRED_LOG = None
 
 
 app = FastAPI(lifespan=lifespan)
@@ -37,6 +236,45 @@ class PredictRequest(BaseModel):
     features: list[float]
 
 
+_MAX_BATCH_ROWS = 10_000
+# /predict/stream: chunk_size줄이 되기 전이라도 이 크기만큼 모이면 스코어링(긴 줄 대비 메모리 상한)
+_STREAM_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+class PredictBatchRequest(BaseModel):
+    rows: list[list[float]] = Field(min_length=1, max_length=_MAX_BATCH_ROWS)
+
+
+def _openapi_body(model: type[BaseModel]) -> dict[str, Any]:
+    """JSON(model) + 바이너리(.npy / raw float) 요청 body 문서화."""
+    binary = {"schema": {"type": "string", "format": "binary"}}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": model.model_json_schema()},
+                NPY_CONTENT_TYPE: binary,
+                RAW_CONTENT_TYPE: binary,
+            },
+        }
+    }
+
+
+def _parse_json_body(model: type[BaseModel], body: bytes) -> Any:
+    """pydantic-core로 bytes를 바로 파싱(json.loads + validate 2단계 생략)."""
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        errors = []
+        for err in e.errors(include_url=False):
+            err = {**err, "loc": ("body", *err["loc"])}
+            err.pop("ctx", None)
+            if not err["loc"][1:]:
+                err.pop("input", None)  # body 전체(대용량일 수 있음)는 되돌려주지 않음
+            errors.append(err)
+        raise RequestValidationError(errors) from None
+
+
 def _err(
     code: str,
     message: str,
@@ -82,11 +320,32 @@ def _infer_expected_n_features(model: Any) -> int | None:
     return None
 
 
+@contextmanager
+def _timed(stage: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _STAGE_LATENCY.observe(time.perf_counter() - t0, stage=stage)
+
+
 @app.middleware("http")
 async def _request_id_middleware(request: Request, call_next):
+    t0 = time.perf_counter()
     rid = request.headers.get("X-Request-ID") or str(uuid.uuid4())
     request.state.request_id = rid
-    resp = await call_next(request)
+    _REQUEST_CTX.set((rid, t0))
+
+    status = 500  # call_next가 예외를 던지면 500으로 집계
+    try:
+        resp = await call_next(request)
+        status = resp.status_code
+    finally:
+        # 라우팅 후 scope["route"]가 채워짐(매칭 실패 시 없음)
+        route = getattr(request.scope.get("route"), "path", None) or "<unmatched>"
+        _HTTP_REQUESTS.inc(route=route, method=request.method, status=str(status))
+        _HTTP_LATENCY.observe(time.perf_counter() - t0, route=route, method=request.method)
+
     resp.headers["X-Request-ID"] = rid
     return resp
 
@@ -120,10 +379,64 @@ class _HotModelCache:
     path: str | None = None
     mtime_ns: int | None = None
     model: Any | None = None
+    load_count: int = 0
+    last_load_seconds: float | None = None
+    last_error: str | None = None
+
+
+@dataclass
+class _InflightLoad:
+    done: Event = field(default_factory=Event)
+    model: Any | None = None
+    error: Exception | None = None
+
+
+@dataclass
+class _LoadFailure:
+    key: tuple[str, str, str, int, str | None]
+    error: Exception
+    attempts: int
+    retry_at: float  # time.monotonic() 기준. 그 전에는 같은 아티팩트를 다시 로딩하지 않음
 
 
 _MODEL_LOCK = Lock()
+# 기본 모델(balance_model)은 항상 상주. 그 외 이름은 _NAMED_MODELS(LRU, 바이트 예산)에 보관
 _MODEL_CACHE = _HotModelCache()
+_NAMED_MODELS: ModelLRU | None = None
+_INFLIGHT: dict[tuple[str, str, str, int, str | None], _InflightLoad] = {}
+# 실패한 로딩의 재시도 backoff: (db_path, name) → 마지막 실패. 같은 포인터면 retry_at까지
+# 요청마다 joblib.load를 반복하지 않고 직전 모델로 서빙(없으면 같은 에러로 바로 실패)
+_LOAD_FAILURES: dict[tuple[str, str], _LoadFailure] = {}
+_LOAD_RETRY_MIN_S = 1.0
+_LOAD_RETRY_MAX_S = 60.0
+_WARMUP_ROWS = 32
+_MODEL_LOADS = _METRICS.counter(
+    "balanceops_model_loads_total", "Model artifact loads (joblib.load).", ["result"]
+)
+_MODEL_INFO = _METRICS.gauge(
+    "balanceops_model_info", "Currently served model (value is always 1).", ["run_id"]
+)
+_MODEL_LOAD_COUNT = _METRICS.gauge(
+    "balanceops_model_load_count", "Successful model loads since process start."
+)
+_MODEL_LAST_LOAD = _METRICS.gauge(
+    "balanceops_model_last_load_seconds", "Duration of the last successful model load."
+)
+_MODEL_FILE_SIZE = _METRICS.gauge(
+    "balanceops_model_file_size_bytes", "Size of the served model artifact."
+)
+# 요청 스레드에서 동기 로딩이 일어난 경우, lookup 시간에서 load 시간을 빼기 위한 값
+_LOAD_TLS = local()
+
+_WATCHER_LOCK = Lock()
+_WATCHERS: dict[str, CurrentModelWatcher] = {}
+_WATCHERS_KEY: tuple[str, str, str] | None = None
+# lifespan에서 백그라운드 폴링을 켠 경우의 주기(초). 이후 생성되는 이름별 watcher도 같은 주기로 시작
+_WATCH_INTERVAL_S: float | None = None
+# 승격되지 않은 이름 → 만료 시각(monotonic). TTL 동안은 요청마다 DB를 조회하지 않고 404
+_UNKNOWN_NAMES: dict[str, float] = {}
+_UNKNOWN_NAME_TTL_S = 2.0
+_UNKNOWN_NAMES_MAX = 1024
 
 
 def _unwrap_loaded_model(obj: Any) -> Any:
@@ -133,88 +446,353 @@ def _unwrap_loaded_model(obj: Any) -> Any:
     return obj
 
 
-def _clear_model_cache() -> None:
+def _loaded_feature_stats(obj: Any) -> FeatureStats | None:
+    # train_tabular_baseline 래퍼의 학습 통계(드리프트 기준). 없거나 형식이 다르면 None
+    stats = obj.get("feature_stats") if isinstance(obj, dict) else None
+    if not isinstance(stats, dict):
+        return None
+    try:
+        return FeatureStats.from_dict(stats)
+    except (KeyError, TypeError, ValueError) as e:
+        _LOG.warning("ignoring invalid feature_stats: %s: %s", type(e).__name__, e)
+        return None
+
+
+def _load_artifact(path: str) -> tuple[Any, FeatureStats | None]:
+    """모델 아티팩트 → (predict_proba 모델, 학습 feature 통계 | None)."""
+    # mmap: 비압축 아티팩트의 numpy 배열을 읽기 전용 memmap으로(worker 간 page cache 공유)
+    raw = joblib.load(path, mmap_mode="r" if get_serving_settings().model_mmap else None)
+    model = _unwrap_loaded_model(raw)
+
+    # predict_proba 계약 체크(더 친절한 에러)
+    if not hasattr(model, "predict_proba"):
+        raise RuntimeError(
+            f"current model does not support predict_proba (loaded_type={type(raw).__name__})"
+        )
+    return model, _loaded_feature_stats(raw)
+
+
+def _load_model_file(path: str) -> Any:
+    return _load_artifact(path)[0]
+
+
+def _named_models() -> ModelLRU:
+    global _NAMED_MODELS
+    if _NAMED_MODELS is None:
+        ss = get_serving_settings()
+        _NAMED_MODELS = ModelLRU(
+            max_bytes=int(ss.model_cache_max_mb * 1024 * 1024),
+            max_entries=ss.model_cache_max_models,
+            metrics=_METRICS,
+        )
+    return _NAMED_MODELS
+
+
+def _cache_entry(name: str) -> _HotModelCache | None:
+    """_MODEL_LOCK 안에서 호출. 이름별 캐시 항목(LRU 순서 갱신 포함)."""
+    if name == DEFAULT_MODEL_NAME:
+        return _MODEL_CACHE
+    return _named_models().get(name)
+
+
+def _invalidate_responses(name: str) -> None:
+    cache = _RESPONSE_CACHE
+    if cache is not None:
+        cache.invalidate(name)
+
+
+def _clear_model_cache(name: str = DEFAULT_MODEL_NAME) -> None:
+    _invalidate_responses(name)
     with _MODEL_LOCK:
+        for k in [k for k in _LOAD_FAILURES if k[1] == name]:
+            del _LOAD_FAILURES[k]
+        if name != DEFAULT_MODEL_NAME:
+            _named_models().pop(name)
+            return
         _MODEL_CACHE.db_path = None
         _MODEL_CACHE.run_id = None
         _MODEL_CACHE.path = None
         _MODEL_CACHE.mtime_ns = None
         _MODEL_CACHE.model = None
+        _MODEL_INFO.clear()
+        _MODEL_FILE_SIZE.set(0)
+    drift = _DRIFT
+    if drift is not None and name == DEFAULT_MODEL_NAME:
+        drift.reset(None, None)
 
 
-def _resolve_model_path(path: str) -> Path:
-    """DB에 저장된 path를 가능한 한 실제 파일 경로로 해석."""
-    p = Path(path)
-    if p.exists():
-        return p
+def _close_watchers() -> None:
+    with _WATCHER_LOCK:
+        for w in _WATCHERS.values():
+            w.close()
+        _WATCHERS.clear()
+        _UNKNOWN_NAMES.clear()
 
-    # 상대경로인 경우 artifacts_dir 하위도 한 번 더 시도
-    if not p.is_absolute():
-        s = get_settings()
-        p2 = Path(s.artifacts_dir) / p
-        if p2.exists():
-            return p2
-
-    return p
 
+def _remember_unknown_name(name: str) -> None:
+    """_WATCHER_LOCK 안에서 호출. 크기는 _UNKNOWN_NAMES_MAX로 제한(만료분부터 정리)."""
+    now = time.monotonic()
+    if len(_UNKNOWN_NAMES) >= _UNKNOWN_NAMES_MAX:
+        for k in [k for k, until in _UNKNOWN_NAMES.items() if until <= now]:
+            del _UNKNOWN_NAMES[k]
+        if len(_UNKNOWN_NAMES) >= _UNKNOWN_NAMES_MAX:
+            _UNKNOWN_NAMES.clear()
+    _UNKNOWN_NAMES[name] = now + _UNKNOWN_NAME_TTL_S
 
-def _get_model():
-    """현재(current) 모델을 캐시하되, 파일 변경(mtime)
-    DB current 포인터 변경 시 자동으로 재로딩."""
-    db_path = get_settings().db_path
-    info = get_current_model_info()
-    if not info:
-        _clear_model_cache()
-        return None
 
-    path = info.get("path")
-    if not path:
-        _clear_model_cache()
-        return None
+def _get_watcher(name: str = DEFAULT_MODEL_NAME) -> CurrentModelWatcher | None:
+    """settings(DB/경로)에 대응하는 이름별 current 포인터 watcher(프로세스 단위, 이름당 1개).
 
-    p = _resolve_model_path(str(path))
-    try:
-        mtime_ns = p.stat().st_mtime_ns
-    except FileNotFoundError:
-        # DB의 path가 다른 OS/환경의 절대경로로 저장되어 있어 깨진 경우,
-        # canonical 경로(settings.current_model_path)를 한 번 더 시도한다.
-        fallback = Path(get_settings().current_model_path)
-        try:
-            mtime_ns = fallback.stat().st_mtime_ns
-            p = fallback
-        except FileNotFoundError:
-            _clear_model_cache()
+    기본 모델이 아닌 이름은 DB에 current row가 있을 때만 만든다(없으면 None).
+    없다는 결과는 _UNKNOWN_NAME_TTL_S 동안 캐시한다(새 이름의 승격은 최대 그만큼 늦게 반영).
+    """
+    global _WATCHERS_KEY
+    s = get_settings()
+    key = (s.db_path, s.artifacts_dir, s.current_model_path)
+
+    w = _WATCHERS.get(name)
+    if _WATCHERS_KEY == key:
+        if w is not None:
+            return w
+        until = _UNKNOWN_NAMES.get(name)
+        if until is not None and time.monotonic() < until:
             return None
 
-    run_id = info.get("run_id")
+    with _WATCHER_LOCK:
+        if _WATCHERS_KEY != key:
+            for old in _WATCHERS.values():
+                old.close()
+            _WATCHERS.clear()
+            _UNKNOWN_NAMES.clear()
+            _WATCHERS_KEY = key
+
+        w = _WATCHERS.get(name)
+        if w is not None:
+            return w
+
+        if name != DEFAULT_MODEL_NAME:
+            if not is_valid_model_name(name):
+                return None
+            if not get_current_model_info(name=name):
+                _remember_unknown_name(name)
+                return None
+            _UNKNOWN_NAMES.pop(name, None)
+
+        w = _WATCHERS[name] = CurrentModelWatcher(
+            s.db_path,
+            artifacts_dir=s.artifacts_dir,
+            fallback_path=str(current_model_path_for(name, s)),
+            name=name,
+        )
+        if _WATCH_INTERVAL_S is not None:
+            w.start(_WATCH_INTERVAL_S, on_change=_on_pointer_change)
+        return w
+
+
+def _warm_up(model: Any) -> None:
+    """sklearn/NumPy 첫 호출 오버헤드를 서빙 전에 지불(합성 배치 1회 + 단건 1회)."""
+    n = _infer_expected_n_features(model) or 8
+    model.predict_proba(np.zeros((_WARMUP_ROWS, n), dtype=float))
+    model.predict_proba(np.zeros((1, n), dtype=float))
+
+
+def _observe_load(seconds: float) -> None:
+    _STAGE_LATENCY.observe(seconds, stage="load")
+    _LOAD_TLS.seconds = getattr(_LOAD_TLS, "seconds", 0.0) + seconds
+
+
+def _ensure_loaded(db_path: str, ptr: ModelPointer, *, wait: bool = False) -> Any:
+    """ptr이 가리키는 모델을 (필요하면) 로딩+워밍업 후 캐시에 원자적으로 교체.
+
+    - single-flight: 같은 (name, path, mtime, run_id) 로딩은 한 스레드만 수행
+    - wait=False인 follower는 로딩 중 직전 모델로 계속 서빙(없으면 결과 대기)
+    - 기본 모델이 아니면 이름별 LRU에 넣는다(admission이 거절되면 이번 요청에만 사용하고,
+      ModelLRU가 ghost로 기억해 다음 로딩에서 admit)
+    - 로딩이 실패하면 직전 모델을 유지한다(wait=False면 직전 모델을 반환, 없으면 raise).
+      같은 포인터의 재시도는 지수 backoff(_LOAD_RETRY_MIN_S ~ _LOAD_RETRY_MAX_S) 뒤에만 한다
+    """
+    name = ptr.name
+    key = (db_path, name, ptr.path, ptr.mtime_ns, ptr.run_id)
 
     with _MODEL_LOCK:
+        entry = _cache_entry(name)
         if (
-            _MODEL_CACHE.model is not None
-            and _MODEL_CACHE.db_path == db_path
-            and _MODEL_CACHE.path == str(p)
-            and _MODEL_CACHE.run_id == run_id
-            and _MODEL_CACHE.mtime_ns == mtime_ns
+            entry is not None
+            and entry.model is not None
+            and entry.db_path == db_path
+            and entry.path == ptr.path
+            and entry.run_id == ptr.run_id
+            and entry.mtime_ns == ptr.mtime_ns
         ):
-            return _MODEL_CACHE.model
+            return entry.model
+
+        previous = entry.model if entry is not None and entry.db_path == db_path else None
+        failure = _LOAD_FAILURES.get((db_path, name))
+        if failure is not None and failure.key == key and time.monotonic() < failure.retry_at:
+            if previous is not None and not wait:
+                return previous
+            raise failure.error
+
+        flight = _INFLIGHT.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = _INFLIGHT[key] = _InflightLoad()
+
+    if not leader:
+        # 로딩 중에는 직전 모델로 계속 서빙, 직전 모델이 없으면 로더 결과를 기다림
+        if previous is not None and not wait:
+            return previous
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.model
+
+    t0 = time.perf_counter()
+    try:
+        model, feature_stats = _load_artifact(ptr.path)
+        if get_serving_settings().compile_linear:
+            model = compile_model(model)
+        _warm_up(model)
+    except Exception as e:
+        flight.error = e
+        _observe_load(time.perf_counter() - t0)
+        _MODEL_LOADS.inc(result="error")
+        with _MODEL_LOCK:
+            entry = _MODEL_CACHE if name == DEFAULT_MODEL_NAME else _named_models().peek(name)
+            if entry is not None:
+                entry.last_error = f"{type(e).__name__}: {e}"
+            prev = _LOAD_FAILURES.get((db_path, name))
+            attempts = prev.attempts + 1 if prev is not None and prev.key == key else 1
+            delay = min(_LOAD_RETRY_MAX_S, _LOAD_RETRY_MIN_S * 2 ** (attempts - 1))
+            _LOAD_FAILURES[(db_path, name)] = _LoadFailure(
+                key, e, attempts, time.monotonic() + delay
+            )
+        _LOG.warning(
+            "model load failed (name=%s, run_id=%s, retry in %.0fs): %s: %s",
+            name,
+            ptr.run_id,
+            delay,
+            type(e).__name__,
+            e,
+        )
+        if previous is not None and not wait:
+            return previous  # 직전 모델로 계속 서빙
+        raise
+    else:
+        flight.model = model
+        elapsed = time.perf_counter() - t0
+        _observe_load(elapsed)
+        _MODEL_LOADS.inc(result="ok")
+        with _MODEL_LOCK:
+            _LOAD_FAILURES.pop((db_path, name), None)
+            if name == DEFAULT_MODEL_NAME:
+                entry = _MODEL_CACHE
+            else:
+                entry = _named_models().peek(name) or _HotModelCache()
+            entry.db_path = db_path
+            entry.model = model
+            entry.path = ptr.path
+            entry.run_id = ptr.run_id
+            entry.mtime_ns = ptr.mtime_ns
+            entry.load_count += 1
+            entry.last_load_seconds = elapsed
+            entry.last_error = None
+
+            if name == DEFAULT_MODEL_NAME:
+                _MODEL_INFO.clear()
+                _MODEL_INFO.set(1, run_id=ptr.run_id or "")
+                _MODEL_LOAD_COUNT.set(entry.load_count)
+                _MODEL_LAST_LOAD.set(elapsed)
+                _MODEL_FILE_SIZE.set(ptr.size_bytes)
+            else:
+                _named_models().put(name, entry, ptr.size_bytes)
+        drift = _DRIFT
+        if drift is not None and name == DEFAULT_MODEL_NAME:
+            # 새 모델의 학습 통계 기준으로 누적을 다시 시작(통계가 없으면 관측 중단)
+            drift.reset(feature_stats, ptr.run_id)
+        # 교체된 모델의 응답은 key(identity)가 달라 조회되지 않지만, 메모리는 바로 비운다
+        _invalidate_responses(name)
+    finally:
+        with _MODEL_LOCK:
+            _INFLIGHT.pop(key, None)
+        flight.done.set()
 
-    raw = joblib.load(p)
-    model = _unwrap_loaded_model(raw)
+    return model
 
-    # predict_proba 계약 체크(더 친절한 에러)
-    if not hasattr(model, "predict_proba"):
-        raise RuntimeError(
-            f"current model does not support predict_proba (loaded_type={type(raw).__name__})"
+
+def _on_pointer_change(ptr: ModelPointer | None) -> None:
+    """watcher 백그라운드 스레드: 새 current를 미리 로딩/워밍업 후 교체(double-buffer).
+
+    실패하면 직전 모델을 유지하고 에러는 캐시 항목의 last_error(/version)에 남긴다.
+    예외를 watcher로 올려 보내면 같은 포인터로 다음 주기에 다시 불리므로, 일시적 실패도
+    backoff(_LOAD_FAILURES) 간격으로 재시도된다.
+    """
+    if ptr is None:
+        return
+    w = _WATCHERS.get(ptr.name)
+    if w is None:
+        return
+    _ensure_loaded(w.db_path, ptr, wait=True)
+
+
+def _preload_current_model() -> None:
+    """기동 시 기본 current 모델을 로딩+워밍업. 미승격/실패면 첫 요청에서 다시 시도."""
+    try:
+        _get_model()
+    except Exception as e:
+        # 캐시는 비우지 않는다(last_error/backoff 유지, 직전 모델이 있으면 계속 서빙)
+        _LOG.warning("model preload failed: %s: %s", type(e).__name__, e)
+
+
+_PRELOAD_LOCK = Lock()
+_PRELOAD_THREAD: Thread | None = None
+
+
+def _start_background_load() -> bool:
+    """기본 current 모델 로딩을 백그라운드 스레드로 시작. 이미 진행 중이면 False."""
+    global _PRELOAD_THREAD
+    with _PRELOAD_LOCK:
+        if _PRELOAD_THREAD is not None and _PRELOAD_THREAD.is_alive():
+            return False
+        _PRELOAD_THREAD = Thread(
+            target=_preload_current_model, name="balanceops-model-preload", daemon=True
         )
+        _PRELOAD_THREAD.start()
+        return True
 
+
+def _default_model_loading() -> bool:
+    t = _PRELOAD_THREAD
+    if t is not None and t.is_alive():
+        return True
     with _MODEL_LOCK:
-        _MODEL_CACHE.db_path = db_path
-        _MODEL_CACHE.model = model
-        _MODEL_CACHE.path = str(p)
-        _MODEL_CACHE.run_id = run_id
-        _MODEL_CACHE.mtime_ns = mtime_ns
+        return any(key[1] == DEFAULT_MODEL_NAME for key in _INFLIGHT)
 
-    return model
+
+def _get_model(name: str = DEFAULT_MODEL_NAME):
+    """이름별 current 모델을 캐시하되, 파일 변경(mtime)
+    DB current 포인터 변경 시 자동으로 재로딩.
+
+    - current 포인터(run_id/path/mtime)는 이름별 CurrentModelWatcher가 메모리에 유지
+    - watcher가 백그라운드로 돌고 있으면 새 모델 로딩/워밍업/교체도 백그라운드에서 수행되고,
+      요청 경로는 교체 전까지 직전 모델을 그대로 사용
+    """
+    watcher = _get_watcher(name)
+    if watcher is None:
+        return None
+    ptr = watcher.current()
+    if ptr is None:
+        _clear_model_cache(name)
+        return None
+
+    if watcher.running:
+        with _MODEL_LOCK:
+            entry = _cache_entry(name)
+            live = entry.model if entry is not None and entry.db_path == watcher.db_path else None
+        if live is not None:
+            return live
+
+    return _ensure_loaded(watcher.db_path, ptr)
 
 
 @app.get("/health")
@@ -222,6 +800,45 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready() -> JSONResponse:
+    """readiness: 기본 current 모델이 로딩+워밍업되어 _HotModelCache에 있을 때만 200.
+
+    /health는 프로세스 생존만 본다. 준비되지 않았으면 503이고, 진행 중인 로딩이 없으면
+    백그라운드 로딩을 시작한다(트래픽이 없어도 승격된 모델로 결국 ready가 되도록).
+    """
+    with _MODEL_LOCK:
+        e = _MODEL_CACHE
+        model = e.model
+        info: dict[str, Any] = {
+            "name": DEFAULT_MODEL_NAME,
+            "run_id": e.run_id,
+            "path": e.path,
+            "mtime_ns": e.mtime_ns,
+            "load_seconds": e.last_load_seconds,
+            "load_count": e.load_count,
+            "last_error": e.last_error,
+        }
+
+    if model is not None:
+        info["compiled"] = isinstance(model, LinearScorer)
+        return JSONResponse({"status": "ready", "model": info})
+
+    if _default_model_loading():
+        reason = "loading"
+    else:
+        watcher = _get_watcher()
+        if watcher is None or watcher.current() is None:
+            reason = "no_current_model"
+        else:
+            reason = "load_failed" if e.last_error else "not_loaded"
+            _start_background_load()
+    return JSONResponse(
+        {"status": "not_ready", "reason": reason, "last_error": info["last_error"]},
+        status_code=503,
+    )
+
+
 @app.get("/version")
 def version() -> dict[str, Any]:
     """서버 식별용 버전/빌드 정보.
@@ -238,40 +855,191 @@ def version() -> dict[str, Any]:
     try:
         model = _get_model()  # predict에서 쓰는 동일 로더/캐시 사용
         info["expected_n_features"] = _infer_expected_n_features(model) or 8
-        info["model_type"] = type(model).__name__
+        info["model_type"] = type(source_model(model)).__name__
+        info["model_compiled"] = isinstance(model, LinearScorer)
     except Exception as e:
         info["expected_n_features"] = None
         info["model_type"] = None
         info["model_error"] = str(e)
 
+    info["model_load_count"] = _MODEL_CACHE.load_count
+    info["model_run_id"] = _MODEL_CACHE.run_id
+    if _MODEL_CACHE.last_error:
+        # 백그라운드 교체 실패: 직전 모델로 계속 서빙 중
+        info["model_swap_error"] = _MODEL_CACHE.last_error
     return info
 
 
+@app.get("/metrics")
+def metrics() -> PlainTextResponse:
+    """Prometheus text format 메트릭."""
+    drift = _DRIFT
+    if drift is not None:
+        drift.snapshot()  # feature별 PSI/KS gauge 갱신
+    return PlainTextResponse(_METRICS.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def _http_cache() -> ResultCache:
+    global _HTTP_CACHE
+    if _HTTP_CACHE is None:
+        _HTTP_CACHE = ResultCache(
+            get_serving_settings().http_result_cache_max_entries, metrics=_METRICS
+        )
+    return _HTTP_CACHE
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _iso_timestamp(text: str) -> float:
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _conditional_json(
+    request: Request,
+    route: str,
+    build: Callable[[], Any],
+    *,
+    params: tuple[Any, ...] = (),
+    files: tuple[Path, ...] = (),
+) -> Response:
+    """조건부 GET: validator가 같으면 304, 아니면 (캐시된) JSON 본문 + ETag/Last-Modified.
+
+    validator = tracking_generation(1행) + 포인터 파일 stat + 요청 파라미터.
+    304 / 캐시 hit 경로는 runs/metrics 테이블과 _by_id JSON을 읽지 않는다.
+    """
+    s = get_settings()
+    gen = get_tracking_generation(s.db_path)
+    if gen is None:
+        return JSONResponse(build())  # init_db 전 DB: validator 없음
+
+    stamps = tuple(_file_stamp(p) for p in files)
+    etag = make_etag(route, params, s.db_path, s.artifacts_dir, gen[0], stamps)
+    last_modified = max([_iso_timestamp(gen[1]), *(st[0] / 1e9 for st in stamps if st is not None)])
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        "Cache-Control": "no-cache",
+    }
+
+    cache = _http_cache()
+    inm = request.headers.get("if-none-match")
+    if etag_matches(inm, etag) or (
+        inm is None and not_modified_since(request.headers.get("if-modified-since"), last_modified)
+    ):
+        cache.record(route, "not_modified")
+        return Response(status_code=304, headers=headers)
+
+    body = cache.get(route, etag)
+    if body is None:
+        body = JSONResponse(build()).body
+        cache.put(route, etag, body)
+        cache.record(route, "built")
+    else:
+        cache.record(route, "cached")
+    return Response(body, media_type="application/json", headers=headers)
+
+
 @app.get("/model")
-def model_info() -> dict[str, Any]:
-    return get_current_model_info()
+def model_info(request: Request) -> Response:
+    return _conditional_json(request, "/model", get_current_model_info)
+
+
+@app.get("/shadow")
+def shadow_summary() -> dict[str, Any]:
+    """shadow scoring 현황(current vs candidate 차이 요약). 쌍 데이터는 DB shadow_scores."""
+    shadow = _SHADOW
+    if shadow is None:
+        return {"enabled": False}
+    return {"enabled": True, **shadow.summary()}
+
+
+@app.get("/drift")
+def drift_summary() -> dict[str, Any]:
+    """기본 모델 입력의 feature 드리프트(학습 통계 대비 PSI/KS/평균 이동, 모델 로딩 이후 누적)."""
+    drift = _DRIFT
+    if drift is None:
+        return {"enabled": False}
+    return {"enabled": True, **drift.snapshot()}
 
 
 @app.get("/runs")
 def list_runs(
+    request: Request,
     limit: int = Query(20, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, max_length=512),
     include_metrics: bool = True,
-) -> dict[str, Any]:
-    s = get_settings()
-    items = list_runs_summary(
-        s.db_path,
-        limit=limit,
-        offset=offset,
-        include_metrics=include_metrics,
-        artifacts_root=s.artifacts_dir,
-        include_run_dir_name=True,
+) -> Response:
+    """run 목록. 깊은 페이지는 offset 대신 응답의 next_cursor를 cursor로 넘기세요(keyset)."""
+    if cursor is not None:
+        try:
+            decode_run_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=_err(
+                    "INVALID_CURSOR",
+                    "cursor is malformed.",
+                    hint="Pass next_cursor from a previous GET /runs response as-is.",
+                ),
+            ) from None
+
+    def build() -> dict[str, Any]:
+        s = get_settings()
+        items = list_runs_summary(
+            s.db_path,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_metrics=include_metrics,
+            artifacts_root=s.artifacts_dir,
+            include_run_dir_name=True,
+        )
+        # 페이지가 가득 찼을 때만 다음 cursor(마지막 run 기준)
+        next_cursor = (
+            encode_run_cursor(items[-1]["created_at"], items[-1]["run_id"])
+            if len(items) == limit
+            else None
+        )
+        return {
+            "items": items,
+            "limit": limit,
+            "offset": offset,
+            "count": len(items),
+            "next_cursor": next_cursor,
+        }
+
+    # run_dir_name은 _by_id 포인터에서 읽으므로 디렉터리 stat도 validator에 포함
+    return _conditional_json(
+        request,
+        "/runs",
+        build,
+        params=(limit, offset, cursor, include_metrics),
+        files=(Path(get_settings().artifacts_dir) / "runs" / "_by_id",),
     )
-    return {"items": items, "limit": limit, "offset": offset, "count": len(items)}
 
 
 @app.get("/runs/latest")
-def latest_run() -> dict[str, Any]:
+def latest_run(request: Request) -> Response:
+    runs_dir = Path(get_settings().artifacts_dir) / "runs"
+    return _conditional_json(
+        request,
+        "/runs/latest",
+        _latest_run_detail,
+        files=(runs_dir / "_latest.json", runs_dir / "_by_id"),
+    )
+
+
+def _latest_run_detail() -> dict[str, Any]:
     s = get_settings()
     run_id = get_latest_run_id(artifacts_root=s.artifacts_dir, db_path=s.db_path)
     if run_id is None:
@@ -317,23 +1085,88 @@ def get_run(run_id: str) -> dict[str, Any]:
     return detail
 
 
-@app.post("/predict")
-def predict(req: PredictRequest):
+@app.get("/runs/{run_id}/history")
+def run_metric_history(
+    run_id: str,
+    key: str | None = Query(None, max_length=256),
+    max_points: int = Query(1000, ge=4, le=10_000),
+    method: str = Query("minmax", pattern="^(minmax|lttb)$"),
+    start_step: int | None = Query(None, ge=0),
+    end_step: int | None = Query(None, ge=0),
+) -> dict[str, Any]:
+    """step 단위 metric 시계열. key가 없으면 기록된 key 목록, 있으면 max_points개로 줄인 시계열.
+
+    응답 시계열은 열 단위 배열(step/ts/value). 수백만 점이어도 rollup을 읽어 응답 크기·시간이
+    max_points에 비례한다.
+    """
+    s = get_settings()
+    if key is None:
+        return {"run_id": run_id, "items": list_metric_history_keys(s.db_path, run_id)}
+
+    series = get_metric_series(
+        s.db_path,
+        run_id,
+        key,
+        max_points=max_points,
+        method=method,
+        start_step=start_step,
+        end_step=end_step,
+    )
+    if series is None:
+        raise HTTPException(
+            status_code=404,
+            detail=_err(
+                "METRIC_NOT_FOUND",
+                "No metric history in the requested range.",
+                details={"run_id": run_id, "key": key},
+                hint="GET /runs/{run_id}/history (without key) lists recorded keys.",
+            ),
+        )
+    return series
+
+
+def _observe_lookup(t0: float) -> None:
+    elapsed = time.perf_counter() - t0 - getattr(_LOAD_TLS, "seconds", 0.0)
+    _STAGE_LATENCY.observe(max(0.0, elapsed), stage="lookup")
+
+
+def _require_model(name: str = DEFAULT_MODEL_NAME) -> Any:
+    """predict 계열 엔드포인트 공통: current 모델을 가져오거나 표준 에러로 실패.
+
+    lookup stage = 포인터 확인 + 캐시 조회(같은 스레드에서 일어난 load 시간은 제외)
+    """
+    _LOAD_TLS.seconds = 0.0
+    t0 = time.perf_counter()
     try:
-        model = _get_model()
+        model = _get_model(name)
     except Exception as e:
-        _clear_model_cache()
+        # 캐시는 비우지 않는다: 직전 모델은 _ensure_loaded가 계속 서빙, 에러는 last_error에
+        _observe_lookup(t0)
+        details = {"type": type(e).__name__, "message": str(e)}
+        if name != DEFAULT_MODEL_NAME:
+            details["name"] = name
         raise HTTPException(
             status_code=500,
             detail=_err(
                 "CURRENT_MODEL_LOAD_FAILED",
                 "Failed to load current model.",
                 hint="Re-promote a valid model as current.",
-                details={"type": type(e).__name__, "message": str(e)},
+                details=details,
             ),
         )
 
+    _observe_lookup(t0)
     if model is None:
+        if name != DEFAULT_MODEL_NAME:
+            raise HTTPException(
+                status_code=404,
+                detail=_err(
+                    "NO_CURRENT_MODEL",
+                    "No current model promoted for this name.",
+                    hint="Promote one with: balanceops-promote --latest --name <name>",
+                    details={"name": name},
+                ),
+            )
         raise HTTPException(
             status_code=404,
             detail=_err(
@@ -346,9 +1179,11 @@ def predict(req: PredictRequest):
                 ),
             ),
         )
+    return model
+
 
+def _check_feature_size(model: Any, got: int) -> None:
     expected = _infer_expected_n_features(model) or 8  # 힌트가 없으면 기존 계약(8)로 fallback
-    got = len(req.features)
 
     if expected != got:
         raise HTTPException(
@@ -364,5 +1199,409 @@ def predict(req: PredictRequest):
             ),
         )
 
-    proba = model.predict_proba([req.features])[0][1]
-    return {"p_win": float(proba)}
+
+def _check_finite(X: np.ndarray) -> None:
+    """단건/strict 경로: inf/NaN feature는 스코어링하지 않고 422로(batch row 에러와 같은 code)."""
+    finite = np.isfinite(X).all(axis=1)
+    if not finite.all():
+        raise HTTPException(
+            status_code=422,
+            detail=_err(
+                "NON_FINITE_FEATURE",
+                "Features must be finite.",
+                details={"rows": np.flatnonzero(~finite)[:20].tolist()},
+            ),
+        )
+
+
+def _predict_binary(
+    content_type: str,
+    body: bytes,
+    shape: str | None,
+    dtype: str | None,
+    *,
+    strict: bool,
+    name: str = DEFAULT_MODEL_NAME,
+) -> Response:
+    """바이너리 body(.npy / raw float) → 같은 포맷의 p_win(float64, shape=(rows,)).
+
+    strict=False(batch)면 non-finite row는 p_win=NaN으로 두고 나머지를 스코어링한다.
+    """
+    model = _require_model(name)
+
+    with _timed("validation"):
+        try:
+            if content_type == NPY_CONTENT_TYPE:
+                X = decode_npy(body)
+            else:
+                X = decode_raw(body, shape=shape, dtype=dtype)
+        except PayloadError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=_err(
+                    "INVALID_PAYLOAD",
+                    str(e),
+                    hint=(
+                        "Send a float32/float64 .npy array, or raw little-endian floats "
+                        "with X-Shape (and optional X-Dtype) headers."
+                    ),
+                ),
+            )
+
+        n = int(X.shape[0])
+        if not 1 <= n <= _MAX_BATCH_ROWS:
+            raise HTTPException(
+                status_code=400 if n == 0 else 413,
+                detail=_err(
+                    "INVALID_ROW_COUNT",
+                    f"Row count must be between 1 and {_MAX_BATCH_ROWS}.",
+                    details={"rows": n},
+                ),
+            )
+        _check_feature_size(model, int(X.shape[1]))
+
+        if strict:
+            _check_finite(X)
+        finite = np.isfinite(X).all(axis=1)
+        all_finite = bool(finite.all())
+
+    with _timed("inference"):
+        if all_finite:
+            p_win = np.asarray(model.predict_proba(X))[:, 1]
+        else:
+            p_win = np.full(n, np.nan)
+            if finite.any():
+                p_win[finite] = np.asarray(model.predict_proba(X[finite]))[:, 1]
+    _log_predictions(name, model, X, p_win)
+
+    headers = {"X-Shape": str(n), "X-N-Ok": str(int(finite.sum()))}
+    if content_type == NPY_CONTENT_TYPE:
+        return Response(encode_npy(p_win), media_type=NPY_CONTENT_TYPE, headers=headers)
+    return Response(encode_raw(p_win), media_type=RAW_CONTENT_TYPE, headers=headers)
+
+
+def _model_identity(name: str, model: Any) -> tuple[str, str | None, str | None, int | None] | None:
+    """(name, run_id, path, mtime_ns). model이 현재 캐시된 모델이 아니면 None.
+
+    교체 직후 경합이나 LRU admission 거절(이름별 모델)이면 identity를 확정할 수 없다.
+    """
+    with _MODEL_LOCK:
+        entry = _MODEL_CACHE if name == DEFAULT_MODEL_NAME else _named_models().peek(name)
+        if entry is None or entry.model is not model:
+            return None
+        return (name, entry.run_id, entry.path, entry.mtime_ns)
+
+
+def _response_key(name: str, model: Any, features: list[float]) -> tuple[Any, ...] | None:
+    """응답 캐시 key. 캐시가 꺼져 있거나 identity를 확정할 수 없으면 None(캐시 안 함)."""
+    if _RESPONSE_CACHE is None:
+        return None
+    identity = _model_identity(name, model)
+    return feature_key(identity, features) if identity is not None else None
+
+
+def _log_predictions(name: str, model: Any, X: Any, p_win: Any) -> None:
+    """예측 후처리: 예측 로그 적재 + 드리프트 관측(각각 켜져 있을 때만).
+
+    스코어링 실패 행(NaN)은 제외. 드리프트는 기본 모델 입력만 관측한다.
+    """
+    plog = _PRED_LOG
+    drift = _DRIFT if name == DEFAULT_MODEL_NAME else None
+    if plog is None and (drift is None or not drift.has_reference):
+        return
+    ctx = _REQUEST_CTX.get()
+    identity = _model_identity(name, model)
+    X_ok, p_ok = finite_rows(np.atleast_2d(np.asarray(X, dtype=float)), p_win)
+    if drift is not None and identity is not None:
+        drift.observe(X_ok, identity[1])
+    if plog is None:
+        return
+    plog.log(
+        PredictionRecord(
+            created_at=utc_now_iso(),
+            request_id=ctx[0] if ctx else None,
+            model_name=name,
+            run_id=identity[1] if identity is not None else None,
+            X=X_ok,
+            p_win=p_ok,
+            latency_ms=round((time.perf_counter() - ctx[1]) * 1000.0, 3) if ctx else None,
+        )
+    )
+
+
+def _predict_one(
+    req: PredictRequest, name: str = DEFAULT_MODEL_NAME
+) -> tuple[dict[str, float], Any]:
+    """(응답, 실제로 스코어링한 모델 객체)."""
+    model = _require_model(name)
+    with _timed("validation"):
+        _check_feature_size(model, len(req.features))
+        _check_finite(np.asarray([req.features], dtype=float))
+
+    cache = _RESPONSE_CACHE
+    key = _response_key(name, model, req.features)
+    hit = cache.get(key) if cache is not None and key is not None else None
+    if hit is not None:
+        proba = hit
+    else:
+        with _timed("inference"):
+            proba = float(model.predict_proba([req.features])[0][1])
+        if cache is not None and key is not None:
+            cache.put(key, proba)
+    _log_predictions(name, model, [req.features], [proba])
+    return {"p_win": proba}, model
+
+
+async def _predict_request(request: Request, name: str) -> Any:
+    ctype = media_type(request.headers.get("content-type"))
+    body = await request.body()
+    if ctype in BINARY_CONTENT_TYPES:
+        return await run_in_threadpool(
+            _predict_binary,
+            ctype,
+            body,
+            request.headers.get("x-shape"),
+            request.headers.get("x-dtype"),
+            strict=True,
+            name=name,
+        )
+
+    req = _parse_json_body(PredictRequest, body)
+    batcher = _BATCHER
+    if batcher is None or not batcher.running:
+        out, model = await run_in_threadpool(_predict_one, req, name)
+    else:
+        # micro-batching: 검증은 요청 단위로, 스코어링은 배치 단위로(모델별로 묶임)
+        model = await run_in_threadpool(_require_model, name)
+        with _timed("validation"):
+            _check_feature_size(model, len(req.features))
+            _check_finite(np.asarray([req.features], dtype=float))
+        cache = _RESPONSE_CACHE
+        key = _response_key(name, model, req.features)
+        hit = cache.get(key) if cache is not None and key is not None else None
+        if hit is not None:
+            out = {"p_win": hit}
+        else:
+            with _timed("inference"):  # 배치 대기 시간 포함(대기만 보려면 microbatch 히스토그램)
+                out = {"p_win": await batcher.submit(model, req.features)}
+            if cache is not None and key is not None:
+                cache.put(key, out["p_win"])
+        _log_predictions(name, model, [req.features], [out["p_win"]])
+
+    shadow = _SHADOW
+    if shadow is not None and name == DEFAULT_MODEL_NAME:
+        # 응답 경로에서는 샘플링 + 큐 적재만(candidate 스코어링/기록은 백그라운드 스레드).
+        # run_id는 실제로 스코어링한 모델 기준: 그 사이 교체돼 확정할 수 없으면 이 샘플은 버린다
+        identity = _model_identity(name, model)
+        if identity is not None:
+            shadow.submit(req.features, out["p_win"], identity[1])
+    return out
+
+
+@app.post("/predict", openapi_extra=_openapi_body(PredictRequest))
+async def predict(request: Request):
+    """단건 예측(JSON) 또는 바이너리 N행 예측(Content-Type: application/x-npy | octet-stream)."""
+    return await _predict_request(request, DEFAULT_MODEL_NAME)
+
+
+def _validate_rows(
+    rows: list[list[float]], expected: int, errors: list[dict[str, Any]]
+) -> tuple[np.ndarray | None, list[int]]:
+    """길이/유한성 검사를 통과한 row만 모은 행렬과 원래 index 목록. 실패 row는 errors에 추가."""
+    ok_idx: list[int] = []
+    for i, row in enumerate(rows):
+        if len(row) != expected:
+            errors.append(
+                {
+                    "index": i,
+                    **_err(
+                        "FEATURE_SIZE_MISMATCH",
+                        "Feature length mismatch.",
+                        details={"expected_n_features": expected, "got_n_features": len(row)},
+                    ),
+                }
+            )
+        else:
+            ok_idx.append(i)
+
+    if not ok_idx:
+        return None, ok_idx
+
+    X = np.asarray([rows[i] for i in ok_idx], dtype=float)
+    finite = np.isfinite(X).all(axis=1)
+    if not finite.all():
+        for j in np.flatnonzero(~finite).tolist():
+            errors.append(
+                {"index": ok_idx[j], **_err("NON_FINITE_FEATURE", "Features must be finite.")}
+            )
+        X = X[finite]
+        ok_idx = [i for i, f in zip(ok_idx, finite.tolist()) if f]
+    return X, ok_idx
+
+
+@app.post("/predict/batch", openapi_extra=_openapi_body(PredictBatchRequest))
+async def predict_batch(request: Request):
+    """N개 row를 한 번의 predict_proba 호출로 스코어링.
+
+    - JSON: 잘못된 row는 p_win=None + errors[]에 기록하고, 나머지 row는 정상 응답
+    - 바이너리: 같은 포맷으로 p_win 배열 응답(non-finite row는 NaN, 헤더 X-N-Ok)
+    """
+    ctype = media_type(request.headers.get("content-type"))
+    body = await request.body()
+    if ctype in BINARY_CONTENT_TYPES:
+        return await run_in_threadpool(
+            _predict_binary,
+            ctype,
+            body,
+            request.headers.get("x-shape"),
+            request.headers.get("x-dtype"),
+            strict=False,
+        )
+    return await run_in_threadpool(_predict_rows, _parse_json_body(PredictBatchRequest, body))
+
+
+def _predict_rows(req: PredictBatchRequest) -> dict[str, Any]:
+    # feature 개수 기대값은 요청당 한 번만 계산
+    model = _require_model()
+    expected = _infer_expected_n_features(model) or 8
+
+    n = len(req.rows)
+    p_win: list[float | None] = [None] * n
+    errors: list[dict[str, Any]] = []
+
+    with _timed("validation"):
+        X, ok_idx = _validate_rows(req.rows, expected, errors)
+
+    if ok_idx:
+        with _timed("inference"):
+            proba = np.asarray(model.predict_proba(X))[:, 1]
+        _log_predictions(DEFAULT_MODEL_NAME, model, X, proba)
+        for i, p in zip(ok_idx, proba.tolist()):
+            p_win[i] = float(p)
+
+    errors.sort(key=lambda e: e["index"])
+    return {
+        "p_win": p_win,
+        "errors": errors,
+        "count": n,
+        "n_ok": n - len(errors),
+        "expected_n_features": expected,
+    }
+
+
+def _score_lines(
+    model: Any,
+    expected: int,
+    parser: NdjsonRowParser | CsvRowParser,
+    lines: list[tuple[int, bytes]],
+) -> bytes:
+    """스트림 청크 1개: 파싱/검증 → 스코어링 → 직렬화(스레드풀에서 실행, 입력 순서 유지)."""
+    # (line_no, row_id, ok, error_code, error_message)
+    entries: list[tuple[int, Any, bool, str, str]] = []
+    valid: list[list[float]] = []
+    with _timed("validation"):
+        for line_no, line in lines:
+            try:
+                parsed = parser.parse(line)
+            except RowError as e:
+                entries.append((line_no, e.row_id, False, e.code, e.message))
+                continue
+            if parsed is None:
+                continue  # CSV header
+            row_id, feats = parsed
+            if len(feats) != expected:
+                message = f"Feature length mismatch (expected {expected}, got {len(feats)})."
+                entries.append((line_no, row_id, False, "FEATURE_SIZE_MISMATCH", message))
+            else:
+                entries.append((line_no, row_id, True, "", ""))
+                valid.append(feats)
+
+    scores: list[float] = []
+    if valid:
+        X = np.asarray(valid, dtype=float)
+        with _timed("inference"):
+            p_win = np.asarray(model.predict_proba(X))[:, 1]
+        _log_predictions(DEFAULT_MODEL_NAME, model, X, p_win)
+        scores = p_win.tolist()
+
+    it = iter(scores)
+    out = bytearray()
+    for line_no, row_id, ok, code, message in entries:
+        if ok:
+            out += parser.format_ok(row_id, next(it))
+        else:
+            out += parser.format_error(line_no, row_id, code, message)
+    return bytes(out)
+
+
+async def _stream_scores(
+    request: Request,
+    model: Any,
+    expected: int,
+    parser: NdjsonRowParser | CsvRowParser,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    header = parser.header()
+    if header:
+        yield header
+
+    # 이벤트 루프에서는 줄 자르기만 하고, 파싱 이후는 청크 단위로 스레드풀에서
+    pending: list[tuple[int, bytes]] = []
+    pending_bytes = 0
+    n_lines = 0
+
+    def _take() -> list[tuple[int, bytes]]:
+        nonlocal pending, pending_bytes
+        lines, pending, pending_bytes = pending, [], 0
+        return lines
+
+    try:
+        async for line_no, line in iter_lines(request.stream()):
+            pending.append((line_no, line))
+            pending_bytes += len(line)
+            n_lines = line_no
+            if len(pending) >= chunk_size or pending_bytes >= _STREAM_CHUNK_BYTES:
+                yield await run_in_threadpool(_score_lines, model, expected, parser, _take())
+    except StreamError as e:
+        if pending:
+            yield await run_in_threadpool(_score_lines, model, expected, parser, _take())
+        yield parser.format_error(0, None, "STREAM_ABORTED", str(e))
+        return
+    except ClientDisconnect:
+        # 응답을 받을 곳이 없으므로 남은 줄은 스코어링하지 않고 종료
+        _LOG.info("predict/stream: client disconnected after line %d", n_lines)
+        return
+
+    if pending:
+        yield await run_in_threadpool(_score_lines, model, expected, parser, _take())
+
+
+@app.post("/predict/stream")
+async def predict_stream(
+    request: Request,
+    chunk_size: int = Query(1000, ge=1, le=_MAX_BATCH_ROWS),
+) -> DuplexStreamingResponse:
+    """NDJSON/CSV row 스트림을 고정 크기 청크로 스코어링하며 결과를 바로 흘려보낸다.
+
+    - 모델은 요청 시작 시 한 번 고정(스트림 도중 승격되어도 같은 모델로 끝까지 처리)
+    - row 단위 에러(INVALID_ROW/FEATURE_SIZE_MISMATCH/NON_FINITE_FEATURE)는 해당 위치에 기록
+    - chunk_size줄(또는 _STREAM_CHUNK_BYTES)마다 파싱+스코어링을 스레드풀에서 수행
+    - 성공 row는 /predict/batch처럼 예측 로그/드리프트 관측 대상
+    """
+    parser = make_row_parser(media_type(request.headers.get("content-type")))
+    model = await run_in_threadpool(_require_model)
+    expected = _infer_expected_n_features(model) or 8
+
+    return DuplexStreamingResponse(
+        _stream_scores(request, model, expected, parser, chunk_size),
+        media_type=parser.content_type,
+    )
+
+
+@app.post("/predict/{name}", openapi_extra=_openapi_body(PredictRequest))
+async def predict_named(name: str, request: Request):
+    """이름별 current 모델로 예측(/predict와 같은 요청/응답 계약).
+
+    models 테이블의 name으로 라우팅한다. `batch`/`stream`은 위 엔드포인트가 먼저 매칭된다.
+    """
+    return await _predict_request(request, name)
@@ -14,6 +14,7 @@ import streamlit as st
 from balanceops.common.config import get_settings
 from balanceops.common.version import get_build_info
 from balanceops.registry.current import get_current_model_info
+from balanceops.tracking.history import get_metric_series, list_metric_history_keys
 from balanceops.tracking.init_db import init_db
 from balanceops.tracking.read import get_latest_run_id, get_run_detail, list_runs_summary
 
@@ -607,6 +608,47 @@ with tab_metrics:
         m_rows = [{"metric": k, "value": float(v)} for k, v in sorted(metrics.items())]
         st.dataframe(pd.DataFrame(m_rows), width="stretch", hide_index=True)
 
+    # step 단위 시계열(learning curve): 점이 많아도 max_points개로 줄여서 읽는다
+    history_keys = list_metric_history_keys(s.db_path, str(detail["run_id"]))
+    if history_keys:
+        st.caption("History (step)")
+        history_counts = {h["key"]: h["points"] for h in history_keys}
+        h1, h2, h3 = st.columns([3, 1.5, 1.5])
+        with h1:
+            picked_history = st.multiselect(
+                "Series",
+                options=list(history_counts),
+                default=[history_keys[0]["key"]],
+                format_func=lambda k: f"{k} ({history_counts[k]:,})",
+            )
+        with h2:
+            history_points = st.selectbox("Max points", options=[500, 1000, 2000, 5000], index=1)
+        with h3:
+            history_method = st.selectbox(
+                "Downsampling",
+                options=["minmax", "lttb"],
+                help="minmax: 구간별 최솟값/최댓값(스파이크 보존), lttb: 모양 보존",
+            )
+
+        frames = []
+        for k in picked_history:
+            series = get_metric_series(
+                s.db_path,
+                str(detail["run_id"]),
+                k,
+                max_points=int(history_points),
+                method=history_method,
+            )
+            if series is None:
+                continue
+            frames.append(pd.Series(series["value"], index=series["step"], name=k))
+            if series["downsampled"]:
+                st.caption(f"- {k}: {series['count']:,} / {series['total']:,} points")
+        if frames:
+            history_df = pd.concat(frames, axis=1).sort_index()
+            history_df.index.name = "step"
+            st.line_chart(history_df, width="stretch")
+
 with tab_artifacts:
     artifacts = detail.get("artifacts") or []
     if not artifacts:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
 
 try:
     from dotenv import load_dotenv  # type: ignore
@@ -10,6 +11,34 @@ except Exception:  # pragma: no cover
     load_dotenv = None
 
 
+def env_bool(name: str, default: bool) -> bool:
+    v = os.getenv(name)
+    if v is None or not v.strip():
+        return default
+    s = v.strip().lower()
+    if s in {"1", "true", "t", "yes", "y", "on"}:
+        return True
+    if s in {"0", "false", "f", "no", "n", "off"}:
+        return False
+    return default
+
+
+def env_int(name: str, default: int) -> int:
+    v = os.getenv(name)
+    try:
+        return int(v) if v is not None and v.strip() else default
+    except ValueError:
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    v = os.getenv(name)
+    try:
+        return float(v) if v is not None and v.strip() else default
+    except ValueError:
+        return default
+
+
 @dataclass(frozen=True)
 class Settings:
     db_path: str
@@ -18,11 +47,28 @@ class Settings:
     api_base_url: str
 
 
-def get_settings() -> Settings:
+_ENV_KEYS = (
+    "BALANCEOPS_DB",
+    "BALANCEOPS_ARTIFACTS",
+    "BALANCEOPS_CURRENT_MODEL",
+    "BALANCEOPS_API_URL",
+)
+
+_SETTINGS_LOCK = Lock()
+_SETTINGS: Settings | None = None
+_SETTINGS_KEY: tuple[str | None, ...] | None = None
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once(*, force: bool = False) -> None:
     # 로컬 개발에서는 .env가 있으면 읽고, 배포에서는 환경변수만으로 동작
-    if load_dotenv is not None:
+    global _DOTENV_LOADED
+    if load_dotenv is not None and (force or not _DOTENV_LOADED):
         load_dotenv(override=False)
+    _DOTENV_LOADED = True
+
 
+def _build_settings() -> Settings:
     db_path = os.getenv("BALANCEOPS_DB", "data/balanceops.db")
     artifacts_dir = os.getenv("BALANCEOPS_ARTIFACTS", "artifacts")
     current_model_path = os.getenv(
@@ -31,9 +77,6 @@ def get_settings() -> Settings:
     )
 
     api_base_url = os.getenv("BALANCEOPS_API_URL", "http://127.0.0.1:8000").rstrip("/")
-    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(artifacts_dir).mkdir(parents=True, exist_ok=True)
-    Path(current_model_path).parent.mkdir(parents=True, exist_ok=True)
 
     return Settings(
         db_path=db_path,
@@ -41,3 +84,52 @@ def get_settings() -> Settings:
         current_model_path=current_model_path,
         api_base_url=api_base_url,
     )
+
+
+def ensure_dirs(s: Settings) -> None:
+    """settings가 가리키는 디렉터리 생성(설정이 새로 만들어질 때 1회)."""
+    Path(s.db_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(s.artifacts_dir).mkdir(parents=True, exist_ok=True)
+    Path(s.current_model_path).parent.mkdir(parents=True, exist_ok=True)
+
+
+def get_settings() -> Settings:
+    """프로세스 단위로 캐시된 Settings.
+
+    - .env 로드/디렉터리 생성은 설정이 처음 만들어질 때만 수행
+    - 호출마다 BALANCEOPS_* 환경변수 4개만 비교해서, 값이 바뀐 경우에만 다시 만든다
+      (테스트/CLI에서 os.environ을 바꾸는 기존 사용 방식 유지)
+    """
+    global _SETTINGS, _SETTINGS_KEY
+
+    if not _DOTENV_LOADED:
+        _load_dotenv_once()
+
+    env = os.environ
+    key = tuple(env.get(k) for k in _ENV_KEYS)
+    cached = _SETTINGS
+    if cached is not None and key == _SETTINGS_KEY:
+        return cached
+
+    with _SETTINGS_LOCK:
+        if _SETTINGS is None or key != _SETTINGS_KEY:
+            built = _build_settings()
+            ensure_dirs(built)
+            _SETTINGS, _SETTINGS_KEY = built, key
+        return _SETTINGS
+
+
+def reload_settings() -> Settings:
+    """.env를 다시 읽고 캐시를 버린 뒤 Settings를 새로 만든다."""
+    global _SETTINGS, _SETTINGS_KEY
+    with _SETTINGS_LOCK:
+        _load_dotenv_once(force=True)
+        _SETTINGS, _SETTINGS_KEY = None, None
+    return get_settings()
+
+
+def clear_settings_cache() -> None:
+    """테스트 훅: 다음 get_settings() 호출에서 Settings를 새로 만들게 한다."""
+    global _SETTINGS, _SETTINGS_KEY
+    with _SETTINGS_LOCK:
+        _SETTINGS, _SETTINGS_KEY = None, None
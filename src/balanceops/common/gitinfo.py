@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
+import os
 import subprocess
 from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
 
 
 @dataclass(frozen=True)
@@ -11,11 +15,15 @@ class GitInfo:
     dirty: bool
 
 
+_LOCK = Lock()
+_CACHED: GitInfo | None = None
+
+
 def _run(cmd: list[str]) -> str:
     return subprocess.check_output(cmd, text=True).strip()
 
 
-def get_git_info() -> GitInfo:
+def _from_git() -> GitInfo:
     try:
         commit = _run(["git", "rev-parse", "HEAD"])
         branch = _run(["git", "rev-parse", "--abbrev-ref", "HEAD"])
@@ -23,3 +31,40 @@ def get_git_info() -> GitInfo:
         return GitInfo(commit=commit, branch=branch, dirty=dirty)
     except Exception:
         return GitInfo(commit=None, branch=None, dirty=False)
+
+
+def _from_build_info_file() -> GitInfo | None:
+    """빌드 시점에 구워둔 build info 파일(BALANCEOPS_BUILD_INFO)이 있으면 사용."""
+    path = os.getenv("BALANCEOPS_BUILD_INFO")
+    if not path:
+        return None
+    p = Path(path)
+    if not p.exists():
+        return None
+    try:
+        obj = json.loads(p.read_text(encoding="utf-8"))
+        git = obj.get("git") or {}
+        return GitInfo(
+            commit=git.get("commit"),
+            branch=git.get("branch"),
+            dirty=bool(git.get("dirty")),
+        )
+    except Exception:
+        return None
+
+
+def get_git_info(*, refresh: bool = False) -> GitInfo:
+    """git 정보(프로세스 단위 캐시).
+
+    - git subprocess(3회)는 프로세스당 한 번만 실행
+    - BALANCEOPS_BUILD_INFO 파일이 있으면 git 없이 파일 값을 사용
+    """
+    global _CACHED
+    cached = _CACHED
+    if cached is not None and not refresh:
+        return cached
+
+    with _LOCK:
+        if _CACHED is None or refresh:
+            _CACHED = _from_build_info_file() or _from_git()
+        return _CACHED
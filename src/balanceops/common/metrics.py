@@ -0,0 +1,252 @@
+"""In-process 메트릭(Counter/Gauge/Histogram) + Prometheus text 렌더링(serving/tracking 공용).
+
+- 외부 의존성(prometheus_client) 없이 /metrics 를 제공하기 위한 최소 구현
+- 모든 연산은 Lock 1회 + dict 조회 수준이라 요청 경로에서 상시 사용 가능
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from threading import Lock
+from typing import Iterable
+
+LabelValues = tuple[str, ...]
+
+# 지연시간(초) 기본 버킷: 50us ~ 10s
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _fmt_value(v: float) -> str:
+    if math.isinf(v):
+        return "+Inf" if v > 0 else "-Inf"
+    if float(v).is_integer():
+        return str(int(v))
+    return repr(float(v))
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._lock = Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: labels must be {self.labelnames}, got {sorted(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:  # pragma: no cover - 하위 클래스에서 구현
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        for key, v in items:
+            lines.append(f"{self.name}{_fmt_labels(self.labelnames, key)} {_fmt_value(v)}")
+        return lines
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def clear(self) -> None:
+        """모든 label 값을 제거(예: run_id처럼 "현재 값 1개"만 노출하는 info 형 gauge)."""
+        with self._lock:
+            self._values.clear()
+
+    def get(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        for key, v in items:
+            lines.append(f"{self.name}{_fmt_labels(self.labelnames, key)} {_fmt_value(v)}")
+        return lines
+
+
+class _HistogramState:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, n_buckets: int) -> None:
+        self.counts = [0] * n_buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        b = sorted(float(x) for x in buckets)
+        if not b:
+            raise ValueError("buckets must not be empty")
+        self.buckets: tuple[float, ...] = tuple(b)
+        self._states: dict[LabelValues, _HistogramState] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        # le(<=) 의미: value와 같은 경계 버킷에 포함
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            st = self._states.get(key)
+            if st is None:
+                st = self._states[key] = _HistogramState(len(self.buckets) + 1)
+            st.counts[i] += 1
+            st.sum += value
+            st.count += 1
+
+    def snapshot(self, **labels: str) -> dict[str, object]:
+        """테스트/디버깅용: 누적(cumulative) 버킷 카운트 + sum/count."""
+        with self._lock:
+            st = self._states.get(self._key(labels))
+            counts = list(st.counts) if st else [0] * (len(self.buckets) + 1)
+            total, count = (st.sum, st.count) if st else (0.0, 0)
+        cum: list[int] = []
+        acc = 0
+        for c in counts:
+            acc += c
+            cum.append(acc)
+        return {"buckets": dict(zip([*self.buckets, math.inf], cum)), "sum": total, "count": count}
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(k, list(st.counts), st.sum, st.count) for k, st in self._states.items()]
+        items.sort(key=lambda t: t[0])
+        lines = self._header()
+        names = (*self.labelnames, "le")
+        for key, counts, total, count in items:
+            acc = 0
+            for le, c in zip([*self.buckets, math.inf], counts):
+                acc += c
+                lbl = _fmt_labels(names, (*key, _fmt_value(le)))
+                lines.append(f"{self.name}_bucket{lbl} {acc}")
+            lbl = _fmt_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{lbl} {_fmt_value(total)}")
+            lines.append(f"{self.name}_count{lbl} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """이름 → 메트릭 보관소. 같은 이름을 다시 등록하면 기존 인스턴스를 돌려준다."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls: type[_Metric], name: str, *args, **kwargs) -> _Metric:
+        with self._lock:
+            m = self._metrics.get(name)
+            if m is None:
+                m = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(m, cls):
+                raise ValueError(f"metric {name} already registered as {m.kind}")
+            return m
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)  # type: ignore[return-value]
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(  # type: ignore[return-value]
+            Histogram, name, help, labelnames, buckets=buckets
+        )
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[k] for k in sorted(self._metrics)]
+        lines: list[str] = []
+        for m in metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import argparse
+import json
 import platform
 import sys
+from datetime import datetime, timezone
 from importlib import metadata
+from pathlib import Path
+from threading import Lock
 
-from balanceops.common.gitinfo import get_git_info
+from balanceops.common.gitinfo import GitInfo, get_git_info
+
+_LOCK = Lock()
+_BUILD_INFO: dict[str, object] | None = None
 
 
 def _safe_pkg_version(name: str) -> str | None:
@@ -14,12 +22,7 @@ def _safe_pkg_version(name: str) -> str | None:
         return None
 
 
-def get_build_info() -> dict[str, object]:
-    """빌드/실행 식별 정보.
-
-    - 배포/서빙 환경에서 "지금 보고 있는 서버가 어떤 커밋인가"를 확인하기 위한 용도.
-    - 로컬에서는 대시보드 헤더에서 함께 보여줄 수 있다.
-    """
+def _compute_build_info() -> dict[str, object]:
     git = get_git_info()
     pkg_version = _safe_pkg_version("balanceops")
 
@@ -33,3 +36,63 @@ def get_build_info() -> dict[str, object]:
             "machine": platform.machine(),
         },
     }
+
+
+def get_build_info(*, refresh: bool = False) -> dict[str, object]:
+    """빌드/실행 식별 정보.
+
+    - 배포/서빙 환경에서 "지금 보고 있는 서버가 어떤 커밋인가"를 확인하기 위한 용도.
+    - 로컬에서는 대시보드 헤더에서 함께 보여줄 수 있다.
+    - 프로세스 단위로 한 번만 계산한다(refresh=True로 재계산).
+    """
+    global _BUILD_INFO
+    info = _BUILD_INFO
+    if info is None or refresh:
+        with _LOCK:
+            if refresh:
+                get_git_info(refresh=True)
+                _BUILD_INFO = None
+            if _BUILD_INFO is None:
+                _BUILD_INFO = _compute_build_info()
+            info = _BUILD_INFO
+    return dict(info)
+
+
+def write_build_info(path: str | Path, git: GitInfo | None = None) -> Path:
+    """빌드 시점 git 정보를 JSON 파일로 기록(런타임에 git 불필요)."""
+    g = git or get_git_info()
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(
+        json.dumps(
+            {
+                "git": {"commit": g.commit, "branch": g.branch, "dirty": g.dirty},
+                "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            },
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Write build info JSON (for BALANCEOPS_BUILD_INFO).")
+    ap.add_argument("--out", type=str, default="build_info.json")
+    ap.add_argument("--commit", type=str, default=None, help="override git commit")
+    ap.add_argument("--branch", type=str, default=None, help="override git branch")
+    ap.add_argument("--dirty", action="store_true", help="mark as dirty (with --commit)")
+    args = ap.parse_args(argv)
+
+    git = None
+    if args.commit:
+        git = GitInfo(commit=args.commit, branch=args.branch, dirty=bool(args.dirty))
+
+    p = write_build_info(args.out, git)
+    print(f"[OK] build info written: {p}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
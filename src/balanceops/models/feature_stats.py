@@ -0,0 +1,89 @@
+"""학습 데이터의 feature별 요약 통계(드리프트 기준값).
+
+- count / mean / var(모분산) / min / max
+- quantile sketch: 학습 데이터의 분위수(기본 10분위)를 bin 경계로 쓰는 고정 histogram.
+  bin i = 경계값 <= x 인 경계의 개수(searchsorted side="right"). 학습 분포에서는 각 bin이
+  대략 같은 비율을 가지므로 PSI/KS 근사를 bin 비율 비교만으로 계산할 수 있다.
+- to_dict()는 JSON 직렬화 가능한 값만 담는다(joblib 래퍼 / manifest에 그대로 저장).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+FEATURE_STATS_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FeatureStats:
+    names: list[str]
+    count: int
+    mean: np.ndarray  # (d,)
+    var: np.ndarray  # (d,)
+    min: np.ndarray  # (d,)
+    max: np.ndarray  # (d,)
+    edges: list[np.ndarray]  # feature별 bin 경계(중복 제거, 오름차순)
+    bin_probs: list[np.ndarray]  # feature별 bin 비율(len(edges[j]) + 1)
+
+    @property
+    def n_features(self) -> int:
+        return int(self.mean.shape[0])
+
+    @classmethod
+    def from_data(cls, X: Any, *, names: list[str] | None = None, n_bins: int = 10) -> FeatureStats:
+        x = np.asarray(X, dtype=float)
+        if x.ndim != 2 or x.shape[0] == 0:
+            raise ValueError(f"X must be a non-empty 2D array, got shape={x.shape}")
+        d = x.shape[1]
+
+        qs = np.linspace(0.0, 1.0, max(2, int(n_bins)) + 1)[1:-1]
+        edges: list[np.ndarray] = []
+        probs: list[np.ndarray] = []
+        for j in range(d):
+            col = x[:, j]
+            e = np.unique(np.quantile(col, qs))
+            counts = np.bincount(np.searchsorted(e, col, side="right"), minlength=e.size + 1)
+            edges.append(e)
+            probs.append(counts / col.size)
+
+        return cls(
+            names=list(names) if names is not None else [f"f{j}" for j in range(d)],
+            count=int(x.shape[0]),
+            mean=x.mean(axis=0),
+            var=x.var(axis=0),
+            min=x.min(axis=0),
+            max=x.max(axis=0),
+            edges=edges,
+            bin_probs=probs,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": FEATURE_STATS_VERSION,
+            "names": list(self.names),
+            "count": self.count,
+            "mean": self.mean.tolist(),
+            "var": self.var.tolist(),
+            "min": self.min.tolist(),
+            "max": self.max.tolist(),
+            "edges": [e.tolist() for e in self.edges],
+            "bin_probs": [p.tolist() for p in self.bin_probs],
+        }
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any]) -> FeatureStats:
+        if int(obj.get("version", 0)) != FEATURE_STATS_VERSION:
+            raise ValueError(f"unsupported feature_stats version: {obj.get('version')!r}")
+        return cls(
+            names=[str(n) for n in obj["names"]],
+            count=int(obj["count"]),
+            mean=np.asarray(obj["mean"], dtype=float),
+            var=np.asarray(obj["var"], dtype=float),
+            min=np.asarray(obj["min"], dtype=float),
+            max=np.asarray(obj["max"], dtype=float),
+            edges=[np.asarray(e, dtype=float) for e in obj["edges"]],
+            bin_probs=[np.asarray(p, dtype=float) for p in obj["bin_probs"]],
+        )
@@ -4,7 +4,7 @@ import uuid
 from pathlib import Path
 
 from balanceops.common.config import get_settings
-from balanceops.tracking.log_run import create_run, log_metric
+from balanceops.tracking.log_run import create_run, log_metrics
 from balanceops.tracking.manifest import write_run_manifest
 
 
@@ -14,8 +14,7 @@ def main() -> None:
     params = {"kind": "demo", "seed": 42}
 
     create_run(s.db_path, run_id=run_id, params=params, note="demo run for wiring check")
-    log_metric(s.db_path, run_id, "acc", 0.90)
-    log_metric(s.db_path, run_id, "bal_acc", 0.88)
+    log_metrics(s.db_path, run_id, {"acc": 0.90, "bal_acc": 0.88})
 
     manifest_path = write_run_manifest(
         run_id=run_id,
@@ -5,15 +5,15 @@ import json
 import uuid
 from pathlib import Path
 
-import joblib
 import numpy as np
 
 from balanceops.common.config import get_settings
 from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.artifacts import dump_model
 from balanceops.registry.current import get_current_model_info
 from balanceops.registry.policy import should_promote
 from balanceops.registry.promote import promote_run
-from balanceops.tracking.log_run import create_run, log_artifact, log_metric
+from balanceops.tracking.log_run import RunContext
 from balanceops.tracking.manifest import write_run_manifest
 
 
@@ -49,52 +49,54 @@ def train_dummy_run(
     rng = np.random.default_rng(seed)
     model = DummyBalanceModel(seed=seed, w=rng.normal(size=(n_features,)), b=float(rng.normal()))
 
-    # run 기록
+    # run 기록: runs/metrics/artifacts를 모아 commit (승격 전 1회 + 종료 시 1회)
     params = {"kind": "train_dummy", "seed": seed, "n_samples": n_samples, "n_features": n_features}
-    create_run(s.db_path, run_id=run_id, params=params, note="dummy model training for E2E check")
-
-    metrics = _metrics_from_synth(model, n_samples=n_samples, n_features=n_features, seed=seed)
-    for k, v in metrics.items():
-        log_metric(s.db_path, run_id, k, v)
-
-    # candidate 모델 저장
-    candidates_dir = Path(s.artifacts_dir) / "models" / "candidates"
-    candidates_dir.mkdir(parents=True, exist_ok=True)
-    candidate_path = candidates_dir / f"{run_id}_dummy.joblib"
-    joblib.dump(model, candidate_path)
-    log_artifact(s.db_path, run_id, "model_candidate", str(candidate_path))
-
-    # manifest
-    manifest_path = write_run_manifest(
-        run_id=run_id,
-        kind="train_dummy",
-        status="success",
-        artifacts_root=Path(s.artifacts_dir),
-        db_path=Path(s.db_path),
-        metrics=metrics,
-    )
-
-    promoted = False
-    decision_reason = "auto_promote disabled"
-    if auto_promote:
-        cur = get_current_model_info()
-        cur_metrics = None
-
-        # BUGFIX: get_current_model_info()는 current가 없으면 {}를 반환한다.
-        # 기존 cur.get("exists")는 항상 False -> current를 읽지 못하고
-        # 'no current model yet'로 오판 가능.
-        if cur:
-            try:
-                cur_metrics = json.loads(cur.get("metrics_json") or "{}")
-            except Exception:
-                cur_metrics = None
-
-        decision = should_promote(metrics, cur_metrics)
-        decision_reason = decision.reason
-        if decision.should_promote:
-            dst = promote_run(run_id=run_id, model_path=str(candidate_path), metrics=metrics)
-            log_artifact(s.db_path, run_id, "model_current", dst)
-            promoted = True
+    with RunContext(
+        s.db_path, run_id, params=params, note="dummy model training for E2E check"
+    ) as run:
+        metrics = _metrics_from_synth(model, n_samples=n_samples, n_features=n_features, seed=seed)
+        run.log_metrics(metrics)
+
+        # candidate 모델 저장
+        candidates_dir = Path(s.artifacts_dir) / "models" / "candidates"
+        candidates_dir.mkdir(parents=True, exist_ok=True)
+        candidate_path = candidates_dir / f"{run_id}_dummy.joblib"
+        dump_model(model, candidate_path)  # 비압축: API에서 mmap 로딩 가능
+        run.log_artifact("model_candidate", str(candidate_path))
+
+        # manifest
+        manifest_path = write_run_manifest(
+            run_id=run_id,
+            kind="train_dummy",
+            status="success",
+            artifacts_root=Path(s.artifacts_dir),
+            db_path=Path(s.db_path),
+            metrics=metrics,
+        )
+
+        promoted = False
+        decision_reason = "auto_promote disabled"
+        if auto_promote:
+            cur = get_current_model_info()
+            cur_metrics = None
+
+            # BUGFIX: get_current_model_info()는 current가 없으면 {}를 반환한다.
+            # 기존 cur.get("exists")는 항상 False -> current를 읽지 못하고
+            # 'no current model yet'로 오판 가능.
+            if cur:
+                try:
+                    cur_metrics = json.loads(cur.get("metrics_json") or "{}")
+                except Exception:
+                    cur_metrics = None
+
+            decision = should_promote(metrics, cur_metrics)
+            decision_reason = decision.reason
+            if decision.should_promote:
+                # current가 가리키는 run/metric이 먼저 보이도록 승격 전에 commit
+                run.flush()
+                dst = promote_run(run_id=run_id, model_path=str(candidate_path), metrics=metrics)
+                run.log_artifact("model_current", dst)
+                promoted = True
 
     return {
         "run_id": run_id,
@@ -6,16 +6,17 @@ import uuid
 from pathlib import Path
 from typing import Any
 
-import joblib
 import numpy as np
 
 from balanceops.common.config import get_settings
 from balanceops.datasets import DatasetSpec, load_dataset
+from balanceops.models.feature_stats import FeatureStats
+from balanceops.registry.artifacts import dump_model
 from balanceops.registry.current import get_current_model_info
 from balanceops.registry.policy import should_promote
 from balanceops.registry.promote import promote_run
 from balanceops.tracking.init_db import init_db
-from balanceops.tracking.log_run import create_run, log_artifact, log_metric
+from balanceops.tracking.log_run import RunContext
 from balanceops.tracking.manifest import write_run_manifest
 
 
@@ -125,71 +126,74 @@ def train_tabular_baseline_run(
         },
         "shape": {"n_samples": int(X.shape[0]), "n_features": int(X.shape[1])},
     }
-    create_run(s.db_path, run_id=run_id, params=params, note="tabular baseline training")
-
-    for k, v in metrics.items():
-        log_metric(s.db_path, run_id, k, v)
-
-    # 6) candidate 모델 저장
-    candidates_dir = Path(s.artifacts_dir) / "models" / "candidates"
-    candidates_dir.mkdir(parents=True, exist_ok=True)
-    candidate_path = candidates_dir / f"{run_id}_tabular_baseline.joblib"
-    joblib.dump(
-        {
-            "model": model,
-            "feature_names": bundle.feature_names,
-            "dataset_meta": bundle.meta,
-        },
-        candidate_path,
-    )
-    log_artifact(s.db_path, run_id, "model_candidate", str(candidate_path))
-
-    # 7) manifest
-    manifest_path = write_run_manifest(
-        run_id=run_id,
-        kind="train_tabular_baseline",
-        status="success",
-        artifacts_root=Path(s.artifacts_dir),
-        db_path=Path(s.db_path),
-        metrics=metrics,
-    )
-
-    # 8) dataset meta artifact (run dir)
-    run_dir = manifest_path.parent
-    dataset_meta_path = run_dir / "dataset.json"
-    dataset_meta_path.write_text(
-        json.dumps(
+    # run/metrics/artifacts는 모아서 commit (승격 전 1회 + 종료 시 1회)
+    with RunContext(s.db_path, run_id, params=params, note="tabular baseline training") as run:
+        run.log_metrics(metrics)
+
+        # 6) candidate 모델 저장
+        candidates_dir = Path(s.artifacts_dir) / "models" / "candidates"
+        candidates_dir.mkdir(parents=True, exist_ok=True)
+        candidate_path = candidates_dir / f"{run_id}_tabular_baseline.joblib"
+        dump_model(
             {
-                "dataset_spec": dataset.to_dict(),
+                "model": model,
                 "feature_names": bundle.feature_names,
-                "meta": bundle.meta,
-                "shape": {"n_samples": int(X.shape[0]), "n_features": int(X.shape[1])},
+                "dataset_meta": bundle.meta,
+                # 서빙 드리프트 모니터의 기준 분포(학습 split 기준)
+                "feature_stats": FeatureStats.from_data(X_tr, names=bundle.feature_names).to_dict(),
             },
-            ensure_ascii=False,
-            indent=2,
-        ),
-        encoding="utf-8",
-    )
-    log_artifact(s.db_path, run_id, "dataset_meta", str(dataset_meta_path))
-
-    # 9) auto-promote
-    promoted = False
-    decision_reason = "auto_promote disabled"
-    if auto_promote:
-        cur = get_current_model_info()
-        cur_metrics = None
-        if cur:
-            try:
-                cur_metrics = json.loads(cur.get("metrics_json") or "{}")
-            except Exception:
-                cur_metrics = None
-
-        decision = should_promote(metrics, cur_metrics)
-        decision_reason = decision.reason
-        if decision.should_promote:
-            dst = promote_run(run_id=run_id, model_path=str(candidate_path), metrics=metrics)
-            log_artifact(s.db_path, run_id, "model_current", dst)
-            promoted = True
+            candidate_path,
+        )
+        run.log_artifact("model_candidate", str(candidate_path))
+
+        # 7) manifest
+        manifest_path = write_run_manifest(
+            run_id=run_id,
+            kind="train_tabular_baseline",
+            status="success",
+            artifacts_root=Path(s.artifacts_dir),
+            db_path=Path(s.db_path),
+            metrics=metrics,
+        )
+
+        # 8) dataset meta artifact (run dir)
+        run_dir = manifest_path.parent
+        dataset_meta_path = run_dir / "dataset.json"
+        dataset_meta_path.write_text(
+            json.dumps(
+                {
+                    "dataset_spec": dataset.to_dict(),
+                    "feature_names": bundle.feature_names,
+                    "meta": bundle.meta,
+                    "shape": {"n_samples": int(X.shape[0]), "n_features": int(X.shape[1])},
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        run.log_artifact("dataset_meta", str(dataset_meta_path))
+
+        # 9) auto-promote
+        promoted = False
+        decision_reason = "auto_promote disabled"
+        if auto_promote:
+            cur = get_current_model_info()
+            cur_metrics = None
+            if cur:
+                try:
+                    cur_metrics = json.loads(cur.get("metrics_json") or "{}")
+                except Exception:
+                    cur_metrics = None
+
+            decision = should_promote(metrics, cur_metrics)
+            decision_reason = decision.reason
+            if decision.should_promote:
+                # current가 가리키는 run/metric이 먼저 보이도록 승격 전에 commit
+                run.flush()
+                dst = promote_run(run_id=run_id, model_path=str(candidate_path), metrics=metrics)
+                run.log_artifact("model_current", dst)
+                promoted = True
 
     return {
         "run_id": run_id,
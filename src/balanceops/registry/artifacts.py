@@ -0,0 +1,61 @@
+"""모델 아티팩트 저장/로딩/복사.
+
+- 저장은 비압축 joblib(단일 파일)이다. numpy 배열이 파일 안에 정렬된 raw 바이트로 들어가므로
+  ``joblib.load(path, mmap_mode="r")``로 읽으면 계수/트리 배열이 파일의 memmap이 된다.
+  여러 uvicorn worker가 같은 파일을 mmap하면 배열 메모리는 page cache 1벌을 공유한다.
+- 저장/승격 복사는 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 교체한다.
+  mmap 중인 파일을 제자리에서 덮어쓰면 실행 중인 worker가 잘린/섞인 페이지를 읽게 되므로,
+  교체는 항상 새 inode로 한다(기존 매핑은 예전 파일을 계속 본다).
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import joblib
+
+
+def _tmp_path_for(dst: Path) -> Path:
+    fd, tmp = tempfile.mkstemp(prefix=f".{dst.name}.", suffix=".tmp", dir=dst.parent)
+    os.close(fd)
+    return Path(tmp)
+
+
+def dump_model(obj: Any, path: str | Path) -> Path:
+    """mmap 로딩 가능한 레이아웃(비압축)으로 원자적으로 저장."""
+    dst = Path(path)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_path_for(dst)
+    try:
+        joblib.dump(obj, tmp, compress=0)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return dst
+
+
+def copy_atomic(src: str | Path, dst: str | Path) -> Path:
+    """src를 dst로 복사(메타데이터 포함). dst는 항상 완성된 파일로만 보인다."""
+    out = Path(dst)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_path_for(out)
+    try:
+        shutil.copy2(src, tmp)
+        os.replace(tmp, out)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return out
+
+
+def load_model(path: str | Path, *, mmap: bool = False) -> Any:
+    """joblib 아티팩트 로딩. mmap=True면 numpy 배열을 읽기 전용 memmap으로 연다.
+
+    압축된(예전) 아티팩트는 joblib이 mmap_mode를 무시하고 일반 로딩한다.
+    """
+    return joblib.load(path, mmap_mode="r" if mmap else None)
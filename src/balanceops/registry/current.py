@@ -1,41 +1,62 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
-import joblib
+from balanceops.common.config import Settings, get_settings
+from balanceops.registry.artifacts import load_model
+from balanceops.tracking.db import pooled_connection
 
-from balanceops.common.config import get_settings
-from balanceops.tracking.db import connect
+DEFAULT_MODEL_NAME = "balance_model"
 
+# 파일명/URL 경로에 그대로 쓰이므로 안전한 문자만 허용
+_MODEL_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
 
-def get_current_model_info(name: str = "balance_model") -> dict:
+
+def is_valid_model_name(name: str) -> bool:
+    return bool(_MODEL_NAME_RE.match(name)) and ".." not in name
+
+
+def current_model_path_for(name: str, settings: Settings | None = None) -> Path:
+    """모델 이름별 current 아티팩트 경로.
+
+    - 기본 모델(balance_model): settings.current_model_path (기존 경로 유지)
+    - 그 외: 같은 폴더의 `<stem>.<name><suffix>` (예: current.seg_a.joblib)
+    """
+    s = settings or get_settings()
+    base = Path(s.current_model_path)
+    if name == DEFAULT_MODEL_NAME:
+        return base
+    if not is_valid_model_name(name):
+        raise ValueError(f"invalid model name: {name!r}")
+    return base.with_name(f"{base.stem}.{name}{base.suffix}")
+
+
+def get_current_model_info(name: str = DEFAULT_MODEL_NAME) -> dict:
     s = get_settings()
-    con = connect(s.db_path)
 
     sql = (
         "SELECT name, stage, run_id, path, created_at, metrics_json "
         "FROM models WHERE name=? AND stage='current'"
     )
 
-    try:
+    with pooled_connection(s.db_path) as con:
         row = con.execute(sql, (name,)).fetchone()
-        if row is None:
-            return {}
-
-        return {
-            "name": row["name"],
-            "stage": row["stage"],
-            "run_id": row["run_id"],
-            "path": row["path"],
-            "created_at": row["created_at"],
-            "metrics_json": row["metrics_json"],
-        }
-    finally:
-        con.close()
-
-
-def load_current_model(name: str = "balance_model"):
-    """DB current row의 path를 우선 사용하고, 실패하면 settings.current_model_path로 fallback."""
+    if row is None:
+        return {}
+
+    return {
+        "name": row["name"],
+        "stage": row["stage"],
+        "run_id": row["run_id"],
+        "path": row["path"],
+        "created_at": row["created_at"],
+        "metrics_json": row["metrics_json"],
+    }
+
+
+def load_current_model(name: str = DEFAULT_MODEL_NAME):
+    """DB current row의 path를 우선 사용하고, 실패하면 이름별 current 경로로 fallback."""
     s = get_settings()
     info = get_current_model_info(name=name)
     if not info:
@@ -51,11 +72,11 @@ def load_current_model(name: str = "balance_model"):
     candidates.append(p)
 
     # DB에 상대경로가 저장되거나, CWD가 달라서 못 찾는 경우를 대비
-    candidates.append(Path(s.current_model_path))
+    candidates.append(current_model_path_for(name, s))
 
     for cp in candidates:
         if cp.exists():
-            raw = joblib.load(cp)
+            raw = load_model(cp)
             if isinstance(raw, dict) and "model" in raw:
                 return raw["model"]
             return raw
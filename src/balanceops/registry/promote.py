@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
-import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
 from balanceops.common.config import get_settings
-from balanceops.tracking.db import connect
+from balanceops.registry.artifacts import copy_atomic
+from balanceops.registry.current import DEFAULT_MODEL_NAME, current_model_path_for
+from balanceops.tracking.db import pooled_connection
 
 
 def utc_now_iso() -> str:
@@ -14,7 +15,7 @@ def utc_now_iso() -> str:
 
 
 def promote_run(
-    run_id: str, model_path: str, metrics: dict | None = None, name: str = "balance_model"
+    run_id: str, model_path: str, metrics: dict | None = None, name: str = DEFAULT_MODEL_NAME
 ) -> str:
     s = get_settings()
 
@@ -22,23 +23,23 @@ def promote_run(
     if not src.exists():
         raise FileNotFoundError(f"model_path not found: {src}")
 
-    dst = Path(s.current_model_path)
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
-
-    con = connect(s.db_path)
-    con.execute(
-        """
-        INSERT INTO models(name, stage, run_id, path, created_at, metrics_json)
-        VALUES (?, 'current', ?, ?, ?, ?)
-        ON CONFLICT(name, stage) DO UPDATE SET
-          run_id=excluded.run_id,
-          path=excluded.path,
-          created_at=excluded.created_at,
-          metrics_json=excluded.metrics_json
-        """,
-        (name, run_id, str(dst), utc_now_iso(), json.dumps(metrics or {}, ensure_ascii=False)),
-    )
-    con.commit()
-    con.close()
+    # 이름별로 current 파일을 분리(여러 세그먼트 모델이 서로 덮어쓰지 않도록)
+    # 제자리 덮어쓰기 대신 임시 파일 + os.replace
+    # (서빙 중인 worker의 mmap/로딩이 반쯤 쓴 파일을 보지 않도록)
+    dst = copy_atomic(src, current_model_path_for(name, s))
+
+    with pooled_connection(s.db_path) as con:
+        con.execute(
+            """
+            INSERT INTO models(name, stage, run_id, path, created_at, metrics_json)
+            VALUES (?, 'current', ?, ?, ?, ?)
+            ON CONFLICT(name, stage) DO UPDATE SET
+              run_id=excluded.run_id,
+              path=excluded.path,
+              created_at=excluded.created_at,
+              metrics_json=excluded.metrics_json
+            """,
+            (name, run_id, str(dst), utc_now_iso(), json.dumps(metrics or {}, ensure_ascii=False)),
+        )
+        con.commit()
     return str(dst)
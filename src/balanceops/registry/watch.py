@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from balanceops.tracking.db import connect
+
+
+@dataclass(frozen=True)
+class ModelPointer:
+    """current 모델의 식별 정보(메모리 보관용 스냅샷)."""
+
+    name: str
+    run_id: str | None
+    path: str
+    mtime_ns: int
+    size_bytes: int
+
+
+def resolve_model_path(path: str, artifacts_dir: str | Path) -> Path:
+    """DB에 저장된 path를 가능한 한 실제 파일 경로로 해석."""
+    p = Path(path)
+    if p.exists():
+        return p
+
+    # 상대경로인 경우 artifacts_dir 하위도 한 번 더 시도
+    if not p.is_absolute():
+        p2 = Path(artifacts_dir) / p
+        if p2.exists():
+            return p2
+
+    return p
+
+
+_UNSET = object()
+
+
+def _identity(ptr: ModelPointer | None) -> tuple[str, int, str | None] | None:
+    return None if ptr is None else (ptr.path, ptr.mtime_ns, ptr.run_id)
+
+
+class CurrentModelWatcher:
+    """models 테이블의 current 포인터 + 모델 파일 mtime을 메모리에 유지.
+
+    - DB 변경 감지는 영속 커넥션의 `PRAGMA data_version`으로 한다.
+      (다른 커넥션이 commit 했을 때만 값이 바뀌므로, 바뀐 경우에만 SELECT를 다시 실행)
+    - 파일 덮어쓰기(동일 path) 감지를 위해 poll마다 stat()을 한 번 수행한다.
+    - start(interval_s)로 백그라운드 폴링을 켜면 current()는 메모리 조회만 한다.
+      꺼져 있으면 current() 호출 시점에 poll()을 동기로 실행한다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        artifacts_dir: str,
+        fallback_path: str,
+        name: str = "balance_model",
+    ) -> None:
+        self.db_path = db_path
+        self.artifacts_dir = artifacts_dir
+        self.fallback_path = fallback_path
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._con: sqlite3.Connection | None = None
+        self._data_version: int | None = None
+        self._row: dict | None = None
+        self._pointer: ModelPointer | None = None
+
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+        self.polls = 0
+        self.last_error: str | None = None
+
+    # ----------------------------
+    # polling
+    # ----------------------------
+    def _connection(self) -> sqlite3.Connection:
+        if self._con is None:
+            self._con = connect(self.db_path, check_same_thread=False)
+        return self._con
+
+    def _read_row(self, con: sqlite3.Connection) -> dict | None:
+        row = con.execute(
+            "SELECT run_id, path FROM models WHERE name=? AND stage='current'",
+            (self.name,),
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def _locate(self, path: str) -> tuple[Path, int, int] | None:
+        p = resolve_model_path(path, self.artifacts_dir)
+        # DB의 path가 다른 OS/환경의 절대경로로 저장되어 깨진 경우,
+        # canonical 경로(settings.current_model_path)를 한 번 더 시도한다.
+        for cand in (p, Path(self.fallback_path)):
+            try:
+                st = cand.stat()
+            except FileNotFoundError:
+                continue
+            return cand, st.st_mtime_ns, st.st_size
+        return None
+
+    def poll(self) -> ModelPointer | None:
+        with self._lock:
+            con = self._connection()
+            version = int(con.execute("PRAGMA data_version").fetchone()[0])
+            if self._data_version is None or version != self._data_version:
+                self._row = self._read_row(con)
+                self._data_version = version
+
+            pointer: ModelPointer | None = None
+            row = self._row
+            if row and row.get("path"):
+                located = self._locate(str(row["path"]))
+                if located is not None:
+                    p, mtime_ns, size = located
+                    pointer = ModelPointer(
+                        name=self.name,
+                        run_id=row.get("run_id"),
+                        path=str(p),
+                        mtime_ns=mtime_ns,
+                        size_bytes=size,
+                    )
+
+            self._pointer = pointer
+            self.polls += 1
+            return pointer
+
+    def current(self) -> ModelPointer | None:
+        if self.running:
+            return self._pointer
+        return self.poll()
+
+    # ----------------------------
+    # background
+    # ----------------------------
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(
+        self,
+        interval_s: float,
+        on_change: Callable[[ModelPointer | None], None] | None,
+    ) -> None:
+        notified: object = _UNSET
+        while True:
+            try:
+                ptr = self.poll()
+                self.last_error = None
+            except Exception as e:
+                # 일시적 오류(DB lock 등)는 직전 스냅샷을 유지하고 다음 주기에 재시도
+                self.last_error = f"{type(e).__name__}: {e}"
+            else:
+                ident = _identity(ptr)
+                if on_change is not None and ident != notified:
+                    try:
+                        on_change(ptr)
+                        notified = ident
+                    except Exception as e:
+                        # 실패한 포인터는 다음 주기에 다시 알린다(재시도 간격은 on_change 쪽 책임)
+                        self.last_error = f"on_change: {type(e).__name__}: {e}"
+
+            if self._stop.wait(interval_s):
+                return
+
+    def start(
+        self,
+        interval_s: float,
+        *,
+        on_change: Callable[[ModelPointer | None], None] | None = None,
+    ) -> None:
+        """백그라운드 폴링 시작.
+
+        on_change는 포인터(run_id/path/mtime)가 바뀔 때마다(시작 직후 1회 포함)
+        폴링 스레드에서 호출된다. on_change가 예외를 내면 같은 포인터로 다음 주기에 다시 호출된다.
+        """
+        if self.running:
+            return
+        self.poll()  # 첫 스냅샷은 동기로 확보
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            args=(max(0.01, float(interval_s)), on_change),
+            name="balanceops-model-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        t, self._thread = self._thread, None
+        if t is not None:
+            t.join(timeout=5.0)
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+            self._data_version = None
@@ -0,0 +1 @@
+"""Serving helpers for the BalanceOps API (batching, metrics, model cache, ...)."""
@@ -0,0 +1,172 @@
+"""동시 단건 예측 요청을 모아 한 번의 predict_proba로 처리하는 micro-batcher.
+
+- 이벤트 루프(asyncio)에서 요청을 큐에 넣고, 최대 max_wait_ms 또는 max_batch_size까지 모은다.
+- 모인 row는 (같은 모델 객체 단위로) 2-D 배열 1개로 묶어 워커 스레드에서 스코어링한다.
+- 결과/예외는 각 요청의 Future로 되돌려준다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+
+from balanceops.serving.metrics import MetricsRegistry
+
+ScoreFn = Callable[[Any, np.ndarray], Sequence[float]]
+
+BATCH_SIZE_BUCKETS: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+def score_positive_proba(model: Any, X: np.ndarray) -> Sequence[float]:
+    """기본 스코어 함수: predict_proba의 양성(1) 클래스 확률."""
+    return np.asarray(model.predict_proba(X))[:, 1].tolist()
+
+
+@dataclass
+class _Pending:
+    model: Any
+    features: Sequence[float]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        *,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        score_fn: ScoreFn = score_positive_proba,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be >= 0")
+
+        self.max_batch_size = int(max_batch_size)
+        self.max_wait_s = float(max_wait_ms) / 1000.0
+        self._score_fn = score_fn
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._task: asyncio.Task | None = None
+
+        reg = metrics or MetricsRegistry()
+        self._h_batch_size = reg.histogram(
+            "balanceops_microbatch_size",
+            "Rows per micro-batch predict_proba call.",
+            buckets=BATCH_SIZE_BUCKETS,
+        )
+        self._h_queue_wait = reg.histogram(
+            "balanceops_microbatch_queue_wait_seconds",
+            "Time a row waited in the micro-batch queue before dispatch.",
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name="balanceops-microbatcher")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        # 남은 요청은 실패 처리(대기 중인 핸들러가 영원히 멈추지 않도록)
+        q, self._queue = self._queue, None
+        while q is not None and not q.empty():
+            item = q.get_nowait()
+            if not item.future.done():
+                item.future.set_exception(RuntimeError("micro-batcher stopped"))
+
+    async def submit(self, model: Any, features: Sequence[float]) -> float:
+        if self._queue is None or not self.running:
+            raise RuntimeError("micro-batcher is not running")
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_Pending(model=model, features=features, future=fut))
+        return await fut
+
+    async def _collect(self, batch: list[_Pending]) -> None:
+        """batch(첫 요청 포함)를 제자리에서 채운다. 취소 시에도 이미 모은 요청이 보존되도록."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_s
+
+        while len(batch) < self.max_batch_size:
+            # 이미 쌓인 요청은 대기 없이 흡수
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+
+    def _score_groups(self, batch: list[_Pending]) -> list[float | BaseException]:
+        # 배치 도중 모델이 교체될 수 있으므로, 같은 모델 객체끼리 묶어서 스코어링
+        out: list[float | BaseException] = [0.0] * len(batch)
+        groups: dict[int, list[int]] = {}
+        for i, item in enumerate(batch):
+            groups.setdefault(id(item.model), []).append(i)
+
+        for idx in groups.values():
+            model = batch[idx[0]].model
+            try:
+                X = np.asarray([batch[i].features for i in idx], dtype=float)
+                probs = self._score_fn(model, X)
+                for i, p in zip(idx, probs):
+                    out[i] = float(p)
+            except Exception as e:
+                for i in idx:
+                    out[i] = e
+        return out
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        batch: list[_Pending] = []
+        try:
+            while True:
+                first = await self._queue.get()
+                batch = [first]
+                await self._collect(batch)
+
+                now = time.perf_counter()
+                self._h_batch_size.observe(len(batch))
+                for item in batch:
+                    self._h_queue_wait.observe(now - item.enqueued_at)
+
+                results = await run_in_threadpool(self._score_groups, batch)
+
+                for item, res in zip(batch, results):
+                    if item.future.done():  # 클라이언트 취소 등
+                        continue
+                    if isinstance(res, BaseException):
+                        item.future.set_exception(res)
+                    else:
+                        item.future.set_result(res)
+                batch = []
+        except asyncio.CancelledError:
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(RuntimeError("micro-batcher stopped"))
+            raise
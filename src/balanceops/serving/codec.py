@@ -0,0 +1,103 @@
+"""predict 요청/응답용 바이너리 포맷(대량 스코어링 클라이언트용).
+
+Content-Type으로 선택한다.
+- `application/x-npy` : NumPy `.npy` 페이로드(float32/float64, 1D 또는 2D)
+- `application/octet-stream` : raw little-endian float 배열
+  - `X-Shape: <rows>,<cols>` (필수), `X-Dtype: float64|float32` (기본 float64)
+
+디코딩은 `np.frombuffer`로 요청 body 버퍼를 그대로 바라본다(zero-copy, read-only).
+응답도 같은 포맷으로 p_win(float64, shape=(rows,))을 돌려준다.
+"""
+
+from __future__ import annotations
+
+import io
+
+import numpy as np
+
+NPY_CONTENT_TYPE = "application/x-npy"
+RAW_CONTENT_TYPE = "application/octet-stream"
+BINARY_CONTENT_TYPES = (NPY_CONTENT_TYPE, RAW_CONTENT_TYPE)
+
+_RAW_DTYPES = {"float64": np.dtype("<f8"), "float32": np.dtype("<f4")}
+
+
+class PayloadError(ValueError):
+    """바이너리 body/헤더가 계약과 맞지 않음(→ 400)."""
+
+
+def media_type(content_type: str | None) -> str:
+    """`application/x-npy; charset=...` → `application/x-npy` (소문자)."""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def _as_matrix(arr: np.ndarray) -> np.ndarray:
+    if arr.ndim == 1:
+        return arr.reshape(1, -1)
+    if arr.ndim != 2:
+        raise PayloadError(f"expected a 1D or 2D array, got ndim={arr.ndim}")
+    return arr
+
+
+def _check_dtype(dtype: np.dtype) -> None:
+    if dtype.kind != "f" or dtype.itemsize not in (4, 8):
+        raise PayloadError(f"dtype must be float32 or float64, got {dtype}")
+
+
+def decode_npy(body: bytes) -> np.ndarray:
+    """`.npy` body → (rows, cols) 배열. C-order/Fortran-order 모두 복사 없이 view로 만든다."""
+    buf = io.BytesIO(body)
+    try:
+        version = np.lib.format.read_magic(buf)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(buf)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(buf)
+    except ValueError as e:
+        raise PayloadError(f"invalid npy header: {e}") from None
+
+    _check_dtype(dtype)
+    count = int(np.prod(shape)) if shape else 1
+    offset = buf.tell()
+    if len(body) - offset != count * dtype.itemsize:
+        raise PayloadError(
+            f"npy body size mismatch: header says {count} x {dtype.itemsize} bytes, "
+            f"got {len(body) - offset}"
+        )
+
+    arr = np.frombuffer(body, dtype=dtype, count=count, offset=offset)
+    arr = arr.reshape(shape, order="F" if fortran_order else "C")
+    return _as_matrix(arr)
+
+
+def decode_raw(body: bytes, *, shape: str | None, dtype: str | None) -> np.ndarray:
+    """raw little-endian body + `X-Shape`/`X-Dtype` 헤더 → (rows, cols) 배열."""
+    dt = _RAW_DTYPES.get((dtype or "float64").strip().lower())
+    if dt is None:
+        raise PayloadError(f"X-Dtype must be one of {sorted(_RAW_DTYPES)}, got {dtype!r}")
+
+    if not shape:
+        raise PayloadError("X-Shape header is required (e.g. 'X-Shape: 100,8')")
+    try:
+        dims = tuple(int(x) for x in shape.split(","))
+    except ValueError:
+        raise PayloadError(f"invalid X-Shape: {shape!r}") from None
+    if not 1 <= len(dims) <= 2 or any(d < 0 for d in dims):
+        raise PayloadError(f"invalid X-Shape: {shape!r}")
+
+    count = int(np.prod(dims))
+    if len(body) != count * dt.itemsize:
+        raise PayloadError(
+            f"body size mismatch: X-Shape={shape} x {dt.itemsize} bytes, got {len(body)}"
+        )
+    return _as_matrix(np.frombuffer(body, dtype=dt, count=count).reshape(dims))
+
+
+def encode_npy(values: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    np.lib.format.write_array(buf, np.ascontiguousarray(values, dtype="<f8"), allow_pickle=False)
+    return buf.getvalue()
+
+
+def encode_raw(values: np.ndarray) -> bytes:
+    return np.ascontiguousarray(values, dtype="<f8").tobytes()
@@ -0,0 +1,151 @@
+"""서빙용 선형 모델 "컴파일": scaler + logistic 계수를 가중치 벡터 1개 + bias로 접는다.
+
+- 대상: Pipeline(StandardScaler, LogisticRegression) / LogisticRegression(이진) / DummyBalanceModel
+- 결과(LinearScorer)는 NumPy만 사용하며 predict_proba 계약을 그대로 따른다.
+- 인식하지 못한 모델은 원본을 그대로 돌려준다(fallback).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from balanceops.models.dummy import DummyBalanceModel
+
+
+@dataclass(frozen=True)
+class LinearScorer:
+    """p = sigmoid(x @ weights + bias) (+ 선택적 clip)."""
+
+    weights: np.ndarray
+    bias: float
+    source_model: Any = field(repr=False)
+    n_features_in_: int | None = None
+    clip: tuple[float, float] | None = None
+    # DummyBalanceModel 호환: 입력 폭이 다르면 가중치를 자르거나 0으로 채움
+    flexible_width: bool = False
+
+    def _weights_for(self, n_in: int) -> np.ndarray | None:
+        w = self.weights
+        if n_in == w.size:
+            return w
+        if not self.flexible_width:
+            return None
+        if n_in < w.size:
+            return w[:n_in]
+        return np.pad(w, (0, n_in - w.size))
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        x = np.asarray(X, dtype=float)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+
+        w = self._weights_for(x.shape[1]) if x.ndim == 2 else None
+        if w is None:
+            # 모양이 맞지 않으면 원본 모델의 검증/에러 메시지를 그대로 사용
+            return self.source_model.predict_proba(X)
+
+        z = x @ w + self.bias
+        p = np.exp(-np.logaddexp(0.0, -z))  # 수치적으로 안정적인 sigmoid
+        if self.clip is not None:
+            p = np.clip(p, self.clip[0], self.clip[1])
+        return np.stack([1.0 - p, p], axis=1)
+
+
+def _shared(a: np.ndarray) -> np.ndarray:
+    # 복사하지 않는 읽기 전용 view: mmap 로딩이면 worker 간 page cache 공유를 유지하고,
+    # 일반 로딩이어도 가중치 메모리를 두 배로 쓰지 않는다(scorer는 배열을 수정하지 않음)
+    v = np.asarray(a).view()
+    v.flags.writeable = False
+    return v
+
+
+def _fold_logistic(clf: Any) -> tuple[np.ndarray, float] | None:
+    coef = getattr(clf, "coef_", None)
+    intercept = getattr(clf, "intercept_", None)
+    classes = getattr(clf, "classes_", None)
+    if coef is None or intercept is None or classes is None:
+        return None
+    coef = np.asarray(coef, dtype=float)
+    intercept = np.asarray(intercept, dtype=float).ravel()
+    if len(classes) != 2 or coef.ndim != 2 or coef.shape[0] != 1 or intercept.size != 1:
+        return None
+    return _shared(coef[0]), float(intercept[0])
+
+
+def _fold_scaler(scaler: Any, w: np.ndarray, b: float) -> tuple[np.ndarray, float] | None:
+    # ((x - mean) / scale) @ w + b  ==  x @ (w / scale) + (b - mean @ (w / scale))
+    # with_mean=False여도 mean_은 채워지므로, 실제 변환에 쓰이는 값만 접는다
+    mean = getattr(scaler, "mean_", None) if getattr(scaler, "with_mean", True) else None
+    scale = getattr(scaler, "scale_", None) if getattr(scaler, "with_std", True) else None
+    if getattr(scaler, "with_mean", True) and mean is None:
+        return None
+    if getattr(scaler, "with_std", True) and scale is None:
+        return None
+
+    w2 = w / np.asarray(scale, dtype=float) if scale is not None else w
+    b2 = b - float(np.asarray(mean, dtype=float) @ w2) if mean is not None else b
+    return w2, b2
+
+
+def _compile_sklearn(model: Any) -> LinearScorer | None:
+    try:
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import StandardScaler
+    except Exception:  # pragma: no cover - sklearn 미설치 환경
+        return None
+
+    if isinstance(model, LogisticRegression):
+        folded = _fold_logistic(model)
+        if folded is None:
+            return None
+        w, b = folded
+        return LinearScorer(weights=w, bias=b, source_model=model, n_features_in_=int(w.size))
+
+    if isinstance(model, Pipeline):
+        steps = [est for _, est in model.steps if est is not None and est != "passthrough"]
+        if len(steps) != 2:
+            return None
+        scaler, clf = steps
+        if not isinstance(scaler, StandardScaler) or not isinstance(clf, LogisticRegression):
+            return None
+        folded = _fold_logistic(clf)
+        if folded is None:
+            return None
+        folded = _fold_scaler(scaler, *folded)
+        if folded is None:
+            return None
+        w, b = folded
+        return LinearScorer(weights=w, bias=b, source_model=model, n_features_in_=int(w.size))
+
+    return None
+
+
+def compile_model(model: Any) -> Any:
+    """인식 가능한 선형 모델이면 LinearScorer, 아니면 원본 모델을 반환."""
+    if isinstance(model, LinearScorer):
+        return model
+
+    if isinstance(model, DummyBalanceModel):
+        w = np.asarray(model.w, dtype=float).ravel()
+        return LinearScorer(
+            weights=_shared(w),
+            bias=float(model.b),
+            source_model=model,
+            clip=(1e-6, 1.0 - 1e-6),
+            flexible_width=True,
+        )
+
+    try:
+        compiled = _compile_sklearn(model)
+    except Exception:
+        compiled = None
+    return compiled if compiled is not None else model
+
+
+def source_model(model: Any) -> Any:
+    """컴파일된 모델이면 원본을, 아니면 그대로 반환."""
+    return model.source_model if isinstance(model, LinearScorer) else model
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from balanceops.common.config import env_bool, env_float, env_int
+
+
+@dataclass(frozen=True)
+class ServingSettings:
+    """API 서빙 튜닝 값(환경변수 BALANCEOPS_*)."""
+
+    # /predict micro-batching(opt-in)
+    microbatch_enabled: bool
+    microbatch_max_batch_size: int
+    microbatch_max_wait_ms: float
+
+    # current 모델 포인터 백그라운드 폴링 주기(0이면 요청마다 동기 확인)
+    model_watch_interval_ms: float
+
+    # 선형 모델(scaler+logistic, dummy)을 NumPy 스코어러로 컴파일해서 서빙
+    compile_linear: bool
+
+    # /predict/{name} 이름별 모델 캐시(기본 모델은 항상 상주, 예산 밖)
+    model_cache_max_mb: float
+    model_cache_max_models: int
+
+    # shadow scoring(opt-in): /predict 일부를 candidate 모델로도 스코어링해 기록
+    shadow_enabled: bool
+    shadow_sample_rate: float
+    shadow_run_id: str | None
+    shadow_queue_size: int
+
+    # 기동(lifespan) 시 current 모델을 미리 로딩+워밍업(balanceops-serve는 기본으로 켬)
+    preload_model: bool
+    # preload가 꺼져 있으면 기동 직후 백그라운드로 current 모델 로딩 시작(/ready 대상)
+    eager_load: bool
+
+    # 모델 아티팩트를 mmap(읽기 전용)으로 로딩 → 여러 worker가 배열 메모리를 page cache로 공유
+    model_mmap: bool
+
+    # 예측 로그(off | sqlite | ndjson): 버퍼링 후 백그라운드 스레드가 배치로 기록
+    prediction_log: str
+    prediction_log_dir: str | None
+    prediction_log_capacity_rows: int
+    prediction_log_batch_rows: int
+    prediction_log_flush_ms: float
+    prediction_log_rotate_mb: float
+
+    # 조회 API(/runs, /runs/latest, /model) 조건부 GET 결과 캐시 항목 수(0이면 ETag/304만)
+    http_result_cache_max_entries: int
+
+    # feature 드리프트 모니터: 기본 모델 입력을 학습 통계(feature_stats)와 스트리밍 비교
+    drift_monitor: bool
+
+    # 예측 응답 캐시(0이면 끔): 같은 feature 벡터 + 같은 모델이면 inference 생략
+    response_cache_max_entries: int
+    response_cache_ttl_s: float
+
+
+def get_serving_settings() -> ServingSettings:
+    return ServingSettings(
+        microbatch_enabled=env_bool("BALANCEOPS_MICROBATCH", False),
+        microbatch_max_batch_size=max(1, env_int("BALANCEOPS_MICROBATCH_MAX_ROWS", 64)),
+        microbatch_max_wait_ms=max(0.0, env_float("BALANCEOPS_MICROBATCH_MAX_WAIT_MS", 2.0)),
+        model_watch_interval_ms=max(0.0, env_float("BALANCEOPS_MODEL_WATCH_INTERVAL_MS", 500.0)),
+        compile_linear=env_bool("BALANCEOPS_COMPILE_LINEAR", True),
+        model_cache_max_mb=max(0.0, env_float("BALANCEOPS_MODEL_CACHE_MAX_MB", 512.0)),
+        model_cache_max_models=max(1, env_int("BALANCEOPS_MODEL_CACHE_MAX_MODELS", 8)),
+        shadow_enabled=env_bool("BALANCEOPS_SHADOW", False),
+        shadow_sample_rate=min(1.0, max(0.0, env_float("BALANCEOPS_SHADOW_SAMPLE_RATE", 0.1))),
+        shadow_run_id=(os.getenv("BALANCEOPS_SHADOW_RUN_ID") or "").strip() or None,
+        shadow_queue_size=max(1, env_int("BALANCEOPS_SHADOW_QUEUE_SIZE", 1000)),
+        preload_model=env_bool("BALANCEOPS_PRELOAD_MODEL", False),
+        eager_load=env_bool("BALANCEOPS_EAGER_LOAD", True),
+        model_mmap=env_bool("BALANCEOPS_MODEL_MMAP", False),
+        prediction_log=(os.getenv("BALANCEOPS_PREDICTION_LOG") or "off").strip().lower(),
+        prediction_log_dir=(os.getenv("BALANCEOPS_PREDICTION_LOG_DIR") or "").strip() or None,
+        prediction_log_capacity_rows=max(
+            1, env_int("BALANCEOPS_PREDICTION_LOG_CAPACITY_ROWS", 100_000)
+        ),
+        prediction_log_batch_rows=max(1, env_int("BALANCEOPS_PREDICTION_LOG_BATCH_ROWS", 1000)),
+        prediction_log_flush_ms=max(1.0, env_float("BALANCEOPS_PREDICTION_LOG_FLUSH_MS", 1000.0)),
+        prediction_log_rotate_mb=max(0.001, env_float("BALANCEOPS_PREDICTION_LOG_ROTATE_MB", 64.0)),
+        http_result_cache_max_entries=max(
+            0, env_int("BALANCEOPS_HTTP_RESULT_CACHE_MAX_ENTRIES", 64)
+        ),
+        drift_monitor=env_bool("BALANCEOPS_DRIFT_MONITOR", True),
+        response_cache_max_entries=max(0, env_int("BALANCEOPS_RESPONSE_CACHE_MAX_ENTRIES", 0)),
+        response_cache_ttl_s=max(0.0, env_float("BALANCEOPS_RESPONSE_CACHE_TTL_S", 60.0)),
+    )
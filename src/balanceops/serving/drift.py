@@ -0,0 +1,164 @@
+"""Feature 드리프트 모니터: 서빙 입력 분포를 학습 통계(FeatureStats)와 스트리밍으로 비교.
+
+- 메모리는 O(features × bins): 요청 데이터를 보관하지 않고 누적 통계만 유지한다.
+  - mean/var: 배치 단위 Welford(Chan 병합)
+  - histogram: 학습 분위수 경계 기준 bin count(더하기만 하면 되는 mergeable sketch)
+- observe()는 요청 경로에서 호출된다. bin 계산은 lock 밖에서 벡터 연산 1회로 하고,
+  lock 안에서는 누적값 덧셈만 한다.
+- snapshot()은 feature별 PSI / KS(bin 단위 CDF 최대 차이) / 평균 이동(학습 표준편차 단위)을
+  계산하고 Prometheus gauge를 갱신한다(/drift, /metrics 호출 시).
+- 기준 통계가 없는 모델(dict 래퍼가 아니거나 feature_stats 없음)은 관측하지 않는다.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import numpy as np
+
+from balanceops.models.feature_stats import FeatureStats
+from balanceops.serving.metrics import MetricsRegistry
+
+# PSI의 log(0) 방지용 최소 비율
+_PSI_EPS = 1e-4
+
+
+class DriftMonitor:
+    def __init__(self, *, metrics: MetricsRegistry | None = None) -> None:
+        self._lock = threading.Lock()
+        self._ref: FeatureStats | None = None
+        self._run_id: str | None = None
+        self._edges: np.ndarray | None = None  # (d, k) — 짧은 feature는 +inf로 채움
+        self._n = 0
+        self._mean: np.ndarray | None = None
+        self._m2: np.ndarray | None = None
+        self._counts: np.ndarray | None = None  # (d, k + 1)
+
+        reg = metrics or MetricsRegistry()
+        self._psi_gauge = reg.gauge(
+            "balanceops_feature_drift_psi",
+            "Population stability index of served features vs training data.",
+            ["feature"],
+        )
+        self._ks_gauge = reg.gauge(
+            "balanceops_feature_drift_ks",
+            "Binned Kolmogorov-Smirnov statistic of served features vs training data.",
+            ["feature"],
+        )
+        self._rows_gauge = reg.gauge(
+            "balanceops_feature_drift_rows", "Rows observed by the drift monitor since model load."
+        )
+
+    @property
+    def run_id(self) -> str | None:
+        return self._run_id
+
+    @property
+    def has_reference(self) -> bool:
+        return self._ref is not None
+
+    def reset(self, reference: FeatureStats | None, run_id: str | None) -> None:
+        """모델 교체 시 호출. 누적 통계를 비우고 새 기준 통계로 다시 시작."""
+        edges = None
+        if reference is not None:
+            k = max((e.size for e in reference.edges), default=0)
+            edges = np.full((reference.n_features, k), np.inf)
+            for j, e in enumerate(reference.edges):
+                edges[j, : e.size] = e
+        with self._lock:
+            self._ref = reference
+            self._run_id = run_id
+            self._edges = edges
+            self._n = 0
+            if reference is None:
+                self._mean = self._m2 = self._counts = None
+            else:
+                d = reference.n_features
+                self._mean = np.zeros(d)
+                self._m2 = np.zeros(d)
+                self._counts = np.zeros((d, edges.shape[1] + 1), dtype=np.int64)
+        self._psi_gauge.clear()
+        self._ks_gauge.clear()
+        self._rows_gauge.set(0)
+
+    # ----------------------------
+    # request path
+    # ----------------------------
+    def observe(self, X: Any, run_id: str | None) -> int:
+        """예측에 쓰인 입력 행을 누적. 반영한 행 수를 반환(기준 없음/다른 모델이면 0)."""
+        ref, edges = self._ref, self._edges
+        if ref is None or edges is None or run_id != self._run_id:
+            return 0
+        x = np.asarray(X, dtype=float)
+        if x.ndim != 2 or x.shape[1] != ref.n_features:
+            return 0
+        x = x[np.isfinite(x).all(axis=1)]
+        n_b = int(x.shape[0])
+        if n_b == 0:
+            return 0
+
+        # bin = 경계값 <= x 인 경계 수(FeatureStats와 같은 searchsorted side="right" 규칙)
+        bins = (x[:, :, None] >= edges[None, :, :]).sum(axis=2)
+        k1 = edges.shape[1] + 1
+        flat = bins + np.arange(ref.n_features) * k1
+        counts_b = np.bincount(flat.ravel(), minlength=ref.n_features * k1).reshape(-1, k1)
+        mean_b = x.mean(axis=0)
+        m2_b = ((x - mean_b) ** 2).sum(axis=0)
+
+        with self._lock:
+            if self._ref is not ref or self._mean is None or self._m2 is None:
+                return 0  # 계산 중 모델이 교체됨
+            n_a = self._n
+            n = n_a + n_b
+            delta = mean_b - self._mean
+            self._mean = self._mean + delta * (n_b / n)
+            self._m2 = self._m2 + m2_b + delta**2 * (n_a * n_b / n)
+            self._counts += counts_b
+            self._n = n
+        return n_b
+
+    # ----------------------------
+    # report
+    # ----------------------------
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            ref, run_id, n = self._ref, self._run_id, self._n
+            if ref is None or self._mean is None or self._m2 is None or self._counts is None:
+                return {"run_id": run_id, "reference": False, "n": 0, "features": []}
+            mean = self._mean.copy()
+            var = self._m2 / n if n > 0 else np.zeros_like(self._m2)
+            counts = self._counts.copy()
+
+        self._rows_gauge.set(n)
+        features: list[dict[str, Any]] = []
+        for j, name in enumerate(ref.names):
+            p = ref.bin_probs[j]
+            item: dict[str, Any] = {
+                "name": name,
+                "train_mean": float(ref.mean[j]),
+                "train_std": float(np.sqrt(ref.var[j])),
+                "mean": None,
+                "std": None,
+                "mean_shift": None,
+                "psi": None,
+                "ks": None,
+            }
+            if n > 0:
+                q = counts[j, : p.size] / n
+                pe = np.clip(p, _PSI_EPS, None)
+                qe = np.clip(q, _PSI_EPS, None)
+                psi = float(np.sum((qe - pe) * np.log(qe / pe)))
+                ks = float(np.max(np.abs(np.cumsum(q) - np.cumsum(p))))
+                std_ref = float(np.sqrt(ref.var[j]))
+                item.update(
+                    mean=float(mean[j]),
+                    std=float(np.sqrt(var[j])),
+                    mean_shift=float((mean[j] - ref.mean[j]) / std_ref) if std_ref > 0 else None,
+                    psi=psi,
+                    ks=ks,
+                )
+                self._psi_gauge.set(psi, feature=name)
+                self._ks_gauge.set(ks, feature=name)
+            features.append(item)
+        return {"run_id": run_id, "reference": True, "n": n, "features": features}
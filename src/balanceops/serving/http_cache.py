@@ -0,0 +1,92 @@
+"""조회 API(/runs, /runs/latest, /model)의 조건부 GET(ETag / Last-Modified) 지원.
+
+- validator(ETag)는 테이블을 읽지 않고 계산한다: tracking_generation 카운터(runs/metrics/
+  artifacts/models 변경 시 trigger로 증가) + 포인터 파일 stat + 요청 파라미터.
+- If-None-Match가 맞으면 304(본문/조회 없음). If-None-Match가 없을 때만 If-Modified-Since를 본다.
+- ResultCache: validator → 직렬화된 JSON 본문. validator가 바뀌면 key가 달라져 자연히 무효화되고,
+  오래된 항목은 LRU로 밀려난다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from balanceops.serving.metrics import MetricsRegistry
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더(쉼표 목록, W/ 접두어, *)와 weak 비교."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        if tag.strip().removeprefix("W/") == bare:
+            return True
+    return False
+
+
+def http_date(ts: float) -> str:
+    return format_datetime(datetime.fromtimestamp(ts, tz=timezone.utc), usegmt=True)
+
+
+def not_modified_since(if_modified_since: str | None, last_modified_ts: float) -> bool:
+    """HTTP-date는 초 단위이므로 last_modified를 내림해서 비교. 잘못된 헤더는 무시."""
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return int(last_modified_ts) <= since.timestamp()
+
+
+class ResultCache:
+    """(route, ETag) → JSON 본문 bytes. 항목 수 기준 LRU."""
+
+    def __init__(self, max_entries: int = 64, *, metrics: MetricsRegistry | None = None) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self._lock = threading.Lock()
+        self._items: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+        reg = metrics or MetricsRegistry()
+        self._requests = reg.counter(
+            "balanceops_http_conditional_requests_total",
+            "Conditional GET outcomes by route (not_modified, cached, built).",
+            ["route", "result"],
+        )
+
+    def record(self, route: str, result: str) -> None:
+        self._requests.inc(route=route, result=result)
+
+    def get(self, route: str, etag: str) -> bytes | None:
+        with self._lock:
+            body = self._items.get((route, etag))
+            if body is not None:
+                self._items.move_to_end((route, etag))
+            return body
+
+    def put(self, route: str, etag: str, body: bytes) -> None:
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._items[(route, etag)] = body
+            self._items.move_to_end((route, etag))
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,23 @@
+"""serving 쪽 import 경로 유지용 re-export(구현은 balanceops.common.metrics)."""
+
+from __future__ import annotations
+
+from balanceops.common.metrics import (
+    DEFAULT_LATENCY_BUCKETS,
+    PROMETHEUS_CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    LabelValues,
+    MetricsRegistry,
+)
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "PROMETHEUS_CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "LabelValues",
+    "MetricsRegistry",
+]
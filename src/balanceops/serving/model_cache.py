@@ -0,0 +1,233 @@
+"""이름별 모델 캐시: 바이트 예산이 있는 Segmented LRU.
+
+- 크기는 아티팩트 파일 크기로 추정한다(joblib pickle 크기 ≈ 메모리 상 크기).
+- 새 항목은 probation 구간에 들어가고, 한 번 더 조회되면 protected 구간으로 승격된다.
+- 공간이 부족하면 probation 쪽 LRU부터 내보낸다. probation만으로 자리가 안 나면
+  새 항목을 캐시에 넣지 않는다(admission 거절) → 가끔 쓰이는 모델이 hot 모델을 밀어내지 않음.
+- 접근 빈도(TinyLFU식): 캐시에 있거나 최근 내보낸/거절한 key(ghost, 최대 ghost_entries개)의
+  조회 수를 센다. 조회가 age_every번 쌓일 때마다 모든 값을 절반으로 줄여 최근 빈도만 남긴다.
+  거절됐던 key가 다시 로딩되면, 자리를 내야 할 protected 항목들보다 최근 빈도가 높을 때만
+  그 항목들을 내보내고 admit한다 → 번갈아 쓰이는 cold 모델이 hot 모델을 밀어내지 못하고,
+  실제로 더 자주 쓰이게 된 모델만 캐시에 들어온다(그 전까지는 캐시 없이 서빙).
+- protected 구간이 예산의 protected_ratio를 넘으면 가장 오래된 protected를 probation으로 강등.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any
+
+from balanceops.serving.metrics import MetricsRegistry
+
+
+class ModelLRU:
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        max_entries: int,
+        protected_ratio: float = 0.8,
+        ghost_entries: int | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_entries = max(1, int(max_entries))
+        self.protected_bytes_cap = int(self.max_bytes * protected_ratio)
+        self.ghost_entries = max(1, ghost_entries or max(16, 4 * self.max_entries))
+        self.age_every = 10 * (self.max_entries + self.ghost_entries)
+
+        self._lock = Lock()
+        self._probation: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._protected: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._ghosts: OrderedDict[Hashable, None] = OrderedDict()
+        # 캐시 + ghost key의 최근 조회 수(그 외 key는 세지 않으므로 크기가 제한됨)
+        self._freq: dict[Hashable, int] = {}
+        self._accesses = 0
+        self._bytes = 0
+
+        reg = metrics or MetricsRegistry()
+        self._lookups = reg.counter(
+            "balanceops_model_cache_lookups_total", "Named model cache lookups.", ["result"]
+        )
+        self._evictions = reg.counter(
+            "balanceops_model_cache_evictions_total", "Named models evicted from the cache."
+        )
+        self._rejections = reg.counter(
+            "balanceops_model_cache_admission_rejected_total",
+            "Loaded models not cached because only protected (hot) entries could be evicted.",
+        )
+        self._readmissions = reg.counter(
+            "balanceops_model_cache_readmitted_total",
+            "Rejected models admitted later because they became more frequent than the "
+            "protected entries they replace.",
+        )
+        self._bytes_gauge = reg.gauge(
+            "balanceops_model_cache_bytes", "Estimated bytes of cached named models."
+        )
+        self._entries_gauge = reg.gauge(
+            "balanceops_model_cache_entries", "Cached named models.", ["segment"]
+        )
+
+    # ----------------------------
+    # internal (lock held)
+    # ----------------------------
+    def _update_gauges(self) -> None:
+        self._bytes_gauge.set(self._bytes)
+        self._entries_gauge.set(len(self._probation), segment="probation")
+        self._entries_gauge.set(len(self._protected), segment="protected")
+
+    def _count(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def _over(self, extra_bytes: int = 0, extra_entries: int = 0) -> bool:
+        return (
+            self._bytes + extra_bytes > self.max_bytes
+            or self._count() + extra_entries > self.max_entries
+        )
+
+    def _touch(self, key: Hashable) -> None:
+        if key in self._freq:
+            self._freq[key] += 1
+        self._accesses += 1
+        if self._accesses >= self.age_every:
+            # aging: 오래전 빈도가 계속 이기지 않도록 절반으로
+            self._accesses = 0
+            for k in self._freq:
+                self._freq[k] //= 2
+
+    def _evict_probation(self, *, keep: Hashable, extra_bytes: int, extra_entries: int) -> None:
+        for k in list(self._probation):
+            if not self._over(extra_bytes, extra_entries):
+                return
+            if k == keep:
+                continue
+            _, size = self._probation.pop(k)
+            self._bytes -= size
+            self._evictions.inc()
+            self._remember_ghost(k)
+
+    def _protected_victims(self, size: int) -> list[Hashable]:
+        """새 항목(size)을 넣으려면 내보내야 하는 protected key(LRU 순)."""
+        victims: list[Hashable] = []
+        n_bytes, n = self._bytes, self._count()
+        for k, (_, sz) in self._protected.items():
+            if n_bytes + size <= self.max_bytes and n + 1 <= self.max_entries:
+                break
+            victims.append(k)
+            n_bytes -= sz
+            n -= 1
+        return victims
+
+    def _remember_ghost(self, key: Hashable) -> None:
+        self._ghosts[key] = None
+        self._ghosts.move_to_end(key)
+        self._freq.setdefault(key, 1)
+        while len(self._ghosts) > self.ghost_entries:
+            old, _ = self._ghosts.popitem(last=False)
+            self._freq.pop(old, None)
+
+    def _rebalance_protected(self) -> None:
+        protected = sum(size for _, size in self._protected.values())
+        while len(self._protected) > 1 and protected > self.protected_bytes_cap:
+            k, (v, size) = self._protected.popitem(last=False)
+            self._probation[k] = (v, size)
+            protected -= size
+
+    # ----------------------------
+    # public
+    # ----------------------------
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            self._touch(key)
+            if key in self._protected:
+                self._protected.move_to_end(key)
+                self._lookups.inc(result="hit")
+                return self._protected[key][0]
+
+            item = self._probation.pop(key, None)
+            if item is None:
+                self._lookups.inc(result="miss")
+                return None
+
+            # 두 번째 조회 → protected 승격
+            self._protected[key] = item
+            self._rebalance_protected()
+            self._update_gauges()
+            self._lookups.inc(result="hit")
+            return item[0]
+
+    def put(self, key: Hashable, value: Any, size_bytes: int) -> bool:
+        """캐시에 넣으면 True, admission이 거절되면 False(key는 ghost로 빈도를 계속 센다)."""
+        size = max(0, int(size_bytes))
+        with self._lock:
+            for seg in (self._protected, self._probation):
+                if key in seg:
+                    # 같은 이름의 새 버전(hot reload): 구간을 유지한 채 교체
+                    _, old = seg[key]
+                    seg[key] = (value, size)
+                    self._bytes += size - old
+                    self._evict_probation(keep=key, extra_bytes=0, extra_entries=0)
+                    self._update_gauges()
+                    return True
+
+            self._evict_probation(keep=key, extra_bytes=size, extra_entries=1)
+            if self._over(size, 1) and self._protected:
+                freq = self._freq.get(key, 0) if key in self._ghosts else 0
+                victims = self._protected_victims(size)
+                if not freq or any(self._freq.get(v, 0) >= freq for v in victims):
+                    self._remember_ghost(key)
+                    self._rejections.inc()
+                    return False
+                # 내보낼 protected 전부보다 최근에 더 자주 쓰임 → 그 자리에 admit
+                for v in victims:
+                    _, sz = self._protected.pop(v)
+                    self._bytes -= sz
+                    self._evictions.inc()
+                    self._remember_ghost(v)
+                del self._ghosts[key]
+                self._protected[key] = (value, size)
+                self._bytes += size
+                self._readmissions.inc()
+                self._rebalance_protected()
+                self._update_gauges()
+                return True
+
+            self._ghosts.pop(key, None)  # ghost였다면 빈도는 그대로 이어서 센다
+            self._freq.setdefault(key, 1)
+            self._probation[key] = (value, size)
+            self._bytes += size
+            self._update_gauges()
+            return True
+
+    def pop(self, key: Hashable) -> Any | None:
+        with self._lock:
+            self._ghosts.pop(key, None)
+            self._freq.pop(key, None)
+            for seg in (self._protected, self._probation):
+                if key in seg:
+                    value, size = seg.pop(key)
+                    self._bytes -= size
+                    self._update_gauges()
+                    return value
+            return None
+
+    def peek(self, key: Hashable) -> Any | None:
+        """LRU 순서/카운터를 건드리지 않는 조회."""
+        with self._lock:
+            for seg in (self._protected, self._probation):
+                if key in seg:
+                    return seg[key][0]
+            return None
+
+    def keys(self) -> list[Hashable]:
+        with self._lock:
+            return [*self._protected, *self._probation]
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return self._count()
@@ -0,0 +1,319 @@
+"""예측 로그: 운영 예측(request id, run_id, features, p_win, latency)을 오프라인 분석용으로 저장.
+
+- 요청 경로(log)는 lock 안에서 deque append 1회뿐이다(요청 1건 = 항목 1개, N행).
+- 버퍼는 행 수(capacity_rows)로 제한된다. 가득 차면 새 항목을 버리고 dropped로 센다
+  (요청을 막지 않는 backpressure). 버퍼가 batch_rows 이상 차면 flusher를 바로 깨운다.
+- 백그라운드 스레드가 flush_interval_s마다(또는 깨워지면) 버퍼를 비워 sink에 한 번에 쓴다.
+  - SqliteSink: prediction_log 테이블에 배치당 executemany 1회
+  - NdjsonSink: 크기 기준으로 회전하는 NDJSON 파일
+- stop()은 남은 버퍼를 모두 flush한 뒤 종료한다.
+- 직렬화할 수 없는 항목(예: non-finite feature)은 그 항목의 행만 error로 세고 건너뛴다.
+  flusher 스레드는 어떤 예외에도 멈추지 않는다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.tracking.db import connect
+
+_FLUSH_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+@dataclass(frozen=True)
+class PredictionRecord:
+    """요청 1건의 예측 결과(N행). X: (N, n_features), p_win: (N,)."""
+
+    created_at: str
+    request_id: str | None
+    model_name: str
+    run_id: str | None
+    X: np.ndarray
+    p_win: np.ndarray
+    latency_ms: float | None
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.p_win.shape[0])
+
+
+Row = tuple[str, str | None, str, str | None, str, float, float | None]
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _rows(records: list[PredictionRecord]) -> list[Row]:
+    out: list[Row] = []
+    for r in records:
+        for x, p in zip(r.X.tolist(), r.p_win.tolist()):
+            out.append(
+                (
+                    r.created_at,
+                    r.request_id,
+                    r.model_name,
+                    r.run_id,
+                    json.dumps(x, allow_nan=False),
+                    float(p),
+                    r.latency_ms,
+                )
+            )
+    return out
+
+
+class PredictionSink(Protocol):
+    def write(self, rows: list[Row]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class SqliteSink:
+    """flusher 스레드 전용 연결 1개로 배치당 executemany + commit 1회."""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._con: sqlite3.Connection | None = None
+
+    def write(self, rows: list[Row]) -> None:
+        if self._con is None:
+            # stop()의 마지막 flush는 다른 스레드에서 올 수 있음(접근은 _flush_lock으로 직렬화)
+            self._con = connect(self.db_path, check_same_thread=False)
+        self._con.executemany(
+            "INSERT INTO prediction_log(created_at, request_id, model_name, run_id, "
+            "features_json, p_win, latency_ms) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._con.commit()
+
+    def close(self) -> None:
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+
+class NdjsonSink:
+    """<dir>/predictions-<UTC 시각>-<pid>-<seq>.ndjson. max_bytes를 넘으면 새 파일로 회전.
+
+    worker마다 pid가 달라 여러 프로세스가 같은 디렉터리에 써도 파일이 겹치지 않는다.
+    """
+
+    def __init__(self, directory: str | Path, *, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max(1, int(max_bytes))
+        self._path: Path | None = None
+        self._seq = 0
+
+    def _next_path(self) -> Path:
+        self._seq += 1
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return self.directory / f"predictions-{stamp}-{os.getpid()}-{self._seq:04d}.ndjson"
+
+    def write(self, rows: list[Row]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self._path is None or (
+            self._path.exists() and self._path.stat().st_size >= self.max_bytes
+        ):
+            self._path = self._next_path()
+
+        lines = []
+        for created_at, request_id, model_name, run_id, features_json, p_win, lat in rows:
+            head = json.dumps(
+                {
+                    "created_at": created_at,
+                    "request_id": request_id,
+                    "model_name": model_name,
+                    "run_id": run_id,
+                    "p_win": p_win,
+                    "latency_ms": lat,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            lines.append(f'{head[:-1]},"features":{features_json}}}')
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    @property
+    def current_path(self) -> Path | None:
+        return self._path
+
+    def close(self) -> None:
+        self._path = None
+
+
+class PredictionLogger:
+    def __init__(
+        self,
+        sink: PredictionSink,
+        *,
+        capacity_rows: int = 100_000,
+        batch_rows: int = 1000,
+        flush_interval_s: float = 1.0,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.sink = sink
+        self.capacity_rows = max(1, int(capacity_rows))
+        self.batch_rows = max(1, min(int(batch_rows), self.capacity_rows))
+        self.flush_interval_s = max(0.001, float(flush_interval_s))
+
+        self._lock = threading.Lock()
+        self._buf: deque[PredictionRecord] = deque()
+        self._buf_rows = 0
+        self._flush_lock = threading.Lock()  # flusher 스레드와 stop()/flush()의 동시 flush 방지
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.last_error: str | None = None
+
+        reg = metrics or MetricsRegistry()
+        self._rows_total = reg.counter(
+            "balanceops_prediction_log_rows_total",
+            "Prediction log rows by outcome (queued, dropped, written, error).",
+            ["result"],
+        )
+        self._buffer_gauge = reg.gauge(
+            "balanceops_prediction_log_buffer_rows", "Prediction log rows waiting to be flushed."
+        )
+        self._flush_seconds = reg.histogram(
+            "balanceops_prediction_log_flush_seconds",
+            "Duration of one prediction log batch write.",
+            buckets=_FLUSH_BUCKETS,
+        )
+
+    # ----------------------------
+    # request path
+    # ----------------------------
+    def log(self, record: PredictionRecord) -> bool:
+        """버퍼에 넣으면 True, 가득 차서 버렸으면 False. 블록하지 않는다."""
+        n = record.n_rows
+        if n == 0:
+            return True
+        with self._lock:
+            if self._buf_rows + n > self.capacity_rows:
+                self._rows_total.inc(n, result="dropped")
+                return False
+            self._buf.append(record)
+            self._buf_rows += n
+            buffered = self._buf_rows
+        self._rows_total.inc(n, result="queued")
+        self._buffer_gauge.set(buffered)
+        if buffered >= self.batch_rows:
+            self._wake.set()
+        return True
+
+    # ----------------------------
+    # background
+    # ----------------------------
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="balanceops-prediction-log", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """flusher를 멈추고 남은 버퍼를 모두 기록(shutdown flush)."""
+        self._stop.set()
+        self._wake.set()
+        t, self._thread = self._thread, None
+        if t is not None:
+            t.join(timeout=timeout)
+        self.flush()
+        self.sink.close()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # flusher가 죽으면 이후 예측 로그가 모두 사라진다
+                self.last_error = f"flush: {type(e).__name__}: {e}"
+
+    def _take(self) -> list[PredictionRecord]:
+        with self._lock:
+            records = list(self._buf)
+            self._buf.clear()
+            self._buf_rows = 0
+        self._buffer_gauge.set(0)
+        return records
+
+    def flush(self) -> int:
+        """버퍼를 비워 sink에 기록. 기록한 행 수를 반환."""
+        with self._flush_lock:
+            records = self._take()
+            if not records:
+                return 0
+            rows: list[Row] = []
+            bad_error: str | None = None
+            for r in records:
+                # 항목 단위로 직렬화: 깨진 항목 하나가 같은 배치의 다른 요청 행을 잃게 하지 않음
+                try:
+                    rows.extend(_rows([r]))
+                except Exception as e:
+                    bad_error = f"record: {type(e).__name__}: {e}"
+                    self._rows_total.inc(r.n_rows, result="error")
+            if not rows:
+                self.last_error = bad_error
+                return 0
+            t0 = time.perf_counter()
+            try:
+                self.sink.write(rows)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                self._rows_total.inc(len(rows), result="error")
+                return 0
+            finally:
+                self._flush_seconds.observe(time.perf_counter() - t0)
+            self.last_error = bad_error
+            self._rows_total.inc(len(rows), result="written")
+            return len(rows)
+
+
+def finite_rows(X: np.ndarray, p_win: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """스코어링에 실패한 행(p_win이 NaN/None)과 non-finite feature 행은 로그에서 제외."""
+    x = np.asarray(X, dtype=float)
+    p = np.asarray(p_win, dtype=float).ravel()
+    ok = np.isfinite(p)
+    if x.ndim == 2 and x.shape[0] == p.shape[0]:
+        ok &= np.isfinite(x).all(axis=1)
+    if ok.all():
+        return x, p
+    return x[ok], p[ok]
+
+
+PREDICTION_LOG_MODES = ("off", "sqlite", "ndjson")
+
+
+def make_sink(
+    mode: str, *, db_path: str, directory: str | Path, rotate_bytes: int
+) -> PredictionSink | None:
+    """BALANCEOPS_PREDICTION_LOG 값 → sink. off면 None."""
+    if mode == "off":
+        return None
+    if mode == "sqlite":
+        return SqliteSink(db_path)
+    if mode == "ndjson":
+        return NdjsonSink(directory, max_bytes=rotate_bytes)
+    raise ValueError(
+        f"BALANCEOPS_PREDICTION_LOG must be one of {', '.join(PREDICTION_LOG_MODES)} (got {mode!r})"
+    )
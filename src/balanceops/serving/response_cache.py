@@ -0,0 +1,106 @@
+"""예측 응답 캐시: 같은 feature 벡터의 반복 스코어링(재시도/대시보드/폴링)을 건너뛴다.
+
+- key = (모델 identity, float64 feature bytes). bytes는 dict 해시(SipHash)로 조회되고
+  비교는 바이트 단위 일치라 해시 충돌로 다른 벡터의 결과를 돌려주지 않는다.
+- 모델 identity(name, run_id, path, mtime)가 key에 들어가므로 승격 후에는 예전 항목이
+  절대 조회되지 않는다. 교체 시 invalidate(name)로 해당 이름의 항목을 즉시 비운다.
+- 개수 상한(LRU)과 TTL(조회 시점에 만료 확인)로 크기를 제한한다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from threading import Lock
+
+import numpy as np
+
+from balanceops.serving.metrics import MetricsRegistry
+
+ModelIdentity = tuple[Hashable, ...]
+
+
+def feature_key(identity: ModelIdentity, features: Sequence[float]) -> tuple[Hashable, ...]:
+    """identity + float64 바이트(같은 값이면 list/ndarray/int 입력과 무관하게 같은 key)."""
+    return (*identity, np.asarray(features, dtype=np.float64).tobytes())
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_s: float,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_s = float(ttl_s)
+
+        self._lock = Lock()
+        # key[0] == 모델 이름(invalidate 대상 식별용)
+        self._data: OrderedDict[tuple[Hashable, ...], tuple[float, float]] = OrderedDict()
+
+        reg = metrics or MetricsRegistry()
+        self._lookups = reg.counter(
+            "balanceops_response_cache_lookups_total",
+            "Predict response cache lookups (hit, miss, expired).",
+            ["result"],
+        )
+        self._evictions = reg.counter(
+            "balanceops_response_cache_evictions_total",
+            "Response cache entries removed by size limit.",
+        )
+        self._invalidations = reg.counter(
+            "balanceops_response_cache_invalidations_total",
+            "Response cache entries dropped because the model was replaced.",
+        )
+        self._entries = reg.gauge(
+            "balanceops_response_cache_entries", "Entries in the predict response cache."
+        )
+
+    def get(self, key: tuple[Hashable, ...]) -> float | None:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._lookups.inc(result="miss")
+                return None
+            value, expires_at = item
+            if now >= expires_at:
+                del self._data[key]
+                self._entries.set(len(self._data))
+                self._lookups.inc(result="expired")
+                return None
+            self._data.move_to_end(key)
+            self._lookups.inc(result="hit")
+            return value
+
+    def put(self, key: tuple[Hashable, ...], value: float) -> None:
+        expires_at = time.monotonic() + self.ttl_s if self.ttl_s > 0 else float("inf")
+        with self._lock:
+            self._data[key] = (float(value), expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self._evictions.inc()
+            self._entries.set(len(self._data))
+
+    def invalidate(self, name: Hashable) -> int:
+        """모델 이름 name의 항목을 모두 제거(승격/교체 시). 제거한 개수를 반환."""
+        with self._lock:
+            stale = [k for k in self._data if k[0] == name]
+            for k in stale:
+                del self._data[k]
+            if stale:
+                self._invalidations.inc(len(stale))
+                self._entries.set(len(self._data))
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._entries.set(0)
+
+    def __len__(self) -> int:
+        return len(self._data)
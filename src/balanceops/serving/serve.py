@@ -0,0 +1,168 @@
+"""balanceops-serve: API 서버 실행(worker 수 / BLAS 스레드 / 모델 preload).
+
+- worker 수: --workers > BALANCEOPS_WORKERS > 사용 가능한 CPU 수
+  (CPU 수는 affinity와 cgroup CPU quota(cpu.max / cpu.cfs_quota_us) 중 작은 값: 컨테이너에
+  CPU 제한을 걸면 host 코어 수만큼 worker를 띄우지 않는다)
+- worker당 BLAS/OpenMP 스레드: --blas-threads > 이미 설정된 환경변수 > CPU 수 // worker 수(최소 1)
+  (worker마다 NumPy가 코어 수만큼 스레드를 띄워 과다 구독되는 것을 방지)
+- 환경변수는 uvicorn이 worker를 띄우기 전에 설정되므로 모든 worker가
+  NumPy import 시점부터 적용받는다.
+- BALANCEOPS_PRELOAD_MODEL=1: 각 worker가 lifespan에서 current 모델을 로딩+워밍업한 뒤에야
+  요청을 받는다. 기동 시간은 서버 로그와 /metrics(balanceops_startup_seconds)에 남는다.
+
+NumPy를 import하지 않는다(스레드 환경변수는 NumPy import 전에 설정돼야 함).
+
+Usage:
+  balanceops-serve
+  balanceops-serve --workers 4 --port 8000
+  balanceops-serve --workers 8 --blas-threads 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import time
+from collections.abc import MutableMapping
+
+BLAS_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+)
+
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def _read_text(path: str) -> str | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(root: str = CGROUP_ROOT) -> float | None:
+    """cgroup CPU quota(코어 단위, 예: 1.5). 제한이 없거나 읽을 수 없으면 None."""
+    # cgroup v2: "<quota> <period>" 또는 "max <period>"
+    v2 = _read_text(os.path.join(root, "cpu.max"))
+    if v2 is not None:
+        parts = v2.split()
+        quota = parts[0] if parts else "max"
+        period = parts[1] if len(parts) > 1 else "100000"
+    else:  # cgroup v1: quota -1이면 제한 없음
+        quota = _read_text(os.path.join(root, "cpu", "cpu.cfs_quota_us")) or "-1"
+        period = _read_text(os.path.join(root, "cpu", "cpu.cfs_period_us")) or "100000"
+    try:
+        q, p = int(quota), int(period)
+    except ValueError:  # "max" 또는 알 수 없는 형식
+        return None
+    if q <= 0 or p <= 0:
+        return None
+    return q / p
+
+
+def available_cpus(cgroup_root: str = CGROUP_ROOT) -> int:
+    """이 프로세스가 쓸 수 있는 CPU 수(affinity와 cgroup quota 중 작은 값, 최소 1)."""
+    try:
+        n = len(os.sched_getaffinity(0))
+    except AttributeError:  # Windows/macOS
+        n = os.cpu_count() or 1
+    limit = cgroup_cpu_limit(cgroup_root)
+    if limit is not None:
+        n = min(n, math.ceil(limit))
+    return max(1, n)
+
+
+def plan_workers(*, workers: int | None, blas_threads: int | None, cpus: int) -> tuple[int, int]:
+    """(worker 수, worker당 BLAS 스레드 수)."""
+    n_workers = max(1, workers if workers else cpus)
+    n_threads = max(1, blas_threads if blas_threads else cpus // n_workers)
+    return n_workers, n_threads
+
+
+def apply_thread_env(
+    env: MutableMapping[str, str], threads: int, *, override: bool
+) -> dict[str, str]:
+    """BLAS/OpenMP 스레드 환경변수 설정. override=False면 이미 있는 값은 유지. 적용된 값을 반환."""
+    for key in BLAS_THREAD_ENV_VARS:
+        if override or not env.get(key):
+            env[key] = str(threads)
+    return {key: env[key] for key in BLAS_THREAD_ENV_VARS}
+
+
+def _env_default(name: str, default: str | None = None) -> str | None:
+    # 문자열 default는 argparse가 type(int)으로 변환하므로, 잘못된 값은
+    # traceback 대신 "argument --port: invalid int value" 형태의 usage 오류가 된다
+    v = os.getenv(name)
+    if v is None or not v.strip():
+        return default
+    return v.strip()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Run the BalanceOps API (uvicorn) with tuned workers")
+    ap.add_argument("--host", default=os.getenv("BALANCEOPS_HOST", "0.0.0.0"))
+    ap.add_argument("--port", type=int, default=_env_default("BALANCEOPS_PORT", "8000"))
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=_env_default("BALANCEOPS_WORKERS"),
+        help="worker processes (default: BALANCEOPS_WORKERS or available CPUs)",
+    )
+    ap.add_argument(
+        "--blas-threads",
+        type=int,
+        default=None,
+        help="BLAS/OpenMP threads per worker (default: CPUs // workers)",
+    )
+    ap.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="do not load/warm the current model before accepting traffic",
+    )
+    ap.add_argument("--app", default="apps.api.main:app", help="ASGI app import string")
+    ap.add_argument("--app-dir", default=".", help="directory added to sys.path (repo root)")
+    ap.add_argument("--log-level", default="info")
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    cpus = available_cpus()
+    workers, threads = plan_workers(workers=args.workers, blas_threads=args.blas_threads, cpus=cpus)
+    applied = apply_thread_env(os.environ, threads, override=args.blas_threads is not None)
+
+    if args.no_preload:
+        os.environ["BALANCEOPS_PRELOAD_MODEL"] = "0"
+    else:
+        os.environ.setdefault("BALANCEOPS_PRELOAD_MODEL", "1")
+    os.environ["BALANCEOPS_SERVE_LAUNCHED_AT"] = repr(time.time())
+
+    print(
+        f"[OK] balanceops-serve: cpus={cpus} workers={workers} "
+        f"omp_threads={applied['OMP_NUM_THREADS']} "
+        f"preload={os.environ['BALANCEOPS_PRELOAD_MODEL']} "
+        f"listen={args.host}:{args.port}"
+    )
+
+    import uvicorn
+
+    uvicorn.run(
+        args.app,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        app_dir=args.app_dir,
+        log_level=args.log_level,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
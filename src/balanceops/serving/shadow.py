@@ -0,0 +1,252 @@
+"""Shadow scoring: 실제 /predict 트래픽 일부를 candidate 모델로도 스코어링해 쌍으로 기록.
+
+- 요청 경로(submit)는 샘플링 난수 1회 + queue.put_nowait 뿐이다. 큐가 가득 차면 버린다.
+- 백그라운드 스레드가 큐를 모아 candidate 모델로 한 번에 스코어링하고
+  shadow_scores 테이블에 executemany로 기록한다.
+- candidate는 고정 run_id(pinned) 또는 가장 최근 model_candidate 아티팩트이며,
+  refresh_s 주기로 다시 확인한다. candidate가 current와 같은 run이면 건너뛴다.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.tracking.db import pooled_connection
+from balanceops.tracking.read import get_candidate_artifact
+
+_ABS_DIFF_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0)
+
+
+@dataclass(frozen=True)
+class _Item:
+    features: tuple[float, ...]
+    p_current: float
+    current_run_id: str | None
+
+
+@dataclass
+class _Candidate:
+    run_id: str
+    path: str
+    mtime_ns: int
+    model: Any
+
+
+class ShadowScorer:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        loader: Callable[[str], Any],
+        sample_rate: float = 0.1,
+        run_id: str | None = None,
+        queue_size: int = 1000,
+        max_batch: int = 256,
+        refresh_s: float = 10.0,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.db_path = db_path
+        self.loader = loader
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self.pinned_run_id = run_id
+        self.max_batch = max(1, int(max_batch))
+        self.refresh_s = float(refresh_s)
+
+        self._queue: queue.Queue[_Item] = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+        self._candidate: _Candidate | None = None
+        self._resolved_at = float("-inf")
+
+        self._stats_lock = threading.Lock()
+        self._n = 0
+        self._sum_abs_diff = 0.0
+        self._max_abs_diff = 0.0
+        self._n_agree = 0
+        self.last_error: str | None = None
+
+        reg = metrics or MetricsRegistry()
+        self._requests = reg.counter(
+            "balanceops_shadow_requests_total",
+            "Shadow scoring work items by outcome.",
+            ["result"],
+        )
+        self._abs_diff = reg.histogram(
+            "balanceops_shadow_abs_diff",
+            "|p_candidate - p_current| for shadow-scored requests.",
+            buckets=_ABS_DIFF_BUCKETS,
+        )
+
+    # ----------------------------
+    # request path
+    # ----------------------------
+    def submit(self, features: list[float], p_current: float, current_run_id: str | None) -> bool:
+        """샘플링되면 큐에 넣는다. 절대 블록하지 않는다."""
+        if self.sample_rate <= 0.0 or random.random() >= self.sample_rate:
+            return False
+        try:
+            self._queue.put_nowait(_Item(tuple(features), float(p_current), current_run_id))
+        except queue.Full:
+            self._requests.inc(result="dropped")
+            return False
+        self._requests.inc(result="queued")
+        return True
+
+    # ----------------------------
+    # background
+    # ----------------------------
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="balanceops-shadow-scorer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        t, self._thread = self._thread, None
+        if t is not None:
+            t.join(timeout=timeout)
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """테스트/종료용: 큐에 들어간 작업이 모두 처리될 때까지 대기."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._process(batch)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                self._requests.inc(len(batch), result="error")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _resolve_candidate(self) -> _Candidate | None:
+        now = time.monotonic()
+        if now - self._resolved_at < self.refresh_s:
+            return self._candidate
+        self._resolved_at = now
+
+        art = get_candidate_artifact(self.db_path, run_id=self.pinned_run_id)
+        if art is None:
+            self._candidate = None
+            return None
+
+        mtime_ns = Path(art["path"]).stat().st_mtime_ns
+        cur = self._candidate
+        if cur is None or (cur.run_id, cur.path, cur.mtime_ns) != (
+            art["run_id"],
+            art["path"],
+            mtime_ns,
+        ):
+            model = self.loader(art["path"])
+            self._candidate = _Candidate(art["run_id"], art["path"], mtime_ns, model)
+        return self._candidate
+
+    def _process(self, batch: list[_Item]) -> None:
+        cand = self._resolve_candidate()
+        if cand is None:
+            self._requests.inc(len(batch), result="no_candidate")
+            return
+
+        items = [it for it in batch if it.current_run_id != cand.run_id]
+        if len(items) != len(batch):
+            self._requests.inc(len(batch) - len(items), result="same_as_current")
+        if not items:
+            return
+
+        X = np.asarray([it.features for it in items], dtype=float)
+        p_cand = np.asarray(cand.model.predict_proba(X))[:, 1].tolist()
+
+        created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        rows = [
+            (
+                created_at,
+                it.current_run_id,
+                cand.run_id,
+                json.dumps(list(it.features)),
+                it.p_current,
+                float(pc),
+            )
+            for it, pc in zip(items, p_cand)
+        ]
+        with pooled_connection(self.db_path) as con:
+            con.executemany(
+                "INSERT INTO shadow_scores(created_at, current_run_id, candidate_run_id, "
+                "features_json, p_current, p_candidate) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            con.commit()
+
+        with self._stats_lock:
+            for it, pc in zip(items, p_cand):
+                d = abs(float(pc) - it.p_current)
+                self._n += 1
+                self._sum_abs_diff += d
+                self._max_abs_diff = max(self._max_abs_diff, d)
+                self._n_agree += int((pc >= 0.5) == (it.p_current >= 0.5))
+                self._abs_diff.observe(d)
+        self._requests.inc(len(items), result="scored")
+        self.last_error = None
+
+    # ----------------------------
+    # summary
+    # ----------------------------
+    def summary(self) -> dict[str, Any]:
+        with self._stats_lock:
+            n = self._n
+            out: dict[str, Any] = {
+                "scored": n,
+                "mean_abs_diff": (self._sum_abs_diff / n) if n else None,
+                "max_abs_diff": self._max_abs_diff if n else None,
+                "agreement_rate": (self._n_agree / n) if n else None,
+            }
+        cand = self._candidate
+        out.update(
+            {
+                "sample_rate": self.sample_rate,
+                "pinned_run_id": self.pinned_run_id,
+                "candidate_run_id": cand.run_id if cand else None,
+                "queue_depth": self._queue.qsize(),
+                "queued": int(self._requests.get(result="queued")),
+                "dropped": int(self._requests.get(result="dropped")),
+                "last_error": self.last_error,
+            }
+        )
+        return out
@@ -0,0 +1,193 @@
+"""스트리밍 스코어링(/predict/stream)용 입력 파싱/출력 직렬화.
+
+- 요청 body를 조각(chunk) 단위로 받아 줄 단위로 자르며, 완성되지 않은 마지막 줄만 보관한다.
+  (메모리 사용량 = 청크 1개 + 미완성 줄 1개 → 입력 크기와 무관)
+- 입력 포맷
+  - NDJSON: 줄마다 `{"id": ..., "features": [...]}` 또는 `[...]`
+  - CSV: 숫자 row. 첫 줄에 숫자가 아닌 칸이 있으면 header로 보고, `id` 컬럼이 있으면 id로 사용
+    (따옴표 안 줄바꿈은 지원하지 않음)
+- 출력은 입력과 같은 포맷(NDJSON → NDJSON, CSV → CSV), 입력 순서를 유지한다.
+  에러 row에는 줄 번호와 파서 메시지를 함께 남긴다(CSV는 error_message, line 컬럼).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+from collections.abc import AsyncIterator
+from typing import Any
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+CSV_CONTENT_TYPE = "text/csv"
+
+MAX_LINE_BYTES = 1 << 20
+
+
+class RowError(ValueError):
+    """한 줄을 row로 해석할 수 없음(스트림은 계속 진행)."""
+
+    def __init__(self, code: str, message: str, *, row_id: Any = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.row_id = row_id
+
+
+class StreamError(ValueError):
+    """스트림 자체를 더 읽을 수 없음(예: 줄이 너무 김)."""
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes], *, max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[tuple[int, bytes]]:
+    """body 조각 → (1부터 시작하는 줄 번호, 줄 bytes). 빈 줄은 건너뛴다."""
+    pending = b""
+    line_no = 0
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        parts = (pending + chunk).split(b"\n")
+        pending = parts.pop()
+        if len(pending) > max_line_bytes:
+            raise StreamError(f"line {line_no + len(parts) + 1} exceeds {max_line_bytes} bytes")
+        for part in parts:
+            line_no += 1
+            if part.strip():
+                yield line_no, part
+
+    if pending.strip():
+        yield line_no + 1, pending
+
+
+def _features(values: Any, *, row_id: Any = None) -> list[float]:
+    if not isinstance(values, list):
+        raise RowError("INVALID_ROW", "features must be a list of numbers.", row_id=row_id)
+    out: list[float] = []
+    for v in values:
+        if isinstance(v, bool) or not isinstance(v, (int, float)):
+            raise RowError("INVALID_ROW", "features must be a list of numbers.", row_id=row_id)
+        f = float(v)
+        if not math.isfinite(f):
+            raise RowError("NON_FINITE_FEATURE", "Features must be finite.", row_id=row_id)
+        out.append(f)
+    return out
+
+
+class NdjsonRowParser:
+    content_type = NDJSON_CONTENT_TYPE
+
+    def parse(self, line: bytes) -> tuple[Any, list[float]] | None:
+        try:
+            obj = json.loads(line)
+        except ValueError as e:  # JSONDecodeError, UnicodeDecodeError
+            raise RowError("INVALID_ROW", f"Line is not valid JSON: {e}") from None
+
+        if isinstance(obj, list):
+            return None, _features(obj)
+        if isinstance(obj, dict):
+            row_id = obj.get("id")
+            return row_id, _features(obj.get("features"), row_id=row_id)
+        raise RowError("INVALID_ROW", "Line must be a JSON object or array.")
+
+    def header(self) -> bytes:
+        return b""
+
+    def format_ok(self, row_id: Any, p_win: float) -> bytes:
+        obj: dict[str, Any] = {"p_win": p_win}
+        if row_id is not None:
+            obj = {"id": row_id, **obj}
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def format_error(self, line_no: int, row_id: Any, code: str, message: str) -> bytes:
+        obj: dict[str, Any] = {"line": line_no, "error": {"code": code, "message": message}}
+        if row_id is not None:
+            obj = {"id": row_id, **obj}
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class CsvRowParser:
+    content_type = CSV_CONTENT_TYPE
+
+    def __init__(self) -> None:
+        self._first = True
+        self._id_col: int | None = None
+
+    @staticmethod
+    def _cells(line: bytes) -> list[str]:
+        # strict: 따옴표가 깨진 줄을 조용히 고쳐 읽지 않고 에러로 보고
+        try:
+            return next(csv.reader([line.decode("utf-8-sig").rstrip("\r")], strict=True))
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise RowError("INVALID_ROW", f"Invalid CSV: {e}") from None
+
+    def parse(self, line: bytes) -> tuple[Any, list[float]] | None:
+        cells = [c.strip() for c in self._cells(line)]
+
+        if self._first:
+            self._first = False
+            try:
+                [float(c) for c in cells]
+            except ValueError:
+                # header row
+                names = [c.lower() for c in cells]
+                self._id_col = names.index("id") if "id" in names else None
+                return None
+
+        row_id: Any = None
+        if self._id_col is not None:
+            if self._id_col >= len(cells):
+                raise RowError("INVALID_ROW", "Missing id column.")
+            row_id = cells[self._id_col]
+            cells = cells[: self._id_col] + cells[self._id_col + 1 :]
+
+        values: list[float] = []
+        for i, c in enumerate(cells):
+            try:
+                values.append(float(c))
+            except ValueError:
+                raise RowError(
+                    "INVALID_ROW",
+                    f"CSV cells must be numbers (cell {i + 1}: {c!r}).",
+                    row_id=row_id,
+                ) from None
+        return row_id, _features(values, row_id=row_id)
+
+    def _row(self, *cells: Any) -> bytes:
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerow(cells)
+        return buf.getvalue().encode("utf-8")
+
+    def header(self) -> bytes:
+        return self._row("id", "p_win", "error_code", "error_message", "line")
+
+    def format_ok(self, row_id: Any, p_win: float) -> bytes:
+        return self._row("" if row_id is None else row_id, repr(p_win), "", "", "")
+
+    def format_error(self, line_no: int, row_id: Any, code: str, message: str) -> bytes:
+        return self._row("" if row_id is None else row_id, "", code, message, line_no or "")
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """요청 body를 읽으면서 응답을 흘려보내는 StreamingResponse.
+
+    기본 StreamingResponse는 (ASGI spec < 2.4에서) 별도 태스크로 receive()를 읽으며
+    disconnect를 기다리는데, 그러면 generator 안의 request.stream()과 body 메시지를
+    나눠 갖게 되어 멈춘다. 여기서는 receive()를 request.stream()에만 맡기고,
+    연결 끊김은 request.stream()의 ClientDisconnect로 감지한다(generator가 처리).
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def make_row_parser(media_type: str) -> NdjsonRowParser | CsvRowParser:
+    if media_type in (CSV_CONTENT_TYPE, "application/csv"):
+        return CsvRowParser()
+    return NdjsonRowParser()
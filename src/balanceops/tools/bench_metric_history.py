@@ -0,0 +1,106 @@
+"""metric 시계열 벤치마크: 대량 기록(append) + 다운샘플 조회(minmax/lttb).
+
+임시 DB에 random walk 시계열 N점을 --chunk 단위로 기록한 뒤, 전체/부분 구간을
+max_points개로 줄여 조회하는 시간을 잰다. 비교용으로 raw 전체를 읽는 시간도 함께 출력한다.
+
+Usage:
+  python -m balanceops.tools.bench_metric_history
+  python -m balanceops.tools.bench_metric_history --points 5000000 --max-points 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from balanceops.tracking.db import pooled_connection
+from balanceops.tracking.history import get_metric_series, log_metric_history
+from balanceops.tracking.init_db import init_db
+
+RUN_ID = "bench"
+KEY = "loss"
+
+
+def populate(db_path: str, n: int, *, chunk: int, seed: int = 0) -> None:
+    values = np.cumsum(np.random.default_rng(seed).normal(size=n))
+    for i in range(0, n, chunk):
+        log_metric_history(db_path, RUN_ID, KEY, values[i : i + chunk])
+
+
+def _time_it(fn: Callable[[], Any], repeat: int) -> float:
+    fn()  # warm-up(page cache)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def _read_all(db_path: str) -> int:
+    with pooled_connection(db_path) as con:
+        rows = con.execute(
+            "SELECT step, value FROM metric_history WHERE run_id = ? AND key = ?", (RUN_ID, KEY)
+        ).fetchall()
+    return len(rows)
+
+
+def run_bench(db_path: str, *, n: int, max_points: int, repeat: int) -> list[dict[str, Any]]:
+    def series(method: str, start: int | None = None, end: int | None = None) -> Callable:
+        return lambda: get_metric_series(
+            db_path,
+            RUN_ID,
+            KEY,
+            max_points=max_points,
+            method=method,
+            start_step=start,
+            end_step=end,
+        )
+
+    tail = max(0, n - n // 10)
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("raw full scan", lambda: _read_all(db_path)),
+        ("minmax full", series("minmax")),
+        ("lttb full", series("lttb")),
+        ("minmax last 10%", series("minmax", tail)),
+        ("minmax 20k window", series("minmax", n // 2, n // 2 + 20_000)),
+    ]
+    return [{"case": name, "ms": round(_time_it(fn, repeat) * 1000.0, 2)} for name, fn in cases]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Benchmark metric history append + downsampled reads")
+    ap.add_argument("--points", type=int, default=1_000_000)
+    ap.add_argument("--chunk", type=int, default=10_000, help="points per append call")
+    ap.add_argument("--max-points", type=int, default=1000)
+    ap.add_argument("--repeat", type=int, default=5)
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="balanceops-bench-") as tmp:
+        db_path = str(Path(tmp) / "balanceops.db")
+        init_db(db_path)
+        t0 = time.perf_counter()
+        populate(db_path, args.points, chunk=args.chunk)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"appended {args.points} points in {elapsed:.1f}s "
+            f"({args.points / elapsed:,.0f} points/s, chunk={args.chunk})"
+        )
+        results = run_bench(db_path, n=args.points, max_points=args.max_points, repeat=args.repeat)
+
+    print(f"points={args.points} max_points={args.max_points} repeat={args.repeat}")
+    print(f"{'case':<24}{'ms':>10}")
+    for r in results:
+        print(f"{r['case']:<24}{r['ms']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
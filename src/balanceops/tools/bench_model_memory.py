@@ -0,0 +1,129 @@
+"""worker별 모델 메모리 벤치마크: 일반 로딩 vs mmap 로딩.
+
+uvicorn --workers N 과 같은 상황을 흉내 내어 N개 프로세스가 동시에 같은 아티팩트를 로딩
+(API와 같은 joblib.load + compile_model)하고 1회 스코어링한 뒤, 모두 살아 있는 상태에서
+각 프로세스의 메모리를 /proc/self/smaps_rollup 으로 잰다.
+
+- RSS   : 공유 페이지 포함 → mmap이어도 줄지 않아 보인다
+- Private: 그 프로세스만 쓰는 페이지(anon 복사본)
+- PSS   : 공유 페이지를 나눠 센 값. 합계가 실제로 늘어난 메모리에 가깝다
+
+모델은 입력 폭이 큰 DummyBalanceModel(가중치 벡터 n_features개)이다.
+Linux 전용(/proc 필요).
+
+Usage:
+  python -m balanceops.tools.bench_model_memory
+  python -m balanceops.tools.bench_model_memory --workers 8 --n-features 8000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+_SMAPS = Path("/proc/self/smaps_rollup")
+
+
+def _memory_kb() -> dict[str, int]:
+    fields: dict[str, int] = {}
+    for line in _SMAPS.read_text().splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[2] == "kB":
+            fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def _worker(path: str, mmap: bool, n_features: int, barrier: Any, out: Any) -> None:
+    import joblib
+
+    from balanceops.serving.compile import compile_model
+
+    before = _memory_kb()
+    model = compile_model(joblib.load(path, mmap_mode="r" if mmap else None))
+    model.predict_proba(np.ones((1, n_features)))  # 배열 전체를 실제로 읽음(page-in)
+
+    barrier.wait()  # 모든 worker가 로딩을 마친 상태에서 측정(공유 페이지가 PSS에 반영)
+    after = _memory_kb()
+    out.put({k: after[k] - before[k] for k in after})
+    barrier.wait()
+
+
+def run_bench(*, workers: int, n_features: int) -> list[dict[str, Any]]:
+    from balanceops.models.dummy import DummyBalanceModel
+    from balanceops.registry.artifacts import dump_model
+
+    ctx = mp.get_context("spawn")
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="balanceops-bench-mem-") as tmp:
+        path = Path(tmp) / "model.joblib"
+        w = np.random.default_rng(0).normal(size=n_features) * 1e-3
+        dump_model(DummyBalanceModel(seed=0, w=w, b=0.0), path)
+        file_mb = path.stat().st_size / 1024 / 1024
+
+        for mode in ("load", "mmap"):
+            barrier = ctx.Barrier(workers)
+            out = ctx.Queue()
+            procs = [
+                ctx.Process(
+                    target=_worker, args=(str(path), mode == "mmap", n_features, barrier, out)
+                )
+                for _ in range(workers)
+            ]
+            for p in procs:
+                p.start()
+            deltas = [out.get(timeout=120) for _ in procs]
+            for p in procs:
+                p.join(timeout=30)
+
+            def _mb(key: str, deltas: list[dict[str, int]] = deltas) -> float:
+                return sum(d[key] for d in deltas) / len(deltas) / 1024
+
+            results.append(
+                {
+                    "mode": mode,
+                    "file_mb": round(file_mb, 1),
+                    "rss_mb_per_worker": round(_mb("rss"), 1),
+                    "private_mb_per_worker": round(_mb("private"), 1),
+                    "pss_mb_per_worker": round(_mb("pss"), 1),
+                    "pss_mb_total": round(_mb("pss") * workers, 1),
+                }
+            )
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Benchmark per-worker model memory: load vs mmap")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--n-features", type=int, default=4_000_000, help="weight vector length")
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not _SMAPS.exists():
+        print("bench_model_memory: /proc/self/smaps_rollup not available (Linux only)")
+        return 2
+
+    results = run_bench(workers=args.workers, n_features=args.n_features)
+
+    print(f"workers={args.workers} n_features={args.n_features} (deltas after load, MB)")
+    print(f"{'mode':<6}{'file':>8}{'rss/w':>10}{'private/w':>12}{'pss/w':>10}{'pss total':>12}")
+    for r in results:
+        print(
+            f"{r['mode']:<6}{r['file_mb']:>8}{r['rss_mb_per_worker']:>10}"
+            f"{r['private_mb_per_worker']:>12}{r['pss_mb_per_worker']:>10}{r['pss_mb_total']:>12}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+"""JSON vs 바이너리(.npy / raw float) predict 처리량 벤치마크.
+
+기본은 임시 DB/아티팩트에 Dummy 모델을 승격한 뒤 in-process(TestClient)로 측정한다.
+--base-url을 주면 이미 떠 있는 서버(current 모델 필요)를 대상으로 측정한다.
+in-process 모드는 apps/ 를 import 하므로 repo root에서 실행한다.
+
+Usage:
+  python -m balanceops.tools.bench_predict_formats
+  python -m balanceops.tools.bench_predict_formats --rows 5000 --repeat 20
+  python -m balanceops.tools.bench_predict_formats --base-url http://127.0.0.1:8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from balanceops.serving.codec import NPY_CONTENT_TYPE, RAW_CONTENT_TYPE
+
+
+@contextmanager
+def _in_process_client() -> Iterator[Any]:
+    import importlib
+
+    import joblib
+    from fastapi.testclient import TestClient
+
+    from balanceops.models.dummy import DummyBalanceModel
+    from balanceops.registry.promote import promote_run
+    from balanceops.tracking.init_db import init_db
+
+    with tempfile.TemporaryDirectory(prefix="balanceops-bench-") as tmp:
+        root = Path(tmp)
+        os.environ["BALANCEOPS_DB"] = str(root / "balanceops.db")
+        os.environ["BALANCEOPS_ARTIFACTS"] = str(root / "artifacts")
+        os.environ["BALANCEOPS_CURRENT_MODEL"] = str(root / "artifacts/models/current.joblib")
+        init_db(os.environ["BALANCEOPS_DB"])
+
+        cand = root / "candidate.joblib"
+        joblib.dump(DummyBalanceModel(seed=0, w=np.linspace(-1.0, 1.0, 8), b=0.0), cand)
+        promote_run(run_id="bench", model_path=str(cand), metrics={})
+
+        import apps.api.main as api_main
+
+        importlib.reload(api_main)
+        with TestClient(api_main.app) as client:
+            yield client
+
+
+def _time_it(fn: Callable[[], None], repeat: int) -> float:
+    fn()  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def run_bench(client: Any, *, rows: int, n_features: int, repeat: int) -> list[dict[str, Any]]:
+    X = np.random.default_rng(0).normal(size=(rows, n_features))
+
+    json_body = json.dumps({"rows": X.tolist()}).encode("utf-8")
+    buf = io.BytesIO()
+    np.save(buf, X)
+    npy_body = buf.getvalue()
+    raw_body = X.astype("<f8").tobytes()
+
+    cases: list[tuple[str, bytes, dict[str, str]]] = [
+        ("json", json_body, {"Content-Type": "application/json"}),
+        ("npy", npy_body, {"Content-Type": NPY_CONTENT_TYPE}),
+        (
+            "raw",
+            raw_body,
+            {"Content-Type": RAW_CONTENT_TYPE, "X-Shape": f"{rows},{n_features}"},
+        ),
+    ]
+
+    results: list[dict[str, Any]] = []
+    for name, body, headers in cases:
+
+        def _call(body: bytes = body, headers: dict[str, str] = headers) -> None:
+            r = client.post("/predict/batch", content=body, headers=headers)
+            if r.status_code != 200:
+                raise RuntimeError(f"{name}: HTTP {r.status_code}: {r.text[:200]}")
+
+        sec = _time_it(_call, repeat)
+        results.append(
+            {
+                "format": name,
+                "request_bytes": len(body),
+                "ms_per_request": round(sec * 1000.0, 3),
+                "rows_per_sec": round(rows / sec, 1),
+            }
+        )
+
+    base = results[0]["ms_per_request"]
+    for r in results:
+        r["speedup_vs_json"] = round(base / r["ms_per_request"], 2)
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Benchmark /predict/batch JSON vs binary formats")
+    ap.add_argument("--base-url", default=None, help="running server (default: in-process)")
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--n-features", type=int, default=8)
+    ap.add_argument("--repeat", type=int, default=10)
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = build_parser()
+    args = ap.parse_args(argv)
+    if not args.base_url and args.n_features != 8:
+        ap.error("in-process mode serves an 8-feature Dummy model (use --base-url for others)")
+
+    if args.base_url:
+        import httpx
+
+        with httpx.Client(base_url=args.base_url, timeout=60.0) as client:
+            results = run_bench(
+                client, rows=args.rows, n_features=args.n_features, repeat=args.repeat
+            )
+    else:
+        with _in_process_client() as client:
+            results = run_bench(
+                client, rows=args.rows, n_features=args.n_features, repeat=args.repeat
+            )
+
+    print(f"rows={args.rows} n_features={args.n_features} repeat={args.repeat}")
+    print(f"{'format':<8}{'bytes':>12}{'ms/req':>12}{'rows/s':>14}{'x json':>9}")
+    for r in results:
+        print(
+            f"{r['format']:<8}{r['request_bytes']:>12}{r['ms_per_request']:>12}"
+            f"{r['rows_per_sec']:>14}{r['speedup_vs_json']:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
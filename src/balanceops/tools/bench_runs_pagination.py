@@ -0,0 +1,112 @@
+"""run 목록 페이지 조회 벤치마크: OFFSET vs keyset(cursor), 인덱스 유무.
+
+임시 DB에 run N개를 넣고 list_runs_summary(include_metrics=False)로 첫 페이지와
+깊은 페이지(--depth 비율 위치)를 조회한다. --no-index는 idx_runs_created_at을 지운 상태
+(마이그레이션 이전 스키마)로 측정한다.
+
+Usage:
+  python -m balanceops.tools.bench_runs_pagination
+  python -m balanceops.tools.bench_runs_pagination --runs 1000000 --repeat 5
+  python -m balanceops.tools.bench_runs_pagination --runs 100000 --no-index
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from balanceops.tracking.db import connect
+from balanceops.tracking.init_db import init_db
+from balanceops.tracking.read import encode_run_cursor, list_runs_summary
+
+
+def populate(db_path: str, n: int) -> None:
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    params = json.dumps({"kind": "bench"})
+    con = connect(db_path)
+    with con:
+        con.executemany(
+            "INSERT INTO runs(run_id, created_at, git_commit, git_branch, git_dirty, "
+            "params_json, note) VALUES (?, ?, NULL, NULL, 0, ?, NULL)",
+            ((f"run-{i:08d}", (t0 + timedelta(seconds=i)).isoformat(), params) for i in range(n)),
+        )
+    con.close()
+
+
+def _time_it(fn: Callable[[], Any], repeat: int) -> float:
+    fn()  # warm-up(page cache)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def run_bench(
+    db_path: str, *, n: int, limit: int, depth: float, repeat: int
+) -> list[dict[str, Any]]:
+    skip = min(max(0, int(n * depth)), max(0, n - limit))
+    con = connect(db_path)
+    row = con.execute(
+        "SELECT created_at, run_id FROM runs ORDER BY created_at DESC, run_id DESC "
+        "LIMIT 1 OFFSET ?",
+        (max(0, skip - 1),),
+    ).fetchone()
+    con.close()
+    cursor = encode_run_cursor(row["created_at"], row["run_id"])
+
+    def page(**kwargs: Any) -> Callable[[], Any]:
+        return lambda: list_runs_summary(db_path, limit=limit, include_metrics=False, **kwargs)
+
+    cases = [
+        ("offset first page", page(offset=0)),
+        (f"offset skip={skip}", page(offset=skip)),
+        (f"cursor skip={skip}", page(cursor=cursor)),
+    ]
+    return [
+        {"case": name, "ms_per_page": round(_time_it(fn, repeat) * 1000.0, 3)} for name, fn in cases
+    ]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Benchmark run listing: OFFSET vs keyset cursor")
+    ap.add_argument("--runs", type=int, default=100_000)
+    ap.add_argument("--limit", type=int, default=20)
+    ap.add_argument("--depth", type=float, default=0.9, help="deep page position (0..1)")
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--no-index", action="store_true", help="drop idx_runs_created_at")
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="balanceops-bench-") as tmp:
+        db_path = str(Path(tmp) / "balanceops.db")
+        init_db(db_path)
+        t0 = time.perf_counter()
+        populate(db_path, args.runs)
+        print(f"populated {args.runs} runs in {time.perf_counter() - t0:.1f}s")
+        if args.no_index:
+            con = connect(db_path)
+            con.execute("DROP INDEX IF EXISTS idx_runs_created_at")
+            con.close()
+
+        results = run_bench(
+            db_path, n=args.runs, limit=args.limit, depth=args.depth, repeat=args.repeat
+        )
+
+    index = "without" if args.no_index else "with"
+    print(f"runs={args.runs} limit={args.limit} repeat={args.repeat} ({index} index)")
+    print(f"{'case':<28}{'ms/page':>12}")
+    for r in results:
+        print(f"{r['case']:<28}{r['ms_per_page']:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+"""SQLite 동시성 벤치마크: writer 프로세스 N개(학습 기록) + reader 프로세스 M개(대시보드/API 조회).
+
+writer는 run마다 create_run + log_metric 5회 + log_artifact를, reader는 list_runs_summary와
+get_run_detail을 반복한다. 모드별로 환경변수만 바꿔 같은 코드를 실행한다.
+
+- legacy: journal_mode=DELETE, synchronous=FULL, 호출마다 새 연결(이전 동작)
+- pooled: journal_mode=WAL, synchronous=NORMAL, 스레드별 재사용 연결(기본값)
+
+Usage:
+  python -m balanceops.tools.bench_sqlite_contention
+  python -m balanceops.tools.bench_sqlite_contention --writers 8 --readers 4 --runs 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+MODES: dict[str, dict[str, str]] = {
+    "legacy": {
+        "BALANCEOPS_SQLITE_JOURNAL_MODE": "DELETE",
+        "BALANCEOPS_SQLITE_SYNCHRONOUS": "FULL",
+        "BALANCEOPS_SQLITE_POOL": "0",
+    },
+    "pooled": {
+        "BALANCEOPS_SQLITE_JOURNAL_MODE": "WAL",
+        "BALANCEOPS_SQLITE_SYNCHRONOUS": "NORMAL",
+        "BALANCEOPS_SQLITE_POOL": "1",
+    },
+}
+
+
+def _writer(db_path: str, worker: int, runs: int, start: Any, out: Any) -> None:
+    from balanceops.tracking.log_run import create_run, log_artifact, log_metric
+
+    start.wait()
+    errors = 0
+    done = 0
+    t0 = time.perf_counter()
+    for i in range(runs):
+        run_id = f"w{worker}-{i}"
+        try:
+            create_run(db_path, run_id=run_id, params={"kind": "bench"})
+            for k in range(5):
+                log_metric(db_path, run_id, f"m{k}", float(i + k))
+            log_artifact(db_path, run_id, "bench", f"/tmp/{run_id}")
+            done += 1
+        except sqlite3.OperationalError:
+            errors += 1  # database is locked
+    out.put(("writer", done, errors, time.perf_counter() - t0, []))
+
+
+def _reader(db_path: str, iterations: int, start: Any, out: Any) -> None:
+    from balanceops.tracking.read import get_run_detail, list_runs_summary
+
+    start.wait()
+    errors = 0
+    lat: list[float] = []
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        t = time.perf_counter()
+        try:
+            items = list_runs_summary(db_path, limit=20)
+            if items:
+                get_run_detail(db_path, run_id=items[0]["run_id"])
+        except sqlite3.OperationalError:
+            errors += 1
+            continue
+        lat.append(time.perf_counter() - t)
+    out.put(("reader", len(lat), errors, time.perf_counter() - t0, lat))
+
+
+def _pct(values: list[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    s = sorted(values)
+    return s[min(len(s) - 1, int(q * len(s)))]
+
+
+def run_mode(mode: str, *, writers: int, readers: int, runs: int, reads: int) -> dict[str, Any]:
+    from balanceops.tracking.init_db import init_db
+
+    ctx = mp.get_context("spawn")
+    saved = {k: os.environ.get(k) for k in MODES[mode]}
+    os.environ.update(MODES[mode])  # spawn된 자식 프로세스가 그대로 상속
+    try:
+        with tempfile.TemporaryDirectory(prefix="balanceops-bench-") as tmp:
+            db_path = str(Path(tmp) / "balanceops.db")
+            init_db(db_path)
+
+            start = ctx.Event()
+            out = ctx.Queue()
+            procs = [
+                ctx.Process(target=_writer, args=(db_path, w, runs, start, out))
+                for w in range(writers)
+            ] + [
+                ctx.Process(target=_reader, args=(db_path, reads, start, out))
+                for _ in range(readers)
+            ]
+            for p in procs:
+                p.start()
+            time.sleep(0.5)  # import/기동이 끝난 뒤 동시에 시작
+            t0 = time.perf_counter()
+            start.set()
+            results = [out.get() for _ in procs]
+            wall = time.perf_counter() - t0
+            for p in procs:
+                p.join()
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+    w = [r for r in results if r[0] == "writer"]
+    r = [x for x in results if x[0] == "reader"]
+    lat = [v for x in r for v in x[4]]
+    return {
+        "mode": mode,
+        "wall_s": round(wall, 2),
+        "runs_per_s": round(sum(x[1] for x in w) / wall, 1),
+        "write_errors": sum(x[2] for x in w),
+        "read_errors": sum(x[2] for x in r),
+        "read_p50_ms": round(_pct(lat, 0.5) * 1000.0, 2),
+        "read_p99_ms": round(_pct(lat, 0.99) * 1000.0, 2),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Benchmark SQLite tracking writes under contention")
+    ap.add_argument("--writers", type=int, default=4)
+    ap.add_argument("--readers", type=int, default=2)
+    ap.add_argument("--runs", type=int, default=50, help="runs per writer")
+    ap.add_argument("--reads", type=int, default=200, help="iterations per reader")
+    ap.add_argument("--mode", choices=[*MODES, "both"], default="both")
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    modes = list(MODES) if args.mode == "both" else [args.mode]
+    print(f"writers={args.writers} readers={args.readers} runs/writer={args.runs}")
+    print(
+        f"{'mode':<8}{'wall s':>8}{'runs/s':>9}{'w err':>7}{'r err':>7}"
+        f"{'read p50':>10}{'read p99':>10}"
+    )
+    for mode in modes:
+        r = run_mode(
+            mode, writers=args.writers, readers=args.readers, runs=args.runs, reads=args.reads
+        )
+        print(
+            f"{r['mode']:<8}{r['wall_s']:>8}{r['runs_per_s']:>9}{r['write_errors']:>7}"
+            f"{r['read_errors']:>7}{r['read_p50_ms']:>10}{r['read_p99_ms']:>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,453 @@
+"""비동기 tracking client: 학습 루프의 기록 호출이 SQLite commit을 기다리지 않도록.
+
+- 기록 호출(create_run/log_metric/log_artifact)은 op 하나를 bounded queue에 넣고 바로 반환한다.
+- 백그라운드 writer 스레드가 queue를 비워 batch_size개씩 한 트랜잭션으로 쓴다
+  (log_run의 RunContext와 같은 기록 경로). 첫 op 이후 linger_s 동안 더 모아서 commit 수를 줄인다.
+- queue가 가득 찼을 때(backpressure policy)
+  - block: 자리가 날 때까지 기다린다(block_timeout_s를 넘기면 버리고 dropped로 센다)
+  - drop: 바로 버리고 dropped로 센다(학습 루프를 절대 막지 않음)
+  - spill: NDJSON 파일(spill_dir)에 이어 쓴다. spill 중에 들어온 op도 모두 파일로 보내고,
+    writer가 queue를 비운 뒤 파일을 순서대로 재생하므로 기록 순서가 유지된다.
+    깨진 줄(JSON 오류, 잘린 줄)은 error로 세고 건너뛴다(writer는 멈추지 않음).
+- flush()는 그 시점까지 받은 op가 모두 기록될 때까지 기다리고, close()는 남은 op를 모두
+  쓴 뒤 writer를 멈춘다. 프로세스 종료 시 atexit로 close()가 불린다(flush-on-exit).
+- 지표: balanceops_tracking_ops_total{result}, balanceops_tracking_queue_depth,
+  balanceops_tracking_write_seconds, balanceops_tracking_enqueue_wait_seconds
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from balanceops.common.metrics import MetricsRegistry
+from balanceops.tracking.db import pooled_connection
+from balanceops.tracking.log_run import _run_row, _write
+
+BACKPRESSURE_POLICIES = ("block", "drop", "spill")
+_RESULTS = ("queued", "spilled", "dropped", "written", "error")
+
+_WRITE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+_POLL_S = 0.1
+
+# op: ("run", row) | ("metric", run_id, key, value)
+#     | ("history", run_id, key, step, ts, value) | ("artifact", run_id, kind, path)
+Op = tuple
+
+_OP_KINDS = ("run", "metric", "history", "artifact")
+
+
+def _decode_op(line: bytes | str) -> Op:
+    """spill 파일 한 줄 → op. 형식이 맞지 않으면 ValueError(JSONDecodeError 포함)."""
+    op = json.loads(line)
+    if not isinstance(op, list) or not op or op[0] not in _OP_KINDS:
+        raise ValueError(f"not a tracking op: {str(op)[:80]}")
+    return tuple(op)
+
+
+def _write_ops(con: sqlite3.Connection, ops: list[Op]) -> None:
+    runs: list[tuple] = []
+    metrics: dict[tuple[str, str], float] = {}
+    artifacts: list[tuple[str, str, str]] = []
+    history: dict[tuple[str, str], tuple[list[int], list[float], list[float]]] = {}
+    for op in ops:
+        kind = op[0]
+        if kind == "run":
+            runs.append(tuple(op[1]))
+        elif kind == "metric":
+            metrics[(op[1], op[2])] = op[3]
+        elif kind == "history":
+            _, run_id, key, step, ts, value = op
+            metrics[(run_id, key)] = value  # 요약(metrics)은 마지막 값
+            steps, tss, values = history.setdefault((run_id, key), ([], [], []))
+            steps.append(step)
+            tss.append(ts)
+            values.append(value)
+        elif kind == "artifact":
+            artifacts.append((op[1], op[2], op[3]))
+        else:
+            raise ValueError(f"unknown tracking op: {kind!r}")
+    _write(
+        con,
+        runs=runs,
+        metrics=[(run_id, key, v) for (run_id, key), v in metrics.items()],
+        artifacts=artifacts,
+        history=[(run_id, key, *h) for (run_id, key), h in history.items()],
+    )
+
+
+def replay_spill_file(db_path: str, path: str | Path, *, batch_size: int = 1000) -> int:
+    """남은 spill 파일(예: 비정상 종료한 프로세스)을 기록하고 지운다. 기록한 op 수를 반환.
+
+    깨진 줄(비정상 종료로 잘린 마지막 줄 등)은 건너뛴다.
+    """
+    p = Path(path)
+    ops: list[Op] = []
+    for line in p.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            ops.append(_decode_op(line))
+        except ValueError:
+            continue
+    with pooled_connection(db_path) as con:
+        for i in range(0, len(ops), batch_size):
+            _write_ops(con, ops[i : i + batch_size])
+    p.unlink()
+    return len(ops)
+
+
+class AsyncTrackingClient:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        capacity: int = 10_000,
+        batch_size: int = 1000,
+        linger_s: float = 0.05,
+        policy: str = "block",
+        block_timeout_s: float | None = None,
+        spill_dir: str | Path | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"policy must be one of {', '.join(BACKPRESSURE_POLICIES)} (got {policy!r})"
+            )
+        self.db_path = db_path
+        self.capacity = max(1, int(capacity))
+        self.batch_size = max(1, int(batch_size))
+        self.linger_s = max(0.0, float(linger_s))
+        self.policy = policy
+        self.block_timeout_s = block_timeout_s
+        self.spill_dir = Path(spill_dir) if spill_dir else Path(db_path).parent / "tracking_spill"
+        self.last_error: str | None = None
+
+        self._queue: queue.Queue[Op] = queue.Queue(maxsize=self.capacity)
+        self._lock = threading.Lock()  # accepted 카운터 + spill 상태
+        self._accepted = 0
+        self._processed = 0
+        self._done = threading.Condition()
+        self._spill_path: Path | None = None
+        self._spill_fh: Any = None  # spill 중에만 열려 있음(append)
+        self._spill_read = 0  # writer가 재생한 byte 위치
+        self._spill_pending = 0  # spill 파일에 쓰고 아직 재생하지 않은 op 수
+        self._spill_seq = 0
+        self._flush_now = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+
+        reg = metrics or MetricsRegistry()
+        self._ops_total = reg.counter(
+            "balanceops_tracking_ops_total",
+            "Async tracking ops by outcome (queued, spilled, dropped, written, error).",
+            ["result"],
+        )
+        self._depth = reg.gauge(
+            "balanceops_tracking_queue_depth", "Async tracking ops waiting in the in-memory queue."
+        )
+        self._write_seconds = reg.histogram(
+            "balanceops_tracking_write_seconds",
+            "Duration of one async tracking batch transaction.",
+            buckets=_WRITE_BUCKETS,
+        )
+        self._wait_seconds = reg.histogram(
+            "balanceops_tracking_enqueue_wait_seconds",
+            "Time a logging call waited for queue space (policy=block).",
+            buckets=_WRITE_BUCKETS,
+        )
+
+        self._thread = threading.Thread(
+            target=self._loop, name="balanceops-tracking-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ----------------------------
+    # logging API (호출 스레드)
+    # ----------------------------
+    def create_run(self, run_id: str, params: dict, note: str | None = None) -> bool:
+        return self._put(("run", _run_row(run_id, params, note)))
+
+    def log_metric(self, run_id: str, key: str, value: float, *, step: int | None = None) -> bool:
+        """step을 주면 시계열(metric_history)에도 기록. 큐에 넣었으면 True, 버렸으면 False."""
+        v = float(value)
+        if step is None:
+            if math.isnan(v):
+                raise ValueError(f"metric value must not be NaN ({key})")
+            return self._put(("metric", run_id, key, v))
+        if not math.isfinite(v):
+            raise ValueError(f"metric history values must be finite (got {key}={v})")
+        return self._put(("history", run_id, key, int(step), time.time(), v))
+
+    def log_metrics(
+        self, run_id: str, metrics: Mapping[str, float], *, step: int | None = None
+    ) -> bool:
+        ok = True
+        for k, v in metrics.items():
+            ok = self.log_metric(run_id, k, v, step=step) and ok
+        return ok
+
+    def log_artifact(self, run_id: str, kind: str, path: str) -> bool:
+        return self._put(("artifact", run_id, kind, str(path)))
+
+    def _put(self, op: Op) -> bool:
+        if self._closed:
+            raise RuntimeError("tracking client is closed")
+        if self.policy == "spill":
+            return self._put_or_spill(op)
+
+        if self.policy == "drop":
+            try:
+                self._queue.put_nowait(op)
+            except queue.Full:
+                self._ops_total.inc(result="dropped")
+                return False
+        else:
+            t0 = time.perf_counter()
+            try:
+                self._queue.put_nowait(op)
+            except queue.Full:
+                try:
+                    self._queue.put(op, timeout=self.block_timeout_s)
+                except queue.Full:
+                    self._ops_total.inc(result="dropped")
+                    return False
+                finally:
+                    self._wait_seconds.observe(time.perf_counter() - t0)
+        with self._lock:
+            self._accepted += 1
+        self._ops_total.inc(result="queued")
+        return True
+
+    def _put_or_spill(self, op: Op) -> bool:
+        with self._lock:
+            if self._spill_fh is None:
+                try:
+                    self._queue.put_nowait(op)
+                    self._accepted += 1
+                    self._ops_total.inc(result="queued")
+                    return True
+                except queue.Full:
+                    self._open_spill()
+            # spill 중에는 queue가 비어도 파일로(writer가 파일을 다 재생해야 queue로 돌아감)
+            self._spill_fh.write(json.dumps(op, ensure_ascii=False) + "\n")
+            self._spill_pending += 1
+            self._accepted += 1
+        self._ops_total.inc(result="spilled")
+        return True
+
+    def _open_spill(self) -> None:
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self._spill_seq += 1
+        name = f"tracking-{os.getpid()}-{id(self):x}-{self._spill_seq}.ndjson"
+        self._spill_path = self.spill_dir / name
+        self._spill_fh = self._spill_path.open("a", encoding="utf-8")
+        self._spill_read = 0
+
+    # ----------------------------
+    # flush / close
+    # ----------------------------
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """지금까지 받은 op가 모두 기록(또는 실패로 집계)될 때까지 기다린다. 제때 끝나면 True."""
+        with self._lock:
+            target = self._accepted
+        self._flush_now.set()
+        with self._done:
+            return self._done.wait_for(lambda: self._processed >= target, timeout)
+
+    def close(self, timeout: float | None = 30.0) -> bool:
+        """남은 op를 모두 기록하고 writer를 멈춘다. 여러 번 불러도 된다."""
+        if self._closed:
+            return not self._thread.is_alive()
+        self._closed = True
+        self._stop.set()
+        self._flush_now.set()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+        return not self._thread.is_alive()
+
+    def __enter__(self) -> AsyncTrackingClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, Any]:
+        w = self._write_seconds.snapshot()
+        return {
+            "policy": self.policy,
+            "queue_depth": self.queue_depth,
+            "spilling": self._spill_fh is not None,
+            **{r: int(self._ops_total.get(result=r)) for r in _RESULTS},
+            "write_batches": w["count"],
+            "write_seconds_total": round(float(w["sum"]), 6),
+            "last_error": self.last_error,
+        }
+
+    # ----------------------------
+    # writer 스레드
+    # ----------------------------
+    def _loop(self) -> None:
+        while True:
+            try:
+                spilling = self._spill_fh is not None
+                batch = self._drain(0.0 if spilling else _POLL_S)
+                if batch:
+                    self._write_batch(batch)
+                elif spilling:
+                    self._replay_spill()
+                elif self._stop.is_set():
+                    return
+                else:
+                    self._flush_now.clear()
+            except Exception as e:
+                # 예상 못한 오류로 writer가 죽으면 이후 log_*가 조용히 막히거나 버려진다
+                self.last_error = f"writer: {type(e).__name__}: {e}"
+                time.sleep(_POLL_S)
+
+    def _lost(self, n: int, error: str) -> None:
+        """기록하지 못하고 버린 op를 error로 집계(flush가 기다리지 않도록 처리 완료로 센다)."""
+        self.last_error = error
+        if n <= 0:
+            return
+        self._ops_total.inc(n, result="error")
+        with self._done:
+            self._processed += n
+            self._done.notify_all()
+
+    def _drain(self, timeout: float) -> list[Op]:
+        try:
+            batch = [self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait()]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.linger_s
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._flush_now.is_set() or self._stop.is_set():
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(remaining, _POLL_S)))
+            except queue.Empty:
+                pass
+        self._depth.set(self._queue.qsize())
+        return batch
+
+    def _write_batch(self, ops: list[Op]) -> None:
+        t0 = time.perf_counter()
+        try:
+            with pooled_connection(self.db_path) as con:
+                try:
+                    _write_ops(con, ops)
+                    errors = 0
+                except sqlite3.IntegrityError:
+                    # 예: 같은 run_id로 create_run 두 번. 나머지 op는 살리도록 op별로 다시 기록
+                    con.rollback()
+                    errors = self._write_one_by_one(con, ops)
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            errors = len(ops)
+        self._write_seconds.observe(time.perf_counter() - t0)
+        self._ops_total.inc(len(ops) - errors, result="written")
+        if errors:
+            self._ops_total.inc(errors, result="error")
+        with self._done:
+            self._processed += len(ops)
+            self._done.notify_all()
+
+    def _write_one_by_one(self, con: sqlite3.Connection, ops: list[Op]) -> int:
+        errors = 0
+        for op in ops:
+            try:
+                _write_ops(con, [op])
+            except sqlite3.Error as e:
+                con.rollback()
+                self.last_error = f"{type(e).__name__}: {e}"
+                errors += 1
+        return errors
+
+    def _replay_spill(self) -> None:
+        """spill 파일을 읽은 위치부터 재생. 끝까지 따라잡으면 파일을 지우고 queue 모드로.
+
+        깨진 줄은 error로 세고 건너뛴다. 파일 자체를 읽을 수 없으면 남은 spill op를 모두
+        error로 세고 queue 모드로 돌아간다(어느 경우든 writer는 계속 돈다).
+        """
+        with self._lock:
+            try:
+                self._spill_fh.flush()
+                end = self._spill_fh.tell()
+            except OSError as e:
+                self._lost(self._close_spill(), f"spill: {type(e).__name__}: {e}")
+                return
+            if self._spill_read >= end:
+                self._close_spill()
+                return
+            path, start = self._spill_path, self._spill_read
+
+        assert path is not None
+        ops: list[Op] = []
+        bad = 0
+        error = ""
+        try:
+            with path.open("rb") as f:
+                f.seek(start)
+                while len(ops) + bad < self.batch_size and f.tell() < end:
+                    # end까지는 flush된 완성 줄만 있다. \n 없이 끝나면 잘린(깨진) 줄
+                    line = f.readline(end - f.tell())
+                    self._spill_read = f.tell()
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("truncated spill record")
+                        ops.append(_decode_op(line))
+                    except ValueError as e:
+                        bad += 1
+                        error = f"spill: skipped corrupt record: {type(e).__name__}: {e}"
+        except OSError as e:
+            with self._lock:
+                lost = self._close_spill()
+            self._lost(lost - len(ops), f"spill: {type(e).__name__}: {e}")
+        else:
+            with self._lock:
+                self._spill_pending -= len(ops) + bad
+            if bad:
+                self._lost(bad, error)
+        if ops:
+            self._write_batch(ops)
+
+    def _close_spill(self) -> int:
+        """_lock 안에서 호출. spill 파일을 닫고 지운다. 재생하지 못한 op 수를 반환."""
+        if self._spill_fh is not None:
+            try:
+                self._spill_fh.close()
+            except OSError:
+                pass
+        if self._spill_path is not None:
+            self._spill_path.unlink(missing_ok=True)
+        lost, self._spill_pending = self._spill_pending, 0
+        self._spill_fh = None
+        self._spill_path = None
+        return lost
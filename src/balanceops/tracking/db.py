@@ -1,9 +1,168 @@
+"""SQLite 연결: PRAGMA 설정 + 스레드별 재사용 연결(pool).
+
+- connect(): 새 연결. busy_timeout / synchronous / journal_mode(기본 WAL)를 적용한다.
+  WAL이면 읽기(대시보드/API)와 쓰기(학습)가 서로 막지 않고, 동시 writer는 busy_timeout
+  동안 기다린다(즉시 `database is locked`가 나지 않음).
+- pooled_connection(): 스레드마다 DB 경로별 연결 1개를 재사용한다.
+  연결을 닫지 않으므로 open/close 비용이 없고, 연결별 statement cache로 prepared statement도
+  재사용된다. 블록을 벗어날 때 끝나지 않은 트랜잭션은 rollback한다(쓰기는 호출자가 commit).
+  DB 파일 교체(다른 inode) 확인용 stat()은 매번 하지 않고 _IDENTITY_CHECK_INTERVAL_S마다,
+  또는 그 연결에서 sqlite3 오류가 난 직후에만 한다.
+- 환경변수
+  - BALANCEOPS_SQLITE_JOURNAL_MODE (기본 WAL), BALANCEOPS_SQLITE_SYNCHRONOUS (기본 NORMAL)
+  - BALANCEOPS_SQLITE_BUSY_TIMEOUT_MS (기본 5000), BALANCEOPS_SQLITE_POOL (기본 1)
+"""
+
 from __future__ import annotations
 
+import os
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from balanceops.common.config import env_bool, env_int
+
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# 스레드당 유지하는 DB 경로 수(테스트처럼 경로가 계속 바뀌는 경우 오래된 연결부터 닫음)
+_POOL_MAX_PER_THREAD = 8
+# 재사용 연결의 DB 파일 identity(dev, inode) 재확인 주기(초). 그 사이 교체는 오류가 나면 바로 확인
+_IDENTITY_CHECK_INTERVAL_S = 1.0
+
+
+@dataclass(frozen=True)
+class SqliteOptions:
+    journal_mode: str
+    synchronous: str
+    busy_timeout_ms: int
+    pool: bool
+
 
+def get_sqlite_options() -> SqliteOptions:
+    journal_mode = (os.getenv("BALANCEOPS_SQLITE_JOURNAL_MODE") or "WAL").strip().upper()
+    if journal_mode not in JOURNAL_MODES:
+        raise ValueError(
+            f"BALANCEOPS_SQLITE_JOURNAL_MODE must be one of {', '.join(JOURNAL_MODES)} "
+            f"(got {journal_mode!r})"
+        )
+    synchronous = (os.getenv("BALANCEOPS_SQLITE_SYNCHRONOUS") or "NORMAL").strip().upper()
+    if synchronous not in SYNCHRONOUS_MODES:
+        raise ValueError(
+            f"BALANCEOPS_SQLITE_SYNCHRONOUS must be one of {', '.join(SYNCHRONOUS_MODES)} "
+            f"(got {synchronous!r})"
+        )
+    return SqliteOptions(
+        journal_mode=journal_mode,
+        synchronous=synchronous,
+        busy_timeout_ms=max(0, env_int("BALANCEOPS_SQLITE_BUSY_TIMEOUT_MS", 5000)),
+        pool=env_bool("BALANCEOPS_SQLITE_POOL", True),
+    )
 
-def connect(db_path: str) -> sqlite3.Connection:
-    con = sqlite3.connect(db_path)
+
+def _apply_journal_mode(con: sqlite3.Connection, db_path: str, mode: str) -> None:
+    # journal_mode는 DB 파일에 저장된다. 이미 같은 모드면 사실상 no-op(연결은 pool로 재사용)
+    if db_path == ":memory:" or db_path.startswith("file:"):
+        return
+    con.execute(f"PRAGMA journal_mode={mode}").fetchone()
+
+
+def connect(db_path: str, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    opts = get_sqlite_options()
+    con = sqlite3.connect(
+        db_path, timeout=opts.busy_timeout_ms / 1000.0, check_same_thread=check_same_thread
+    )
     con.row_factory = sqlite3.Row
+    con.execute(f"PRAGMA busy_timeout={opts.busy_timeout_ms}")
+    _apply_journal_mode(con, db_path, opts.journal_mode)
+    con.execute(f"PRAGMA synchronous={opts.synchronous}")
+    return con
+
+
+def _file_identity(db_path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+@dataclass
+class _Pooled:
+    con: sqlite3.Connection
+    ident: tuple[int, int] | None  # 연결 시점의 파일 identity
+    checked_at: float  # 마지막 identity 확인 시각(monotonic). 0이면 다음 acquire에서 확인
+
+
+class _ThreadPool(threading.local):
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.cons: OrderedDict[str, _Pooled] = OrderedDict()
+
+
+_POOL = _ThreadPool()
+
+
+def _acquire(db_path: str) -> sqlite3.Connection:
+    pool = _POOL
+    if pool.pid != os.getpid():
+        # fork된 자식: 부모의 연결은 쓰지도 닫지도 않고 버린다
+        pool.pid = os.getpid()
+        pool.cons = OrderedDict()
+
+    now = time.monotonic()
+    hit = pool.cons.get(db_path)
+    if hit is not None:
+        pool.cons.move_to_end(db_path)
+        if hit.checked_at and now - hit.checked_at < _IDENTITY_CHECK_INTERVAL_S:
+            return hit.con
+        # 파일이 지워지거나 교체되었으면(다른 inode) 새로 연결
+        if hit.ident is not None and hit.ident == _file_identity(db_path):
+            hit.checked_at = now
+            return hit.con
+        pool.cons.pop(db_path)
+        hit.con.close()
+
+    con = connect(db_path)
+    pool.cons[db_path] = _Pooled(con, _file_identity(db_path), now)
+    while len(pool.cons) > _POOL_MAX_PER_THREAD:
+        _, old = pool.cons.popitem(last=False)
+        old.con.close()
     return con
+
+
+def _recheck(db_path: str) -> None:
+    # sqlite3 오류 직후: 다음 acquire에서 주기와 관계없이 파일 identity를 확인
+    hit = _POOL.cons.get(db_path)
+    if hit is not None:
+        hit.checked_at = 0.0
+
+
+@contextmanager
+def pooled_connection(db_path: str) -> Iterator[sqlite3.Connection]:
+    """현재 스레드의 재사용 연결. BALANCEOPS_SQLITE_POOL=0이면 매번 새 연결을 열고 닫는다."""
+    pooled = get_sqlite_options().pool
+    con = _acquire(db_path) if pooled else connect(db_path)
+    try:
+        yield con
+    except sqlite3.Error:
+        if pooled:
+            _recheck(db_path)
+        raise
+    finally:
+        if con.in_transaction:
+            con.rollback()  # commit되지 않은 쓰기가 다음 사용자에게 넘어가지 않도록
+        if not pooled:
+            con.close()
+
+
+def close_pooled_connections() -> None:
+    """현재 스레드의 재사용 연결을 모두 닫는다(테스트/종료 훅)."""
+    pool = _POOL
+    while pool.cons:
+        _, item = pool.cons.popitem()
+        item.con.close()
@@ -0,0 +1,408 @@
+"""step 단위 metric 기록(learning curve / epoch별 loss)과 다운샘플 조회.
+
+- metrics 테이블은 (run_id, key)당 최신 값 1개(요약)이고, 시계열은 metric_history에 쌓는다.
+  (run_id, key, step)이 clustered PK(WITHOUT ROWID)라 step 범위 조회는 인덱스 range scan.
+- metric_history_rollup: step을 ROLLUP_LEVELS 크기 block으로 묶은 min/max 요약
+  (각 block의 최솟값·최댓값 점의 step/ts/value + 점 개수). 기록할 때 함께 갱신한다.
+- get_metric_series(): 최대 max_points개로 줄인 시계열.
+  - minmax: step 구간을 max_points/2개 bucket으로 나눠 bucket마다 최솟값/최댓값 점(스파이크 보존).
+    bucket 폭이 block보다 크면 raw 대신 rollup을 읽으므로, 읽는 행 수가 전체 점 수가 아니라
+    max_points에 비례한다(수백만 점이어도 일정).
+  - lttb: minmax로 4 * max_points개 후보를 만든 뒤 Largest-Triangle-Three-Buckets(NumPy).
+  - 어느 쪽이든 구간의 첫 점과 마지막 점은 포함한다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from balanceops.tracking.db import pooled_connection
+
+# rollup block 크기(step 수). 조회 시 bucket 폭 이하인 가장 큰 level을 쓴다.
+ROLLUP_LEVELS = (16, 256, 4096)
+METHODS = ("minmax", "lttb")
+MIN_POINTS = 4
+
+_INSERT_POINT = """
+INSERT OR REPLACE INTO metric_history(run_id, key, step, ts, value) VALUES (?, ?, ?, ?, ?)
+"""
+
+_ROLLUP_COLUMNS = """
+metric_history_rollup(
+    run_id, key, level, block, n,
+    min_step, min_ts, min_value, max_step, max_ts, max_value
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# 뒤에 이어 붙이는 기록(기존 step과 겹치지 않음): block 요약을 합친다.
+# SET 식의 컬럼 참조는 모두 갱신 전 값이다.
+_MERGE_ROLLUP = f"""
+INSERT INTO {_ROLLUP_COLUMNS}
+ON CONFLICT(run_id, key, level, block) DO UPDATE SET
+    n = n + excluded.n,
+    min_step = CASE WHEN excluded.min_value < min_value THEN excluded.min_step ELSE min_step END,
+    min_ts = CASE WHEN excluded.min_value < min_value THEN excluded.min_ts ELSE min_ts END,
+    min_value = MIN(min_value, excluded.min_value),
+    max_step = CASE WHEN excluded.max_value > max_value THEN excluded.max_step ELSE max_step END,
+    max_ts = CASE WHEN excluded.max_value > max_value THEN excluded.max_ts ELSE max_ts END,
+    max_value = MAX(max_value, excluded.max_value)
+"""
+
+_REPLACE_ROLLUP = f"INSERT OR REPLACE INTO {_ROLLUP_COLUMNS}"
+
+
+def _group_extrema(
+    groups: np.ndarray, values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """정렬된 group id별 (시작 위치, 개수, 최솟값 index, 최댓값 index)."""
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    counts = np.diff(np.r_[starts, len(groups)])
+    order = np.lexsort((values, groups))  # group 안에서 값 오름차순(group 위치는 그대로)
+    return starts, counts, order[starts], order[starts + counts - 1]
+
+
+def _block_rows(
+    run_id: str, key: str, level: int, steps: np.ndarray, ts: np.ndarray, values: np.ndarray
+) -> list[tuple]:
+    blocks = steps // level
+    starts, counts, imin, imax = _group_extrema(blocks, values)
+    return list(
+        zip(
+            [run_id] * len(starts),
+            [key] * len(starts),
+            [level] * len(starts),
+            blocks[starts].tolist(),
+            counts.tolist(),
+            steps[imin].tolist(),
+            ts[imin].tolist(),
+            values[imin].tolist(),
+            steps[imax].tolist(),
+            ts[imax].tolist(),
+            values[imax].tolist(),
+        )
+    )
+
+
+def _series_arrays(
+    values: Sequence[float] | np.ndarray,
+    steps: Sequence[int] | np.ndarray | None,
+    timestamps: Sequence[float] | np.ndarray | None,
+    next_step: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    vals = np.asarray(values, dtype=np.float64).reshape(-1)
+    n = len(vals)
+    if steps is None:
+        st = np.arange(next_step, next_step + n, dtype=np.int64)
+    else:
+        st = np.asarray(steps).reshape(-1)
+        if len(st) != n or (n and not np.array_equal(st, np.floor(st))):
+            raise ValueError("steps must be integers, one per value")
+        st = st.astype(np.int64)
+    if timestamps is None:
+        tss = np.full(n, time.time(), dtype=np.float64)
+    else:
+        tss = np.asarray(timestamps, dtype=np.float64).reshape(-1)
+        if len(tss) != n:
+            raise ValueError("timestamps must have one entry per value")
+    if n and (st.min() < 0):
+        raise ValueError("steps must be >= 0")
+    if not np.isfinite(vals).all():
+        raise ValueError("metric history values must be finite")
+    # step 순 정렬 + 같은 step은 나중 값만(stable sort라 입력 순서 유지)
+    order = np.argsort(st, kind="stable")
+    st, tss, vals = st[order], tss[order], vals[order]
+    keep = np.r_[st[1:] != st[:-1], True]
+    return st[keep], tss[keep], vals[keep]
+
+
+def _last_step(con: sqlite3.Connection, run_id: str, key: str) -> int | None:
+    row = con.execute(
+        "SELECT step FROM metric_history WHERE run_id = ? AND key = ? ORDER BY step DESC LIMIT 1",
+        (run_id, key),
+    ).fetchone()
+    return None if row is None else int(row[0])
+
+
+def append_history(
+    con: sqlite3.Connection,
+    run_id: str,
+    key: str,
+    values: Sequence[float] | np.ndarray,
+    *,
+    steps: Sequence[int] | np.ndarray | None = None,
+    timestamps: Sequence[float] | np.ndarray | None = None,
+) -> int:
+    """열린 연결에 시계열을 추가한다(commit은 호출자). 기록한 점 수를 반환.
+
+    steps가 없으면 마지막 step 다음부터 0, 1, 2... 순으로, timestamps가 없으면 현재 시각.
+    이미 있는 step은 값을 덮어쓴다(그때는 닿은 rollup block을 raw에서 다시 계산).
+    """
+    last = _last_step(con, run_id, key)
+    st, tss, vals = _series_arrays(values, steps, timestamps, 0 if last is None else last + 1)
+    if not len(st):
+        return 0
+    con.executemany(
+        _INSERT_POINT,
+        zip([run_id] * len(st), [key] * len(st), st.tolist(), tss.tolist(), vals.tolist()),
+    )
+    if last is None or int(st[0]) > last:
+        for level in ROLLUP_LEVELS:
+            con.executemany(_MERGE_ROLLUP, _block_rows(run_id, key, level, st, tss, vals))
+        return len(st)
+
+    for level in ROLLUP_LEVELS:
+        b0, b1 = int(st[0]) // level, int(st[-1]) // level
+        raw = _fetch_raw(con, run_id, key, b0 * level, (b1 + 1) * level - 1)
+        touched = np.isin(raw[0] // level, np.unique(st // level))
+        con.executemany(
+            _REPLACE_ROLLUP,
+            _block_rows(run_id, key, level, raw[0][touched], raw[1][touched], raw[2][touched]),
+        )
+    return len(st)
+
+
+def log_metric_history(
+    db_path: str,
+    run_id: str,
+    key: str,
+    values: Sequence[float] | np.ndarray,
+    *,
+    steps: Sequence[int] | np.ndarray | None = None,
+    timestamps: Sequence[float] | np.ndarray | None = None,
+) -> int:
+    """시계열 점들을 한 트랜잭션(executemany)으로 추가한다. 기록한 점 수를 반환."""
+    with pooled_connection(db_path) as con:
+        n = append_history(con, run_id, key, values, steps=steps, timestamps=timestamps)
+        con.commit()
+    return n
+
+
+def list_metric_history_keys(db_path: str, run_id: str) -> list[dict[str, Any]]:
+    """run에 기록된 시계열 key와 점 개수(가장 큰 rollup level에서 합산)."""
+    with pooled_connection(db_path) as con:
+        rows = con.execute(
+            """
+            SELECT key, SUM(n) AS n
+            FROM metric_history_rollup
+            WHERE run_id = ? AND level = ?
+            GROUP BY key
+            ORDER BY key
+            """,
+            (run_id, ROLLUP_LEVELS[-1]),
+        ).fetchall()
+    return [{"key": str(r["key"]), "points": int(r["n"])} for r in rows]
+
+
+def _select_array(con: sqlite3.Connection, sql: str, params: tuple, width: int) -> np.ndarray:
+    # sqlite3.Row 대신 tuple로 받아 바로 float64 배열로
+    cur = con.cursor()
+    cur.row_factory = None
+    rows = cur.execute(sql, params).fetchall()
+    return np.array(rows, dtype=np.float64).reshape(len(rows), width)
+
+
+def _fetch_raw(
+    con: sqlite3.Connection, run_id: str, key: str, lo: int, hi: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    arr = _select_array(
+        con,
+        """
+        SELECT step, ts, value FROM metric_history
+        WHERE run_id = ? AND key = ? AND step BETWEEN ? AND ?
+        ORDER BY step
+        """,
+        (run_id, key, lo, hi),
+        3,
+    )
+    return arr[:, 0].astype(np.int64), arr[:, 1], arr[:, 2]
+
+
+def _bounds(
+    con: sqlite3.Connection, run_id: str, key: str, start: int | None, end: int | None
+) -> tuple[tuple[int, float, float], tuple[int, float, float]] | None:
+    """구간의 첫 점/마지막 점 (step, ts, value). PK 인덱스로 O(log n)."""
+    base = "SELECT step, ts, value FROM metric_history WHERE run_id = ? AND key = ?"
+    first = con.execute(
+        base + " AND step >= ? ORDER BY step LIMIT 1", (run_id, key, start or 0)
+    ).fetchone()
+    last = con.execute(
+        base + " AND step <= ? ORDER BY step DESC LIMIT 1",
+        (run_id, key, 2**63 - 1 if end is None else end),
+    ).fetchone()
+    if first is None or last is None or int(first[0]) > int(last[0]):
+        return None
+    return (int(first[0]), first[1], first[2]), (int(last[0]), last[1], last[2])
+
+
+class _Candidates:
+    """bucket 계산용 점 묶음: anchor(step 순) + 최솟값/최댓값 점. raw 점이면 min=max."""
+
+    def __init__(self) -> None:
+        self.parts: list[tuple[np.ndarray, ...]] = []
+        self.total = 0
+        self.raw_only = True
+
+    def add_raw(self, raw: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        st, ts, val = raw
+        self.parts.append((st, st, ts, val, st, ts, val))
+        self.total += len(st)
+
+    def add_rollup(self, a: np.ndarray, level: int) -> None:
+        self.raw_only = False
+        blk, n = a[:, 0].astype(np.int64), a[:, 1]
+        self.parts.append(
+            (
+                blk * level,
+                a[:, 2].astype(np.int64),
+                a[:, 3],
+                a[:, 4],
+                a[:, 5].astype(np.int64),
+                a[:, 6],
+                a[:, 7],
+            )
+        )
+        self.total += int(n.sum())
+
+    def arrays(self) -> list[np.ndarray]:
+        return [np.concatenate([p[i] for p in self.parts]) for i in range(7)]
+
+
+def _collect(
+    con: sqlite3.Connection, run_id: str, key: str, lo: int, hi: int, buckets: int
+) -> _Candidates:
+    """[lo, hi] 구간의 후보 점. bucket 폭 이하인 가장 큰 rollup level을 쓰고 양 끝은 raw."""
+    width = (hi - lo + 1) // buckets
+    levels = [lv for lv in ROLLUP_LEVELS if lv <= width]
+    out = _Candidates()
+    if not levels:
+        out.add_raw(_fetch_raw(con, run_id, key, lo, hi))
+        return out
+
+    level = levels[-1]
+    first = -(-lo // level)  # 구간 안에 완전히 들어가는 block만 rollup으로
+    last = (hi + 1) // level - 1
+    out.add_raw(_fetch_raw(con, run_id, key, lo, first * level - 1))
+    rows = _select_array(
+        con,
+        """
+        SELECT block, n, min_step, min_ts, min_value, max_step, max_ts, max_value
+        FROM metric_history_rollup
+        WHERE run_id = ? AND key = ? AND level = ? AND block BETWEEN ? AND ?
+        ORDER BY block
+        """,
+        (run_id, key, level, first, last),
+        8,
+    )
+    out.add_rollup(rows, level)
+    out.add_raw(_fetch_raw(con, run_id, key, (last + 1) * level, hi))
+    return out
+
+
+def _minmax(
+    cand: _Candidates, lo: int, hi: int, buckets: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    anchor, min_st, min_ts, min_v, max_st, max_ts, max_v = cand.arrays()
+    bucket = ((anchor - lo) * buckets) // (hi - lo + 1)
+    _, _, imin, _ = _group_extrema(bucket, min_v)
+    _, _, _, imax = _group_extrema(bucket, max_v)
+    # bucket마다 (최솟값 점, 최댓값 점)을 step 순으로, 같은 점이면 1개
+    st = np.stack([min_st[imin], max_st[imax]], axis=1)
+    ts = np.stack([min_ts[imin], max_ts[imax]], axis=1)
+    val = np.stack([min_v[imin], max_v[imax]], axis=1)
+    swap = st[:, 0] > st[:, 1]
+    for a in (st, ts, val):
+        a[swap] = a[swap][:, ::-1]
+    keep = np.ones(st.shape, dtype=bool)
+    keep[:, 1] = st[:, 1] != st[:, 0]
+    return st[keep], ts[keep], val[keep]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: 모양을 보존하는 n_out개 점의 index(처음/끝 점 포함)."""
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:n_out], dtype=np.int64)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # 처음/끝 점을 뺀 나머지를 n_out - 2개 bucket으로
+    edges = np.r_[np.linspace(1, n - 1, n_out - 1).astype(np.int64), n]
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = edges[i + 1], edges[i + 2]
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def get_metric_series(
+    db_path: str,
+    run_id: str,
+    key: str,
+    *,
+    max_points: int = 1000,
+    method: str = "minmax",
+    start_step: int | None = None,
+    end_step: int | None = None,
+) -> dict[str, Any] | None:
+    """[start_step, end_step] 구간의 시계열을 최대 max_points개로. 점이 없으면 None.
+
+    반환: {run_id, key, method, total, count, downsampled, start_step, end_step,
+           step: [...], ts: [...], value: [...]}  (열 단위 배열, step 오름차순)
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)} (got {method!r})")
+    if max_points < MIN_POINTS:
+        raise ValueError(f"max_points must be >= {MIN_POINTS}")
+
+    with pooled_connection(db_path) as con:
+        bounds = _bounds(con, run_id, key, start_step, end_step)
+        if bounds is None:
+            return None
+        lo, hi = bounds[0][0], bounds[1][0]
+        # lttb는 minmax로 만든 4 * max_points개 후보에서 다시 고른다
+        buckets = (max_points - 2) // 2 if method == "minmax" else max_points * 2
+        cand = _collect(con, run_id, key, lo, hi, buckets)
+
+    if cand.total <= max_points:
+        if not cand.raw_only:  # step 간격이 넓어 rollup을 읽었지만 점이 적음
+            with pooled_connection(db_path) as con:
+                cand = _Candidates()
+                cand.add_raw(_fetch_raw(con, run_id, key, lo, hi))
+        st, ts, val = cand.arrays()[1:4]
+    else:
+        st, ts, val = _minmax(cand, lo, hi, buckets)
+        # 구간의 첫 점/마지막 점은 항상 포함(차트 x축 범위 유지, lttb의 고정점)
+        ends = np.array(bounds, dtype=np.float64)
+        st, first = np.unique(np.r_[st, ends[:, 0].astype(np.int64)], return_index=True)
+        ts, val = np.r_[ts, ends[:, 1]][first], np.r_[val, ends[:, 2]][first]
+        if method == "lttb" and len(st) > max_points:
+            idx = lttb_indices(st.astype(np.float64), val, max_points)
+            st, ts, val = st[idx], ts[idx], val[idx]
+
+    return {
+        "run_id": run_id,
+        "key": key,
+        "method": method,
+        "total": cand.total,
+        "count": int(len(st)),
+        "downsampled": bool(len(st) < cand.total),
+        "start_step": lo,
+        "end_step": hi,
+        "step": st.tolist(),
+        "ts": ts.tolist(),
+        "value": val.tolist(),
+    }
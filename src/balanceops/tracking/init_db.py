@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sqlite3
+
 from balanceops.common.config import get_settings
 from balanceops.tracking.db import connect
 
@@ -42,15 +44,147 @@ DDL = [
         PRIMARY KEY (name, stage)
     );
     """,
+    # API shadow scoring: 같은 요청을 current/candidate로 각각 스코어링한 결과 쌍
+    """
+    CREATE TABLE IF NOT EXISTS shadow_scores (
+        created_at TEXT NOT NULL,
+        current_run_id TEXT,
+        candidate_run_id TEXT NOT NULL,
+        features_json TEXT NOT NULL,
+        p_current REAL NOT NULL,
+        p_candidate REAL NOT NULL
+    );
+    """,
+    # API 예측 로그(BALANCEOPS_PREDICTION_LOG=sqlite): 모니터링/재학습용, 행 단위
+    """
+    CREATE TABLE IF NOT EXISTS prediction_log (
+        created_at TEXT NOT NULL,
+        request_id TEXT,
+        model_name TEXT NOT NULL,
+        run_id TEXT,
+        features_json TEXT NOT NULL,
+        p_win REAL NOT NULL,
+        latency_ms REAL
+    );
+    """,
+    # 조회 API 조건부 GET용 변경 카운터(1행). 아래 trigger가 tracking/registry 변경마다 증가
+    """
+    CREATE TABLE IF NOT EXISTS tracking_generation (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        generation INTEGER NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    """,
+    """
+    INSERT OR IGNORE INTO tracking_generation(id, generation, updated_at)
+    VALUES (1, 0, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+    """,
 ]
 
+# tracking_generation을 올리는 테이블(/runs, /runs/latest, /model 응답의 원천)
+GENERATION_TABLES = ("runs", "metrics", "artifacts", "models")
+
+
+def _generation_triggers() -> list[str]:
+    out: list[str] = []
+    for table in GENERATION_TABLES:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            out.append(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_generation
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE tracking_generation
+                    SET generation = generation + 1,
+                        updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+                    WHERE id = 1;
+                END;
+                """
+            )
+    return out
+
+
+# 스키마 마이그레이션: (버전, SQL 목록). 적용된 버전은 PRAGMA user_version에 기록.
+# 이미 만들어진 DB에도 init_db 재실행 시 순서대로 한 번씩 적용된다(추가만, 수정 금지).
+MIGRATIONS: list[tuple[int, list[str]]] = [
+    (
+        1,
+        [
+            # run 목록: ORDER BY created_at DESC, run_id DESC + keyset(cursor) 범위 조회
+            "CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at, run_id)",
+            # run 상세 / candidate 조회
+            "CREATE INDEX IF NOT EXISTS idx_artifacts_run_id ON artifacts(run_id, kind)",
+            "CREATE INDEX IF NOT EXISTS idx_artifacts_kind ON artifacts(kind)",
+        ],
+    ),
+    (
+        2,
+        [
+            # step 단위 metric 시계열(tracking.history). clustered PK라 step 범위 조회가 range scan
+            """
+            CREATE TABLE IF NOT EXISTS metric_history (
+                run_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                step INTEGER NOT NULL,
+                ts REAL NOT NULL,
+                value REAL NOT NULL,
+                PRIMARY KEY (run_id, key, step)
+            ) WITHOUT ROWID
+            """,
+            # step block(level 크기)별 최솟값/최댓값 점: 다운샘플 조회가 raw 대신 읽음
+            """
+            CREATE TABLE IF NOT EXISTS metric_history_rollup (
+                run_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                level INTEGER NOT NULL,
+                block INTEGER NOT NULL,
+                n INTEGER NOT NULL,
+                min_step INTEGER NOT NULL,
+                min_ts REAL NOT NULL,
+                min_value REAL NOT NULL,
+                max_step INTEGER NOT NULL,
+                max_ts REAL NOT NULL,
+                max_value REAL NOT NULL,
+                PRIMARY KEY (run_id, key, level, block)
+            ) WITHOUT ROWID
+            """,
+        ],
+    ),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(con: sqlite3.Connection) -> int:
+    return int(con.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(con: sqlite3.Connection) -> list[int]:
+    """미적용 마이그레이션을 버전마다 한 트랜잭션으로 적용. 적용한 버전 목록을 반환."""
+    applied: list[int] = []
+    for version, statements in MIGRATIONS:
+        if version <= schema_version(con):
+            continue
+        con.execute("BEGIN")
+        try:
+            for q in statements:
+                con.execute(q)
+            con.execute(f"PRAGMA user_version = {int(version)}")
+        except Exception:
+            con.rollback()
+            raise
+        con.commit()
+        applied.append(version)
+    return applied
+
 
 def init_db(db_path: str) -> None:
     con = connect(db_path)
     cur = con.cursor()
-    for q in DDL:
+    for q in [*DDL, *_generation_triggers()]:
         cur.execute(q)
     con.commit()
+    migrate(con)
     con.close()
 
 
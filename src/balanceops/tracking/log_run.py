@@ -1,56 +1,187 @@
 from __future__ import annotations
 
 import json
+import math
+import sqlite3
+import time
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
+from types import TracebackType
 
 from balanceops.common.gitinfo import get_git_info
-from balanceops.tracking.db import connect
+from balanceops.tracking.db import pooled_connection
+from balanceops.tracking.history import append_history
+
+_INSERT_RUN = """
+INSERT INTO runs(
+    run_id, created_at, git_commit, git_branch, git_dirty, params_json, note
+)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_METRIC = """
+INSERT INTO metrics(run_id, key, value) VALUES (?, ?, ?)
+ON CONFLICT(run_id, key) DO UPDATE SET value=excluded.value
+"""
+
+_INSERT_ARTIFACT = "INSERT INTO artifacts(run_id, kind, path) VALUES (?, ?, ?)"
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def create_run(db_path: str, run_id: str, params: dict, note: str | None = None) -> None:
+def _run_row(run_id: str, params: dict, note: str | None) -> tuple:
     gi = get_git_info()
-    con = connect(db_path)
-    con.execute(
-        """
-        INSERT INTO runs(run_id, created_at, git_commit, git_branch, git_dirty, params_json, note)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            run_id,
-            utc_now_iso(),
-            gi.commit,
-            gi.branch,
-            1 if gi.dirty else 0,
-            json.dumps(params, ensure_ascii=False),
-            note,
-        ),
+    return (
+        run_id,
+        utc_now_iso(),
+        gi.commit,
+        gi.branch,
+        1 if gi.dirty else 0,
+        json.dumps(params, ensure_ascii=False),
+        note,
     )
+
+
+def _write(
+    con: sqlite3.Connection,
+    *,
+    runs: Iterable[tuple] = (),
+    metrics: Iterable[tuple[str, str, float]] = (),
+    artifacts: Iterable[tuple[str, str, str]] = (),
+    history: Iterable[tuple[str, str, list[int], list[float], list[float]]] = (),
+) -> None:
+    # 한 트랜잭션(commit 1회)으로 기록. 실패하면 pooled_connection이 rollback
+    con.executemany(_INSERT_RUN, runs)
+    con.executemany(_UPSERT_METRIC, metrics)
+    con.executemany(_INSERT_ARTIFACT, artifacts)
+    for run_id, key, steps, ts, values in history:
+        append_history(con, run_id, key, values, steps=steps, timestamps=ts)
     con.commit()
-    con.close()
+
+
+def create_run(db_path: str, run_id: str, params: dict, note: str | None = None) -> None:
+    with pooled_connection(db_path) as con:
+        _write(con, runs=[_run_row(run_id, params, note)])
 
 
 def log_metric(db_path: str, run_id: str, key: str, value: float) -> None:
-    con = connect(db_path)
-    con.execute(
-        """
-        INSERT INTO metrics(run_id, key, value) VALUES (?, ?, ?)
-        ON CONFLICT(run_id, key) DO UPDATE SET value=excluded.value
-        """,
-        (run_id, key, float(value)),
-    )
-    con.commit()
-    con.close()
+    log_metrics(db_path, run_id, {key: value})
+
+
+def log_metrics(db_path: str, run_id: str, metrics: Mapping[str, float]) -> None:
+    """여러 metric을 executemany + commit 1회로 upsert한다."""
+    with pooled_connection(db_path) as con:
+        _write(con, metrics=[(run_id, k, float(v)) for k, v in metrics.items()])
 
 
 def log_artifact(db_path: str, run_id: str, kind: str, path: str) -> None:
-    con = connect(db_path)
-    con.execute(
-        "INSERT INTO artifacts(run_id, kind, path) VALUES (?, ?, ?)",
-        (run_id, kind, path),
-    )
-    con.commit()
-    con.close()
+    log_artifacts(db_path, run_id, [(kind, path)])
+
+
+def log_artifacts(db_path: str, run_id: str, artifacts: Iterable[tuple[str, str]]) -> None:
+    """(kind, path) 목록을 executemany + commit 1회로 기록한다."""
+    with pooled_connection(db_path) as con:
+        _write(con, artifacts=[(run_id, kind, str(path)) for kind, path in artifacts])
+
+
+class RunContext:
+    """run 하나의 기록(runs/metrics/artifacts)을 메모리에 모았다가 한 트랜잭션으로 commit.
+
+    - `with RunContext(db, run_id, params=...) as run:` 블록을 벗어날 때 flush한다
+      (예외로 벗어나도 그때까지의 기록은 남긴다: 이전의 호출별 commit과 같은 결과).
+    - flush_interval_ms를 주면 기록 호출 시 마지막 flush 후 그 시간이 지났으면 바로 flush한다
+      (긴 학습 중에도 대시보드에 중간 결과가 보이도록). 백그라운드 스레드는 쓰지 않는다.
+    - 같은 key의 metric은 마지막 값만 기록된다(log_metric의 upsert와 같은 의미).
+      log_metric(key, value, step=...)은 metric_history 시계열에도 점을 추가한다.
+    - 스레드 안전하지 않다. 한 스레드에서만 사용한다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        run_id: str,
+        *,
+        params: dict | None = None,
+        note: str | None = None,
+        flush_interval_ms: int | None = None,
+    ) -> None:
+        self.db_path = db_path
+        self.run_id = run_id
+        self.flush_interval_ms = flush_interval_ms
+        self.flushes = 0
+        self._run: tuple | None = None
+        self._metrics: dict[str, float] = {}
+        self._artifacts: list[tuple[str, str]] = []
+        self._history: dict[str, tuple[list[int], list[float], list[float]]] = {}
+        self._last_flush = time.monotonic()
+        if params is not None:
+            self.create(params, note=note)
+
+    def __enter__(self) -> RunContext:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        points = sum(len(h[0]) for h in self._history.values())
+        return int(self._run is not None) + len(self._metrics) + len(self._artifacts) + points
+
+    def create(self, params: dict, note: str | None = None) -> None:
+        # created_at/git 정보는 호출 시점 기준(flush 시점이 아님)
+        self._run = _run_row(self.run_id, params, note)
+        self._maybe_flush()
+
+    def log_metric(self, key: str, value: float, *, step: int | None = None) -> None:
+        """step을 주면 시계열(metric_history)에도 기록한다. 요약(metrics)은 마지막 값."""
+        if step is not None and not math.isfinite(value):
+            raise ValueError(f"metric history values must be finite (got {key}={value})")
+        self._metrics[key] = float(value)
+        if step is not None:
+            steps, ts, values = self._history.setdefault(key, ([], [], []))
+            steps.append(int(step))
+            ts.append(time.time())
+            values.append(float(value))
+        self._maybe_flush()
+
+    def log_metrics(self, metrics: Mapping[str, float]) -> None:
+        for k, v in metrics.items():
+            self._metrics[k] = float(v)
+        self._maybe_flush()
+
+    def log_artifact(self, kind: str, path: str) -> None:
+        self._artifacts.append((kind, str(path)))
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self.flush_interval_ms is None:
+            return
+        if (time.monotonic() - self._last_flush) * 1000.0 >= self.flush_interval_ms:
+            self.flush()
+
+    def flush(self) -> None:
+        """모아 둔 기록을 commit 1회로 쓴다. 실패하면 버퍼를 그대로 두어 다시 시도할 수 있다."""
+        self._last_flush = time.monotonic()
+        if not self.pending:
+            return
+        with pooled_connection(self.db_path) as con:
+            _write(
+                con,
+                runs=[self._run] if self._run is not None else [],
+                metrics=[(self.run_id, k, v) for k, v in self._metrics.items()],
+                artifacts=[(self.run_id, kind, path) for kind, path in self._artifacts],
+                history=[(self.run_id, k, *h) for k, h in self._history.items()],
+            )
+        self._run = None
+        self._metrics.clear()
+        self._artifacts.clear()
+        self._history.clear()
+        self.flushes += 1
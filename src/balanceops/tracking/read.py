@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import base64
 import json
+import sqlite3
 from pathlib import Path
 from typing import Any, Iterable
 
-from balanceops.tracking.db import connect
+from balanceops.tracking.db import pooled_connection
 
 
 def _safe_json_loads(text: str | None) -> Any:
@@ -44,45 +46,70 @@ def _group_metrics(rows: Iterable[dict[str, Any]]) -> dict[str, dict[str, float]
     return out
 
 
+def encode_run_cursor(created_at: str, run_id: str) -> str:
+    """run 목록 keyset cursor(불투명 문자열): 마지막으로 받은 run의 (created_at, run_id)."""
+    raw = json.dumps([created_at, run_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_run_cursor(cursor: str) -> tuple[str, str]:
+    """encode_run_cursor의 역. 형식이 잘못되면 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, run_id = json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"invalid run cursor: {cursor!r}") from e
+    if not isinstance(created_at, str) or not isinstance(run_id, str):
+        raise ValueError(f"invalid run cursor: {cursor!r}")
+    return created_at, run_id
+
+
 def list_runs_summary(
     db_path: str,
     *,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
     include_metrics: bool = True,
     artifacts_root: str | Path | None = None,
     include_run_dir_name: bool = False,
 ) -> list[dict[str, Any]]:
-    """최근 run 요약 목록.
+    """최근 run 요약 목록(created_at, run_id 내림차순).
 
+    - cursor(encode_run_cursor)를 주면 그 run 다음부터(keyset). idx_runs_created_at 범위 조회라
+      깊은 페이지도 OFFSET처럼 앞 행을 건너뛰며 읽지 않습니다.
     - include_run_dir_name=True이고 artifacts_root가 주어지면,
       artifacts/runs/_by_id/<run_id>.json 포인터에서 run_dir_name을 함께 로드합니다.
       (대시보드에서 사람이 읽기 쉬운 run 라벨 표시에 사용)
     """
-    con = connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        """
-        SELECT run_id, created_at, git_commit, git_branch, git_dirty, params_json, note
-        FROM runs
-        ORDER BY created_at DESC
-        LIMIT ? OFFSET ?
-        """,
-        (int(limit), int(offset)),
-    )
-    run_rows = [dict(r) for r in cur.fetchall()]
+    where = ""
+    args: list[Any] = []
+    if cursor is not None:
+        where = "WHERE (created_at, run_id) < (?, ?)"
+        args.extend(decode_run_cursor(cursor))
 
     metrics_map: dict[str, dict[str, float]] = {}
-    if include_metrics and run_rows:
-        run_ids = [r["run_id"] for r in run_rows]
-        placeholders = ",".join(["?"] * len(run_ids))
-        cur.execute(
-            f"SELECT run_id, key, value FROM metrics WHERE run_id IN ({placeholders})",
-            run_ids,
+    with pooled_connection(db_path) as con:
+        cur = con.execute(
+            f"""
+            SELECT run_id, created_at, git_commit, git_branch, git_dirty, params_json, note
+            FROM runs
+            {where}
+            ORDER BY created_at DESC, run_id DESC
+            LIMIT ? OFFSET ?
+            """,
+            (*args, int(limit), int(offset)),
         )
-        metrics_map = _group_metrics([dict(r) for r in cur.fetchall()])
+        run_rows = [dict(r) for r in cur.fetchall()]
 
-    con.close()
+        if include_metrics and run_rows:
+            run_ids = [r["run_id"] for r in run_rows]
+            placeholders = ",".join(["?"] * len(run_ids))
+            cur = con.execute(
+                f"SELECT run_id, key, value FROM metrics WHERE run_id IN ({placeholders})",
+                run_ids,
+            )
+            metrics_map = _group_metrics([dict(r) for r in cur.fetchall()])
 
     ar: Path | None = None
     if include_run_dir_name and artifacts_root is not None:
@@ -126,30 +153,27 @@ def get_run_detail(
     artifacts_root: str | Path | None = None,
 ) -> dict[str, Any] | None:
     """run_id 단건 상세(Params/Metrics/Artifacts/Manifest 포인터 포함)."""
-    con = connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        """
-        SELECT run_id, created_at, git_commit, git_branch, git_dirty, params_json, note
-        FROM runs
-        WHERE run_id = ?
-        """,
-        (run_id,),
-    )
-    row = cur.fetchone()
-    if row is None:
-        con.close()
-        return None
-
-    run_row = dict(row)
-
-    cur.execute("SELECT key, value FROM metrics WHERE run_id = ? ORDER BY key", (run_id,))
-    metrics = {str(r["key"]): float(r["value"]) for r in cur.fetchall()}
-
-    cur.execute("SELECT kind, path FROM artifacts WHERE run_id = ? ORDER BY kind, path", (run_id,))
-    artifacts = [{"kind": str(r["kind"]), "path": str(r["path"])} for r in cur.fetchall()]
-
-    con.close()
+    with pooled_connection(db_path) as con:
+        row = con.execute(
+            """
+            SELECT run_id, created_at, git_commit, git_branch, git_dirty, params_json, note
+            FROM runs
+            WHERE run_id = ?
+            """,
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        run_row = dict(row)
+
+        cur = con.execute("SELECT key, value FROM metrics WHERE run_id = ? ORDER BY key", (run_id,))
+        metrics = {str(r["key"]): float(r["value"]) for r in cur.fetchall()}
+
+        cur = con.execute(
+            "SELECT kind, path FROM artifacts WHERE run_id = ? ORDER BY kind, path", (run_id,)
+        )
+        artifacts = [{"kind": str(r["kind"]), "path": str(r["path"])} for r in cur.fetchall()]
 
     params = _safe_json_loads(run_row.get("params_json"))
 
@@ -186,9 +210,41 @@ def get_latest_run_id(
     if db_path is None:
         return None
 
-    con = connect(db_path)
-    cur = con.cursor()
-    cur.execute("SELECT run_id FROM runs ORDER BY created_at DESC LIMIT 1")
-    row = cur.fetchone()
-    con.close()
+    with pooled_connection(db_path) as con:
+        row = con.execute(
+            "SELECT run_id FROM runs ORDER BY created_at DESC, run_id DESC LIMIT 1"
+        ).fetchone()
     return str(row["run_id"]) if row else None
+
+
+def get_candidate_artifact(db_path: str, *, run_id: str | None = None) -> dict[str, Any] | None:
+    """model_candidate 아티팩트 1건(run_id 지정 시 해당 run, 아니면 가장 최근 run)."""
+    sql = (
+        "SELECT a.run_id AS run_id, a.path AS path "
+        "FROM artifacts a LEFT JOIN runs r ON r.run_id = a.run_id "
+        "WHERE a.kind = 'model_candidate'"
+    )
+    args: tuple[Any, ...] = ()
+    if run_id is not None:
+        sql += " AND a.run_id = ?"
+        args = (run_id,)
+    sql += " ORDER BY r.created_at DESC, a.rowid DESC LIMIT 1"
+
+    with pooled_connection(db_path) as con:
+        row = con.execute(sql, args).fetchone()
+    return {"run_id": str(row["run_id"]), "path": str(row["path"])} if row else None
+
+
+def get_tracking_generation(db_path: str) -> tuple[int, str] | None:
+    """(generation, updated_at). runs/metrics/artifacts/models가 바뀔 때마다 증가하는 카운터.
+
+    1행짜리 테이블만 읽으므로 조회 API의 validator(ETag)로 쓴다. init_db 전 DB면 None.
+    """
+    with pooled_connection(db_path) as con:
+        try:
+            row = con.execute(
+                "SELECT generation, updated_at FROM tracking_generation WHERE id = 1"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+    return (int(row["generation"]), str(row["updated_at"])) if row else None
@@ -3,6 +3,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 # repo root / src 를 pytest import 경로에 강제로 추가
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -15,3 +17,19 @@ if root_str not in sys.path:
 
 if src_str not in sys.path:
     sys.path.insert(0, src_str)
+
+
+@pytest.fixture(autouse=True)
+def _sync_model_watch(monkeypatch: pytest.MonkeyPatch) -> None:
+    # hot-reload 테스트가 결정적으로 동작하도록 current 포인터를 요청마다 동기 확인
+    monkeypatch.setenv("BALANCEOPS_MODEL_WATCH_INTERVAL_MS", "0")
+    # 기동 시 백그라운드 로딩도 끔(모델 로딩 횟수/시점을 검증하는 테스트용)
+    monkeypatch.setenv("BALANCEOPS_EAGER_LOAD", "0")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings() -> None:
+    # 테스트 간 Settings 캐시가 새지 않도록 초기화
+    from balanceops.common.config import clear_settings_cache
+
+    clear_settings_cache()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving.metrics import Gauge
+from balanceops.tracking.init_db import init_db
+
+
+def _set_env(tmp_path: Path) -> None:
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+
+
+def _promote_dummy(tmp_path: Path, run_id: str) -> Path:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=0.0), cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={})
+    return cand
+
+
+def _api(tmp_path: Path):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    return api_main
+
+
+def test_request_counts_use_route_templates_and_status(tmp_path: Path):
+    api_main = _api(tmp_path)
+
+    with TestClient(api_main.app) as client:
+        client.get("/health")
+        client.get("/health")
+        client.get("/runs/does-not-exist")
+        client.get("/no/such/path")
+
+    reqs = api_main._HTTP_REQUESTS
+    assert reqs.get(route="/health", method="GET", status="200") == 2
+    assert reqs.get(route="/runs/{run_id}", method="GET", status="404") == 1
+    assert reqs.get(route="<unmatched>", method="GET", status="404") == 1
+
+    snap = api_main._HTTP_LATENCY.snapshot(route="/health", method="GET")
+    assert snap["count"] == 2
+
+
+def test_predict_stages_and_model_gauges(tmp_path: Path):
+    api_main = _api(tmp_path)
+    _promote_dummy(tmp_path, "r1")
+
+    with TestClient(api_main.app) as client:
+        assert client.post("/predict", json={"features": [0.0] * 8}).status_code == 200
+        assert client.post("/predict", json={"features": [0.0] * 8}).status_code == 200
+        assert client.post("/predict", json={"features": [0.0] * 3}).status_code == 400
+        text = client.get("/metrics").text
+
+    stage = api_main._STAGE_LATENCY
+    assert stage.snapshot(stage="load")["count"] == 1
+    assert stage.snapshot(stage="lookup")["count"] == 3
+    assert stage.snapshot(stage="validation")["count"] == 3
+    assert stage.snapshot(stage="inference")["count"] == 2
+
+    current = Path(os.environ["BALANCEOPS_CURRENT_MODEL"])
+    assert 'balanceops_model_info{run_id="r1"} 1' in text
+    assert "balanceops_model_load_count 1" in text
+    assert f"balanceops_model_file_size_bytes {current.stat().st_size}" in text
+    assert 'balanceops_predict_stage_seconds_count{stage="inference"} 2' in text
+    assert 'balanceops_http_requests_total{route="/predict",method="POST",status="400"} 1' in text
+
+
+def test_gauge_clear_drops_previous_labels():
+    g = Gauge("g", "help", ["run_id"])
+    g.set(1, run_id="a")
+    g.clear()
+    g.set(1, run_id="b")
+    assert g.get(run_id="a") == 0.0
+    assert [line for line in g.render() if not line.startswith("#")] == ['g{run_id="b"} 1']
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import balanceops.tracking.async_client as async_client
+from balanceops.tracking.async_client import AsyncTrackingClient, replay_spill_file
+from balanceops.tracking.history import get_metric_series
+from balanceops.tracking.init_db import init_db
+from balanceops.tracking.read import get_run_detail
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> str:
+    p = str(tmp_path / "balanceops.db")
+    init_db(p)
+    return p
+
+
+@pytest.fixture
+def gate(monkeypatch: pytest.MonkeyPatch) -> threading.Event:
+    """set()하기 전까지 writer의 배치 기록을 막는다(느린 디스크 흉내)."""
+    ev = threading.Event()
+    orig = async_client._write_ops
+
+    def slow_write(con, ops):
+        ev.wait(10)
+        orig(con, ops)
+
+    monkeypatch.setattr(async_client, "_write_ops", slow_write)
+    return ev
+
+
+def test_writes_run_metrics_history_and_artifacts(db: str):
+    with AsyncTrackingClient(db, linger_s=0.01) as client:
+        assert client.create_run("r1", {"lr": 0.1}, note="async")
+        for epoch, loss in enumerate([0.9, 0.5, 0.3]):
+            client.log_metric("r1", "loss", loss, step=epoch)
+        client.log_metrics("r1", {"acc": 0.8, "f1": 0.7})
+        client.log_artifact("r1", "model", "artifacts/r1/model.joblib")
+        assert client.flush(timeout=5)
+
+        detail = get_run_detail(db, run_id="r1")
+        assert detail["metrics"] == {"acc": 0.8, "f1": 0.7, "loss": 0.3}
+        assert get_metric_series(db, "r1", "loss")["value"] == [0.9, 0.5, 0.3]
+
+    stats = client.stats()
+    assert stats["queued"] == stats["written"] == 7 and stats["error"] == 0
+    with pytest.raises(RuntimeError):
+        client.log_metric("r1", "loss", 0.1)
+    with pytest.raises(ValueError):
+        AsyncTrackingClient(db, policy="retry")
+
+
+def test_drop_policy_never_blocks(db: str, gate: threading.Event):
+    client = AsyncTrackingClient(db, capacity=2, batch_size=1, linger_s=0, policy="drop")
+    assert client.create_run("r1", {})
+    results = [client.log_metric("r1", f"m{i}", float(i)) for i in range(20)]
+    gate.set()
+    assert client.close(timeout=5)
+
+    kept = sum(results)
+    assert not all(results) and client.stats()["dropped"] == 20 - kept
+    assert len(get_run_detail(db, run_id="r1")["metrics"]) == kept
+
+
+def test_spill_policy_keeps_every_op_in_order(db: str, tmp_path: Path, gate: threading.Event):
+    spill_dir = tmp_path / "spill"
+    client = AsyncTrackingClient(
+        db, capacity=2, batch_size=3, linger_s=0, policy="spill", spill_dir=spill_dir
+    )
+    client.create_run("r1", {})
+    for step in range(50):
+        assert client.log_metric("r1", "loss", float(step), step=step)
+    assert client.stats()["spilling"] and list(spill_dir.glob("*.ndjson"))
+
+    gate.set()
+    assert client.flush(timeout=10)
+    assert client.close(timeout=5)
+
+    stats = client.stats()
+    assert stats["spilled"] > 0 and stats["written"] == 51 and not stats["spilling"]
+    assert get_metric_series(db, "r1", "loss")["value"] == [float(s) for s in range(50)]
+    assert get_run_detail(db, run_id="r1")["metrics"] == {"loss": 49.0}
+    assert not list(spill_dir.glob("*.ndjson"))
+
+
+def test_corrupt_spill_record_is_skipped_and_writer_survives(
+    db: str, tmp_path: Path, gate: threading.Event
+):
+    client = AsyncTrackingClient(
+        db, capacity=2, batch_size=3, linger_s=0, policy="spill", spill_dir=tmp_path / "spill"
+    )
+    client.create_run("r1", {})
+    for step in range(20):
+        client.log_metric("r1", "loss", float(step), step=step)
+
+    # 디스크에 쓰인 첫 spill 레코드를 깨뜨린다
+    with client._lock:
+        client._spill_fh.flush()
+        with client._spill_path.open("r+b") as f:
+            f.write(b"#")
+    gate.set()
+    assert client.flush(timeout=10)
+
+    stats = client.stats()
+    assert stats["error"] == 1 and stats["written"] == 20
+    assert "corrupt" in stats["last_error"]
+    assert len(get_metric_series(db, "r1", "loss")["step"]) == 19
+
+    # writer는 계속 동작
+    assert client.log_metric("r1", "acc", 0.5)
+    assert client.close(timeout=5)
+    assert get_run_detail(db, run_id="r1")["metrics"]["acc"] == 0.5
+
+
+def test_integrity_error_only_loses_the_bad_op(db: str):
+    with AsyncTrackingClient(db, linger_s=0.2) as client:
+        client.create_run("r1", {})
+        client.create_run("r1", {})  # 같은 run_id → 이 op만 실패
+        client.log_metric("r1", "acc", 0.9)
+
+    stats = client.stats()
+    assert stats["written"] == 2 and stats["error"] == 1
+    assert "IntegrityError" in (stats["last_error"] or "")
+    assert get_run_detail(db, run_id="r1")["metrics"] == {"acc": 0.9}
+
+
+def test_replay_spill_file(db: str, tmp_path: Path):
+    path = tmp_path / "left.ndjson"
+    ops = [["history", "r1", "loss", s, 1.0 + s, 0.5 / (s + 1)] for s in range(5)]
+    path.write_text("".join(json.dumps(op) + "\n" for op in ops), encoding="utf-8")
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write("{not json\n")
+        f.write('["history", "r1", "loss", 5, 6.0')  # 비정상 종료로 잘린 마지막 줄
+
+    assert replay_spill_file(db, path, batch_size=2) == 5
+    assert get_metric_series(db, "r1", "loss")["step"] == [0, 1, 2, 3, 4]
+    assert not path.exists()
+
+
+def test_tracking_does_not_import_serving():
+    code = (
+        "import sys, balanceops.tracking.async_client; "
+        "sys.exit(any(m.startswith('balanceops.serving') for m in sys.modules))"
+    )
+    src = str(Path(async_client.__file__).resolve().parents[2])
+    env = {**os.environ, "PYTHONPATH": src}
+    assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import balanceops.common.gitinfo as gitinfo
+import balanceops.common.version as version
+from balanceops.common.gitinfo import GitInfo
+
+
+@pytest.fixture()
+def git_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def _fake_run(cmd: list[str]) -> str:
+        calls.append(cmd)
+        if cmd[-1] == "--porcelain":
+            return ""
+        return "main" if "--abbrev-ref" in cmd else "abc123"
+
+    monkeypatch.setattr(gitinfo, "_run", _fake_run)
+    monkeypatch.setattr(gitinfo, "_CACHED", None)
+    monkeypatch.setattr(version, "_BUILD_INFO", None)
+    monkeypatch.delenv("BALANCEOPS_BUILD_INFO", raising=False)
+    return calls
+
+
+def test_build_info_runs_git_once_per_process(git_calls: list[list[str]]) -> None:
+    b1 = version.get_build_info()
+    b2 = version.get_build_info()
+    gitinfo.get_git_info()
+
+    assert b1 == b2
+    assert b1["git"] == {"commit": "abc123", "branch": "main", "dirty": False}
+    assert len(git_calls) == 3
+
+    version.get_build_info(refresh=True)
+    assert len(git_calls) == 6
+
+
+def test_baked_build_info_file_skips_git(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, git_calls: list[list[str]]
+) -> None:
+    p = version.write_build_info(
+        tmp_path / "build_info.json", GitInfo(commit="deadbeef", branch="release", dirty=False)
+    )
+    assert json.loads(p.read_text(encoding="utf-8"))["git"]["commit"] == "deadbeef"
+
+    monkeypatch.setenv("BALANCEOPS_BUILD_INFO", str(p))
+
+    info = version.get_build_info()
+    assert info["git"] == {"commit": "deadbeef", "branch": "release", "dirty": False}
+    assert git_calls == []
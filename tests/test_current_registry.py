@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
 from pathlib import Path
 
 import joblib
@@ -16,7 +17,7 @@ def _set_env(tmp_path: Path) -> None:
     )
 
 
-def test_get_current_model_info_closes_connection(monkeypatch, tmp_path: Path):
+def test_get_current_model_info_releases_connection(monkeypatch, tmp_path: Path):
     _set_env(tmp_path)
 
     class FakeCon:
@@ -42,10 +43,13 @@ def test_get_current_model_info_closes_connection(monkeypatch, tmp_path: Path):
 
     fake_con = FakeCon()
 
-    def fake_connect(_db_path: str):
-        return fake_con
+    # 연결은 스레드별 pool에서 빌려오고, 조회가 끝나면 반환(닫지는 않음)
+    @contextmanager
+    def fake_pooled_connection(_db_path: str):
+        yield fake_con
+        fake_con.closed = True
 
-    monkeypatch.setattr(cur, "connect", fake_connect)
+    monkeypatch.setattr(cur, "pooled_connection", fake_pooled_connection)
 
     info = cur.get_current_model_info()
     assert info["run_id"] == "r1"
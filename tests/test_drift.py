@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.models.feature_stats import FeatureStats
+from balanceops.registry.promote import promote_run
+from balanceops.serving.drift import DriftMonitor
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.tracking.init_db import init_db
+
+
+def _reference(seed: int = 0, n: int = 5000) -> tuple[np.ndarray, FeatureStats]:
+    X = np.random.default_rng(seed).normal(size=(n, 3))
+    return X, FeatureStats.from_data(X, names=["a", "b", "c"])
+
+
+def test_feature_stats_round_trip_and_decile_bins():
+    X, stats = _reference()
+    again = FeatureStats.from_dict(stats.to_dict())
+
+    assert again.names == ["a", "b", "c"] and again.count == 5000
+    np.testing.assert_allclose(again.mean, X.mean(axis=0))
+    assert all(abs(p - 0.1) < 0.01 for probs in again.bin_probs for p in probs)
+
+
+def test_streaming_stats_match_batch_and_psi_flags_shift():
+    X, stats = _reference()
+    mon = DriftMonitor()
+    mon.reset(stats, "r1")
+
+    same = np.random.default_rng(1).normal(size=(4000, 3))
+    for chunk in np.array_split(same, 37):  # 요청 단위로 나눠 누적
+        mon.observe(chunk, "r1")
+    snap = mon.snapshot()
+    assert snap["n"] == 4000
+    a = snap["features"][0]
+    assert abs(a["mean"] - same[:, 0].mean()) < 1e-9
+    assert abs(a["std"] - same[:, 0].std()) < 1e-9
+    assert all(f["psi"] < 0.02 and f["ks"] < 0.05 for f in snap["features"])
+
+    shifted = same.copy()
+    shifted[:, 1] += 1.0
+    mon.reset(stats, "r1")
+    mon.observe(shifted, "r1")
+    b = mon.snapshot()["features"]
+    assert b[1]["psi"] > 0.5 and b[1]["ks"] > 0.3
+    assert abs(b[1]["mean_shift"] - 1.0) < 0.1
+    assert b[0]["psi"] < 0.02
+
+
+def test_observe_ignores_other_models_and_missing_reference():
+    _, stats = _reference()
+    reg = MetricsRegistry()
+    mon = DriftMonitor(metrics=reg)
+    assert mon.observe(np.zeros((2, 3)), "r1") == 0
+
+    mon.reset(stats, "r1")
+    assert mon.observe(np.zeros((2, 3)), "r2") == 0
+    assert mon.observe(np.zeros((2, 4)), "r1") == 0
+    assert mon.observe([[0.0, np.nan, 0.0], [0.0, 0.0, 0.0]], "r1") == 1
+
+    mon.snapshot()
+    assert 'balanceops_feature_drift_psi{feature="a"}' in reg.render()
+
+
+def test_api_reports_drift_against_wrapper_feature_stats(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    init_db(str(tmp_path / "balanceops.db"))
+
+    X_train = np.random.default_rng(0).normal(size=(2000, 8))
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(
+        {
+            "model": DummyBalanceModel(seed=1, w=np.zeros(8), b=0.0),
+            "feature_names": [f"f{i}" for i in range(8)],
+            "feature_stats": FeatureStats.from_data(X_train).to_dict(),
+        },
+        cand,
+    )
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        assert client.get("/drift").json()["n"] == 0
+
+        rows = np.random.default_rng(1).normal(size=(200, 8))
+        rows[:, 3] += 2.0
+        client.post("/predict", json={"features": rows[0].tolist()})
+        client.post("/predict/batch", json={"rows": rows[1:].tolist()})
+
+        body = client.get("/drift").json()
+        assert body["enabled"] is True and body["run_id"] == "r1" and body["n"] == 200
+        psi = {f["name"]: f["psi"] for f in body["features"]}
+        assert psi["f3"] > 1.0 and psi["f0"] < 0.2
+        assert 'balanceops_feature_drift_psi{feature="f3"}' in client.get("/metrics").text
+
+
+def test_drift_without_reference_stats_reports_no_reference(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    init_db(str(tmp_path / "balanceops.db"))
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=0.0), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        client.post("/predict", json={"features": [0.0] * 8})
+        body = client.get("/drift").json()
+        assert body["enabled"] is True and body["reference"] is False
+
+    monkeypatch.setenv("BALANCEOPS_DRIFT_MONITOR", "0")
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        assert client.get("/drift").json() == {"enabled": False}
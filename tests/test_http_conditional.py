@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.pipeline.demo_run import main as demo_main
+from balanceops.registry.promote import promote_run
+from balanceops.serving.http_cache import etag_matches
+from balanceops.tracking.init_db import init_db
+from balanceops.tracking.log_run import log_metric
+from balanceops.tracking.read import get_tracking_generation
+
+
+@pytest.fixture()
+def api(tmp_path: Path):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    return api_main
+
+
+def test_etag_matches_handles_lists_weak_and_star():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"x"')
+    assert not etag_matches('"a"', '"b"') and not etag_matches(None, '"b"')
+
+
+def test_generation_counter_bumps_on_tracking_writes(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    init_db(db)  # 재실행해도 카운터 유지
+    g0 = get_tracking_generation(db)[0]
+    log_metric(db, "r1", "acc", 0.5)
+    log_metric(db, "r1", "acc", 0.6)  # upsert(UPDATE)도 반영
+    assert get_tracking_generation(db)[0] >= g0 + 2
+
+
+def test_runs_answers_304_and_serves_cached_body(
+    tmp_path: Path, api, monkeypatch: pytest.MonkeyPatch
+):
+    demo_main()
+    calls: list[int] = []
+    real = api.list_runs_summary
+
+    def _counting(*args, **kwargs):
+        calls.append(1)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(api, "list_runs_summary", _counting)
+    client = TestClient(api.app)
+
+    r1 = client.get("/runs")
+    etag = r1.headers["etag"]
+    assert r1.status_code == 200 and r1.json()["count"] == 1
+    assert r1.headers["last-modified"].endswith("GMT")
+
+    r2 = client.get("/runs", headers={"If-None-Match": etag})
+    assert r2.status_code == 304 and r2.content == b""
+    assert client.get("/runs").json() == r1.json()  # validator가 같으면 캐시된 본문
+    assert len(calls) == 1
+
+    # 파라미터가 다르면 다른 validator
+    assert client.get("/runs", params={"limit": 5}).headers["etag"] != etag
+
+    demo_main()  # 새 run → generation 증가
+    r3 = client.get("/runs", headers={"If-None-Match": etag})
+    assert r3.status_code == 200 and r3.json()["count"] == 2
+    assert api._HTTP_CACHE.get("/runs", etag) is not None  # 예전 항목은 LRU로만 밀려남
+
+
+def test_model_and_latest_etags_follow_promotion(tmp_path: Path, api):
+    client = TestClient(api.app)
+    assert client.get("/runs/latest").status_code == 404
+
+    r = client.get("/model")
+    assert r.json() == {}
+    etag = r.headers["etag"]
+
+    cand = tmp_path / "cand.joblib"
+    cand.write_bytes(b"x")
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    r2 = client.get("/model", headers={"If-None-Match": etag})
+    assert r2.status_code == 200 and r2.json()["run_id"] == "r1"
+
+    demo_main()
+    latest = client.get("/runs/latest")
+    assert latest.status_code == 200
+    r3 = client.get("/runs/latest", headers={"If-Modified-Since": latest.headers["last-modified"]})
+    assert r3.status_code == 304
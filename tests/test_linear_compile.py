@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.serving.compile import LinearScorer, compile_model, source_model
+
+
+def _data(seed: int = 0, n: int = 200, f: int = 6) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    X = rng.normal(loc=3.0, scale=[0.5, 1.0, 2.0, 5.0, 0.1, 10.0][:f], size=(n, f))
+    y = (X @ rng.normal(size=f) + rng.normal(size=n) > np.median(X @ rng.normal(size=f))).astype(
+        int
+    )
+    return X, y
+
+
+@pytest.mark.parametrize(
+    "scaler",
+    [StandardScaler(), StandardScaler(with_mean=False), StandardScaler(with_std=False)],
+)
+def test_pipeline_scaler_logistic_parity(scaler: StandardScaler) -> None:
+    X, y = _data()
+    model = Pipeline([("scaler", scaler), ("clf", LogisticRegression(max_iter=1000))])
+    model.fit(X, y)
+
+    compiled = compile_model(model)
+    assert isinstance(compiled, LinearScorer)
+    assert compiled.n_features_in_ == X.shape[1]
+    assert source_model(compiled) is model
+
+    X_new, _ = _data(seed=1, n=50)
+    np.testing.assert_allclose(
+        compiled.predict_proba(X_new), model.predict_proba(X_new), atol=1e-12
+    )
+    np.testing.assert_allclose(
+        compiled.predict_proba([X_new[0].tolist()]), model.predict_proba([X_new[0]]), atol=1e-12
+    )
+
+
+def test_bare_logistic_parity_with_string_labels() -> None:
+    X, y = _data(seed=2)
+    labels = np.where(y == 1, "win", "lose")
+    model = LogisticRegression(max_iter=1000).fit(X, labels)
+
+    compiled = compile_model(model)
+    assert isinstance(compiled, LinearScorer)
+    np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), atol=1e-12)
+
+
+def test_dummy_model_parity_including_width_adaptation() -> None:
+    rng = np.random.default_rng(3)
+    model = DummyBalanceModel(seed=3, w=rng.normal(size=8), b=0.3)
+
+    compiled = compile_model(model)
+    assert isinstance(compiled, LinearScorer)
+
+    for width in (8, 5, 11):
+        X = rng.normal(size=(20, width)) * 5
+        np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), atol=1e-12)
+
+
+def test_unsupported_models_fall_back_to_original() -> None:
+    X, y = _data(seed=4)
+    tree = DecisionTreeClassifier(max_depth=2).fit(X, y)
+    assert compile_model(tree) is tree
+
+    y3 = np.arange(len(y)) % 3
+    multi = LogisticRegression(max_iter=1000).fit(X, y3)
+    assert compile_model(multi) is multi
+
+    other = Pipeline([("clf", LogisticRegression(max_iter=1000))]).fit(X, y)
+    assert compile_model(other) is other
+
+
+def test_shape_mismatch_delegates_to_source_model() -> None:
+    X, y = _data(seed=5)
+    model = Pipeline([("scaler", StandardScaler()), ("clf", LogisticRegression())]).fit(X, y)
+    compiled = compile_model(model)
+
+    with pytest.raises(ValueError):
+        compiled.predict_proba(np.zeros((1, X.shape[1] + 1)))
+
+
+@pytest.mark.parametrize("enabled", ["1", "0"])
+def test_api_uses_compiled_scorer_when_enabled(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, enabled: str
+) -> None:
+    import importlib
+
+    import joblib
+    from fastapi.testclient import TestClient
+
+    from balanceops.registry.promote import promote_run
+    from balanceops.tracking.init_db import init_db
+
+    monkeypatch.setenv("BALANCEOPS_DB", str(tmp_path / "balanceops.db"))
+    monkeypatch.setenv("BALANCEOPS_ARTIFACTS", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("BALANCEOPS_CURRENT_MODEL", str(tmp_path / "models" / "current.joblib"))
+    monkeypatch.setenv("BALANCEOPS_COMPILE_LINEAR", enabled)
+    init_db(str(tmp_path / "balanceops.db"))
+
+    cand = tmp_path / "cand.joblib"
+    joblib.dump(DummyBalanceModel(seed=1, w=np.linspace(-1, 1, 8), b=0.2), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+
+    with TestClient(api_main.app) as client:
+        v = client.get("/version").json()
+        assert v["model_type"] == "DummyBalanceModel"
+        assert v["model_compiled"] is (enabled == "1")
+
+        p = client.post("/predict", json={"features": [1.0] * 8}).json()["p_win"]
+        expected = 1.0 / (1.0 + np.exp(-(np.linspace(-1, 1, 8).sum() + 0.2)))
+        assert abs(p - expected) < 1e-12
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import importlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.tools import bench_metric_history
+from balanceops.tracking.history import (
+    get_metric_series,
+    list_metric_history_keys,
+    log_metric_history,
+    lttb_indices,
+)
+from balanceops.tracking.init_db import init_db
+from balanceops.tracking.log_run import RunContext
+from balanceops.tracking.read import get_run_detail
+
+
+def _walk(n: int, seed: int = 0) -> np.ndarray:
+    return np.cumsum(np.random.default_rng(seed).normal(size=n))
+
+
+def test_append_and_small_series_is_returned_as_is(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    assert log_metric_history(db, "r1", "loss", [3.0, 2.0], timestamps=[10.0, 11.0]) == 2
+    log_metric_history(db, "r1", "loss", [1.0])  # 다음 step(2)부터 이어서
+    log_metric_history(db, "r1", "acc", [0.5, 0.7], steps=[10, 20])
+
+    assert list_metric_history_keys(db, "r1") == [
+        {"key": "acc", "points": 2},
+        {"key": "loss", "points": 3},
+    ]
+    s = get_metric_series(db, "r1", "loss")
+    assert s["step"] == [0, 1, 2] and s["value"] == [3.0, 2.0, 1.0]
+    assert s["ts"][:2] == [10.0, 11.0] and not s["downsampled"]
+    assert get_metric_series(db, "r1", "acc", start_step=15)["step"] == [20]
+    assert get_metric_series(db, "r1", "nope") is None
+
+    with pytest.raises(ValueError):
+        log_metric_history(db, "r1", "loss", [float("nan")])
+
+
+@pytest.mark.parametrize("start,end", [(None, None), (1234, 150_000), (100, 5_000)])
+def test_minmax_keeps_extremes_within_max_points(tmp_path: Path, start, end):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    v = _walk(200_000)
+    v[777], v[123_456] = 1e6, -1e6  # 스파이크
+    for i in range(0, len(v), 50_000):
+        log_metric_history(db, "r1", "loss", v[i : i + 50_000])
+
+    s = get_metric_series(db, "r1", "loss", max_points=500, start_step=start, end_step=end)
+    lo, hi = s["start_step"], s["end_step"]
+    window = v[lo : hi + 1]
+    st = np.array(s["step"])
+
+    assert s["total"] == len(window) and s["downsampled"]
+    assert s["count"] <= 500 and np.all(np.diff(st) > 0)
+    assert np.allclose(s["value"], v[st])  # 실제 기록된 점만 반환
+    assert window.max() in s["value"] and window.min() in s["value"]
+
+
+def test_lttb_and_overwrite_recomputes_rollup(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    v = _walk(50_000)
+    log_metric_history(db, "r1", "loss", v)
+
+    s = get_metric_series(db, "r1", "loss", max_points=300, method="lttb")
+    assert s["count"] == 300 and s["step"][0] == 0 and s["step"][-1] == 49_999
+
+    # 이미 있는 step을 덮어쓰면 rollup(min/max)도 다시 계산
+    log_metric_history(db, "r1", "loss", [1e9], steps=[40_000])
+    assert max(get_metric_series(db, "r1", "loss", max_points=100)["value"]) == 1e9
+    log_metric_history(db, "r1", "loss", [v[40_000]], steps=[40_000])
+    assert max(get_metric_series(db, "r1", "loss", max_points=100)["value"]) == v.max()
+    assert list_metric_history_keys(db, "r1")[0]["points"] == 50_000
+
+    assert lttb_indices(np.arange(10.0), np.zeros(10), 20).tolist() == list(range(10))
+
+
+def test_run_context_logs_steps(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    with RunContext(db, "r1", params={}) as run:
+        for epoch, loss in enumerate([0.9, 0.5, 0.3]):
+            run.log_metric("loss", loss, step=epoch)
+
+    assert get_run_detail(db, run_id="r1")["metrics"] == {"loss": 0.3}
+    assert get_metric_series(db, "r1", "loss")["value"] == [0.9, 0.5, 0.3]
+
+
+def test_history_api(tmp_path: Path):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    db = os.environ["BALANCEOPS_DB"]
+    init_db(db)
+    log_metric_history(db, "r1", "val/loss", _walk(5_000))
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    client = TestClient(api_main.app)
+
+    keys = client.get("/runs/r1/history").json()
+    assert keys["items"] == [{"key": "val/loss", "points": 5_000}]
+
+    r = client.get("/runs/r1/history", params={"key": "val/loss", "max_points": 100})
+    body = r.json()
+    assert r.status_code == 200 and body["count"] <= 100 and body["total"] == 5_000
+    assert len(body["step"]) == len(body["value"]) == body["count"]
+
+    r = client.get("/runs/r1/history", params={"key": "missing"})
+    assert r.status_code == 404 and r.json()["error"]["code"] == "METRIC_NOT_FOUND"
+    assert client.get("/runs/r1/history", params={"key": "x", "method": "avg"}).status_code == 422
+
+
+def test_bench_metric_history_smoke(tmp_path: Path):
+    db = str(tmp_path / "bench.db")
+    init_db(db)
+    bench_metric_history.populate(db, 5_000, chunk=1_000)
+    results = bench_metric_history.run_bench(db, n=5_000, max_points=100, repeat=1)
+    assert [r["case"] for r in results][0] == "raw full scan"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving.batching import MicroBatcher
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.tracking.init_db import init_db
+
+
+class _CountingModel:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=float)
+        self.calls.append(int(X.shape[0]))
+        p = 1.0 / (1.0 + np.exp(-X.sum(axis=1)))
+        return np.stack([1.0 - p, p], axis=1)
+
+
+def test_microbatcher_groups_concurrent_rows_into_one_call():
+    model = _CountingModel()
+    reg = MetricsRegistry()
+
+    async def _main() -> list[float]:
+        b = MicroBatcher(max_batch_size=64, max_wait_ms=50.0, metrics=reg)
+        await b.start()
+        try:
+            rows = [[float(i), 0.0] for i in range(10)]
+            return await asyncio.gather(*(b.submit(model, r) for r in rows))
+        finally:
+            await b.stop()
+
+    out = asyncio.run(_main())
+
+    assert model.calls == [10]
+    expected = 1.0 / (1.0 + np.exp(-np.arange(10, dtype=float)))
+    assert np.allclose(out, expected)
+
+    snap = reg.histogram("balanceops_microbatch_size", "").snapshot()
+    assert snap["count"] == 1
+    assert snap["sum"] == 10
+    assert reg.histogram("balanceops_microbatch_queue_wait_seconds", "").snapshot()["count"] == 10
+
+
+def test_microbatcher_respects_max_batch_size():
+    model = _CountingModel()
+
+    async def _main() -> None:
+        b = MicroBatcher(max_batch_size=4, max_wait_ms=50.0)
+        await b.start()
+        try:
+            await asyncio.gather(*(b.submit(model, [0.0]) for _ in range(10)))
+        finally:
+            await b.stop()
+
+    asyncio.run(_main())
+    assert sum(model.calls) == 10
+    assert max(model.calls) <= 4
+
+
+def test_microbatcher_propagates_model_errors():
+    class _Broken:
+        def predict_proba(self, X):
+            raise ValueError("boom")
+
+    async def _main() -> None:
+        b = MicroBatcher(max_batch_size=8, max_wait_ms=1.0)
+        await b.start()
+        try:
+            await b.submit(_Broken(), [0.0])
+        finally:
+            await b.stop()
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(_main())
+
+
+def test_predict_with_microbatch_enabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    monkeypatch.setenv("BALANCEOPS_MICROBATCH", "1")
+    monkeypatch.setenv("BALANCEOPS_MICROBATCH_MAX_WAIT_MS", "5")
+
+    init_db(str(tmp_path / "balanceops.db"))
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1_dummy.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    w = np.linspace(-1.0, 1.0, 8)
+    joblib.dump(DummyBalanceModel(seed=1, w=w, b=0.0), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+
+    rows = np.random.default_rng(0).normal(size=(16, 8)).tolist()
+
+    with TestClient(api_main.app) as client:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            resps = list(ex.map(lambda r: client.post("/predict", json={"features": r}), rows))
+
+        for row, r in zip(rows, resps):
+            assert r.status_code == 200
+            expected = 1.0 / (1.0 + np.exp(-(np.asarray(row) @ w)))
+            assert abs(r.json()["p_win"] - expected) < 1e-9
+
+        bad = client.post("/predict", json={"features": [0.0] * 3})
+        assert bad.status_code == 400
+        assert bad.json()["error"]["code"] == "FEATURE_SIZE_MISMATCH"
+
+        m = client.get("/metrics")
+        assert m.status_code == 200
+        assert "balanceops_microbatch_size_bucket" in m.text
+        assert "balanceops_microbatch_queue_wait_seconds_count 16" in m.text
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.artifacts import copy_atomic, dump_model, load_model
+from balanceops.registry.promote import promote_run
+from balanceops.serving.compile import LinearScorer, compile_model
+from balanceops.tracking.init_db import init_db
+
+
+def _model(b: float = 0.0) -> DummyBalanceModel:
+    return DummyBalanceModel(seed=1, w=np.linspace(-1.0, 1.0, 8), b=b)
+
+
+def test_dumped_artifact_loads_as_read_only_memmap(tmp_path: Path):
+    path = dump_model({"model": _model()}, tmp_path / "m" / "cand.joblib")
+    loaded = load_model(path, mmap=True)["model"]
+
+    assert isinstance(loaded.w, np.memmap)
+    assert not loaded.w.flags.writeable
+    np.testing.assert_allclose(
+        loaded.predict_proba([[0.5] * 8]), _model().predict_proba([[0.5] * 8])
+    )
+
+    # 컴파일된 scorer도 복사 없이 같은 매핑을 사용
+    scorer = compile_model(loaded)
+    assert isinstance(scorer, LinearScorer)
+    assert np.shares_memory(scorer.weights, loaded.w)
+
+    # 일반 로딩도 복사하지 않고 읽기 전용 view만 만든다(원본 배열은 그대로 쓰기 가능)
+    plain = load_model(path)["model"]
+    weights = compile_model(plain).weights
+    assert np.shares_memory(weights, plain.w)
+    assert not weights.flags.writeable and plain.w.flags.writeable
+
+
+def test_copy_atomic_replaces_with_new_file_and_leaves_no_temp(tmp_path: Path):
+    a = dump_model(_model(b=1.0), tmp_path / "a.joblib")
+    b = dump_model(_model(b=2.0), tmp_path / "b.joblib")
+    dst = tmp_path / "models" / "current.joblib"
+
+    copy_atomic(a, dst)
+    held = load_model(dst, mmap=True)  # 서빙 중인 worker의 매핑
+    ino = dst.stat().st_ino
+
+    copy_atomic(b, dst)
+    assert dst.stat().st_ino != ino  # 제자리 덮어쓰기가 아닌 교체
+    assert held.b == 1.0 and held.w[0] == -1.0  # 기존 매핑은 예전 파일을 계속 본다
+    assert load_model(dst).b == 2.0
+    assert sorted(p.name for p in dst.parent.iterdir()) == ["current.joblib"]
+
+
+def test_api_serves_mmap_loaded_model(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    monkeypatch.setenv("BALANCEOPS_MODEL_MMAP", "1")
+    init_db(str(tmp_path / "balanceops.db"))
+
+    cand = dump_model(_model(b=0.3), tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib")
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        r = client.post("/predict", json={"features": [0.5] * 8})
+        assert r.status_code == 200
+        expected = _model(b=0.3).predict_proba([[0.5] * 8])[0][1]
+        assert abs(r.json()["p_win"] - expected) < 1e-12
+
+    served = api_main._MODEL_CACHE.model
+    assert isinstance(served, LinearScorer)
+    assert not served.weights.flags.writeable
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.tracking.init_db import init_db
+
+
+def _set_env(tmp_path: Path) -> None:
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+
+
+def _promote(tmp_path: Path, run_id: str, obj: object) -> None:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(obj, cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={})
+
+
+def _wait_until(pred, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture()
+def bg_api(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _set_env(tmp_path)
+    monkeypatch.setenv("BALANCEOPS_MODEL_WATCH_INTERVAL_MS", "10")
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    return api_main
+
+
+def _p(client: TestClient) -> float:
+    r = client.post("/predict", json={"features": [0.0] * 8})
+    assert r.status_code == 200
+    return r.json()["p_win"]
+
+
+def test_old_model_serves_until_new_one_is_loaded(
+    tmp_path: Path, bg_api, monkeypatch: pytest.MonkeyPatch
+):
+    _promote(tmp_path, "r1", DummyBalanceModel(seed=1, w=np.zeros(8), b=-10.0))
+
+    with TestClient(bg_api.app) as client:
+        assert _wait_until(lambda: bg_api._MODEL_CACHE.run_id == "r1")
+        assert _p(client) < 0.01
+
+        gate = threading.Event()
+        loading = threading.Event()
+        real_load = joblib.load
+
+        def _gated_load(path, *args, **kwargs):
+            loading.set()
+            gate.wait(timeout=5.0)
+            return real_load(path, *args, **kwargs)
+
+        monkeypatch.setattr(bg_api.joblib, "load", _gated_load)
+
+        # promote는 파일 복사 후 DB를 갱신하므로, 그 사이 poll이 잡은 (r1, 새 mtime) 로딩이
+        # 먼저 시작될 수 있다. 포인터 대신 백그라운드 로딩 시작을 기다린다
+        _promote(tmp_path, "r2", DummyBalanceModel(seed=2, w=np.zeros(8), b=10.0))
+        assert loading.wait(timeout=5.0)
+
+        # 백그라운드 로딩 중: 요청 경로는 직전 모델로 즉시 응답
+        assert _p(client) < 0.01
+        assert bg_api._MODEL_CACHE.run_id == "r1"
+
+        gate.set()
+        assert _wait_until(lambda: bg_api._MODEL_CACHE.run_id == "r2")
+        assert _p(client) > 0.99
+
+
+def test_failed_swap_keeps_previous_model_and_reports_error(tmp_path: Path, bg_api):
+    _promote(tmp_path, "r1", DummyBalanceModel(seed=1, w=np.zeros(8), b=-10.0))
+
+    with TestClient(bg_api.app) as client:
+        assert _wait_until(lambda: bg_api._MODEL_CACHE.run_id == "r1")
+
+        # predict_proba가 없는 객체를 승격 → 로딩 실패
+        _promote(tmp_path, "r2", {"not": "a model"})
+        assert _wait_until(lambda: bg_api._MODEL_CACHE.last_error is not None)
+
+        assert _p(client) < 0.01
+        v = client.get("/version").json()
+        assert v["model_run_id"] == "r1"
+        assert "predict_proba" in v["model_swap_error"]
+
+
+def test_warm_up_runs_synthetic_batch():
+    import apps.api.main as api_main
+
+    class _Counting:
+        n_features_in_ = 5
+
+        def __init__(self) -> None:
+            self.shapes: list[tuple[int, ...]] = []
+
+        def predict_proba(self, X):
+            self.shapes.append(np.asarray(X).shape)
+            return np.zeros((len(X), 2))
+
+    m = _Counting()
+    api_main._warm_up(m)
+    assert m.shapes == [(api_main._WARMUP_ROWS, 5), (1, 5)]
+
+
+def test_sync_failed_swap_keeps_previous_model_with_backoff(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    _set_env(tmp_path)
+    monkeypatch.setenv("BALANCEOPS_MODEL_WATCH_INTERVAL_MS", "0")
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    _promote(tmp_path, "r1", DummyBalanceModel(seed=1, w=np.zeros(8), b=-10.0))
+
+    with TestClient(api_main.app) as client:
+        assert _p(client) < 0.01
+        _promote(tmp_path, "r2", {"not": "a model"})
+
+        # 깨진 새 아티팩트: 직전 모델로 계속 서빙, backoff 동안 다시 로딩하지 않음
+        assert _p(client) < 0.01
+        assert _p(client) < 0.01
+        assert api_main._MODEL_LOADS.get(result="error") == 1
+        assert api_main._MODEL_CACHE.run_id == "r1"
+        assert "predict_proba" in client.get("/version").json()["model_swap_error"]
+
+        # backoff가 지나면 재시도, 고쳐진 아티팩트로 교체
+        _promote(tmp_path, "r3", DummyBalanceModel(seed=3, w=np.zeros(8), b=10.0))
+        assert _p(client) > 0.99
+        assert api_main._MODEL_CACHE.last_error is None
+
+
+def test_transient_load_failure_is_retried_in_background(
+    tmp_path: Path, bg_api, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(bg_api, "_LOAD_RETRY_MIN_S", 0.05)
+    _promote(tmp_path, "r1", DummyBalanceModel(seed=1, w=np.zeros(8), b=-10.0))
+
+    real_load = joblib.load
+    fails = {"n": 2}
+
+    def _flaky_load(path, *args, **kwargs):
+        if fails["n"] > 0:
+            fails["n"] -= 1
+            raise OSError("transient read error")
+        return real_load(path, *args, **kwargs)
+
+    with TestClient(bg_api.app) as client:
+        assert _wait_until(lambda: bg_api._MODEL_CACHE.run_id == "r1")
+        monkeypatch.setattr(bg_api.joblib, "load", _flaky_load)
+
+        # 포인터는 한 번만 바뀌지만, 실패 후 backoff 간격으로 다시 로딩해 결국 교체
+        _promote(tmp_path, "r2", DummyBalanceModel(seed=2, w=np.zeros(8), b=10.0))
+        assert _wait_until(lambda: bg_api._MODEL_CACHE.run_id == "r2")
+        assert fails["n"] == 0 and _p(client) > 0.99
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.current import current_model_path_for
+from balanceops.registry.promote import promote_run
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.serving.model_cache import ModelLRU
+from balanceops.tracking.init_db import init_db
+
+
+def _lru(max_bytes: int = 100, max_entries: int = 10) -> tuple[ModelLRU, MetricsRegistry]:
+    reg = MetricsRegistry()
+    return ModelLRU(max_bytes=max_bytes, max_entries=max_entries, metrics=reg), reg
+
+
+def test_rarely_used_model_does_not_evict_hot_one():
+    lru, reg = _lru(max_bytes=100)
+    assert lru.put("hot", "H", 60)
+    assert lru.get("hot") == "H"  # 두 번째 조회 → protected
+
+    assert not lru.put("rare", "R", 50)
+    assert lru.keys() == ["hot"]
+    assert reg.counter("balanceops_model_cache_admission_rejected_total", "").get() == 1
+
+
+def test_hot_model_survives_alternating_cold_loads():
+    lru, reg = _lru(max_bytes=100)
+    lru.put("hot", "H", 60)
+    for _ in range(3):
+        lru.get("hot")
+
+    # 서버 흐름: get miss → 로딩 → put. cold 모델이 hot과 번갈아 계속 로딩돼도
+    # hot보다 자주 쓰이지 않는 한 hot을 밀어내지 못한다
+    for _ in range(20):
+        assert lru.get("cold") is None
+        assert not lru.put("cold", "C", 50)
+        assert lru.get("hot") == "H"
+
+    assert lru.keys() == ["hot"] and lru.bytes == 60
+    assert reg.counter("balanceops_model_cache_readmitted_total", "").get() == 0
+    assert reg.counter("balanceops_model_cache_admission_rejected_total", "").get() == 20
+
+
+def test_rejected_model_is_admitted_once_more_frequent_than_victim():
+    lru, reg = _lru(max_bytes=100)
+    lru.put("hot", "H", 60)
+    lru.get("hot")  # protected, 빈도 2
+
+    assert not lru.put("rare", "R", 50)  # 첫 로딩: 거절(ghost로 빈도를 센다)
+    assert lru.get("rare") is None
+    assert not lru.put("rare", "R", 50)  # 빈도 2: hot(2)을 넘지 못함
+    assert lru.get("rare") is None
+    assert lru.put("rare", "R", 50)  # 빈도 3 > 2 → hot을 내보내고 admit
+
+    assert lru.keys() == ["rare"] and lru.bytes == 50
+    assert reg.counter("balanceops_model_cache_readmitted_total", "").get() == 1
+    assert lru.get("rare") == "R"
+
+
+def test_frequency_counts_are_aged():
+    lru, _ = _lru(max_bytes=100, max_entries=1)
+    lru.put("hot", "H", 60)
+    for _ in range(lru.age_every):
+        lru.get("hot")
+    # age_every번 조회마다 빈도가 절반 → 오래전에만 자주 쓰인 모델은 결국 밀려난다
+    assert lru._freq["hot"] == (1 + lru.age_every) // 2
+
+
+def test_probation_entries_are_evicted_lru_first():
+    lru, reg = _lru(max_bytes=100)
+    lru.put("a", "A", 40)
+    lru.put("b", "B", 40)
+    assert lru.put("c", "C", 40)
+
+    assert lru.peek("a") is None
+    assert set(lru.keys()) == {"b", "c"}
+    assert lru.bytes == 80
+    assert reg.counter("balanceops_model_cache_evictions_total", "").get() == 1
+
+
+def test_entry_limit_and_in_place_reload():
+    lru, _ = _lru(max_bytes=10_000, max_entries=2)
+    lru.put("a", "A1", 10)
+    lru.get("a")
+    lru.put("b", "B", 10)
+    lru.put("c", "C", 10)  # b(probation) 제거, a(protected) 유지
+    assert set(lru.keys()) == {"a", "c"}
+
+    assert lru.put("a", "A2", 30)  # 새 버전: 구간 유지한 채 교체
+    assert lru.get("a") == "A2"
+    assert lru.bytes == 40
+
+
+def test_protected_segment_is_capped_and_demotes_oldest():
+    lru, _ = _lru(max_bytes=100)
+    for k in ("a", "b"):
+        lru.put(k, k, 45)
+        lru.get(k)
+    # protected cap(80%) 초과 → 가장 오래된 a가 probation으로 강등
+    assert lru.keys() == ["b", "a"]
+    assert lru.put("c", "c", 40)
+    assert set(lru.keys()) == {"b", "c"}
+
+
+def _set_env(tmp_path: Path) -> None:
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+
+
+def _promote(tmp_path: Path, name: str, run_id: str, b: float) -> None:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{name}_{run_id}.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=b), cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={}, name=name)
+
+
+@pytest.fixture()
+def api(tmp_path: Path):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    return api_main
+
+
+def _p(client: TestClient, path: str) -> float:
+    r = client.post(path, json={"features": [0.0] * 8})
+    assert r.status_code == 200, r.text
+    return r.json()["p_win"]
+
+
+def test_named_routing_and_per_name_hot_reload(tmp_path: Path, api):
+    _promote(tmp_path, "balance_model", "d1", b=0.0)
+    _promote(tmp_path, "seg_a", "a1", b=-10.0)
+    _promote(tmp_path, "seg_b", "b1", b=10.0)
+
+    # 이름별 current 파일이 서로 덮어쓰지 않음
+    assert current_model_path_for("seg_a").exists()
+    assert current_model_path_for("seg_a") != current_model_path_for("balance_model")
+
+    with TestClient(api.app) as client:
+        assert abs(_p(client, "/predict") - 0.5) < 1e-12
+        assert _p(client, "/predict/seg_a") < 0.01
+        assert _p(client, "/predict/seg_b") > 0.99
+
+        _promote(tmp_path, "seg_a", "a2", b=10.0)
+        assert _p(client, "/predict/seg_a") > 0.99
+        assert abs(_p(client, "/predict") - 0.5) < 1e-12
+
+        r = client.post("/predict/nope", json={"features": [0.0] * 8})
+        assert r.status_code == 404
+        assert r.json()["error"]["code"] == "NO_CURRENT_MODEL"
+        assert r.json()["error"]["details"] == {"name": "nope"}
+
+    # 존재하지 않는 이름은 watcher를 만들지 않음
+    assert "nope" not in api._WATCHERS
+
+
+def test_named_cache_budget_keeps_hot_model(tmp_path: Path, api, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BALANCEOPS_MODEL_CACHE_MAX_MODELS", "1")
+    _promote(tmp_path, "hot", "h1", b=0.0)
+    _promote(tmp_path, "rare", "r1", b=0.0)
+
+    with TestClient(api.app) as client:
+        for _ in range(3):
+            _p(client, "/predict/hot")
+        _p(client, "/predict/rare")
+        _p(client, "/predict/hot")
+        text = client.get("/metrics").text
+
+    assert api._named_models().keys() == ["hot"]
+    assert api._MODEL_LOADS.get(result="ok") == 2
+    assert "balanceops_model_cache_admission_rejected_total 1" in text
+
+    # 거절된 모델은 hot(빈도 4)보다 자주 쓰일 때까지 캐시 없이 서빙되고,
+    # 빈도가 앞선 뒤에야 캐시에 들어가 이후에는 로딩하지 않는다
+    with TestClient(api.app) as client:
+        for _ in range(3):
+            _p(client, "/predict/rare")
+        assert api._named_models().keys() == ["hot"]
+        for _ in range(3):
+            _p(client, "/predict/rare")
+    assert api._named_models().keys() == ["rare"]
+    assert api._MODEL_LOADS.get(result="ok") == 6
+
+
+def test_unknown_names_are_negatively_cached(tmp_path: Path, api, monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+    real = api.get_current_model_info
+
+    def _counting(*args, **kwargs):
+        calls.append(kwargs.get("name", ""))
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(api, "get_current_model_info", _counting)
+    with TestClient(api.app) as client:
+        for _ in range(5):
+            assert client.post("/predict/nope", json={"features": [0.0] * 8}).status_code == 404
+        assert calls.count("nope") == 1
+
+        # TTL이 지나면 다시 확인 → 그 사이 승격된 이름은 바로 서빙
+        _promote(tmp_path, "nope", "n1", b=10.0)
+        monkeypatch.setitem(api._UNKNOWN_NAMES, "nope", 0.0)
+        assert _p(client, "/predict/nope") > 0.99
+
+
+def test_named_watchers_follow_background_mode(
+    tmp_path: Path, api, monkeypatch: pytest.MonkeyPatch
+):
+    import time
+
+    monkeypatch.setenv("BALANCEOPS_MODEL_WATCH_INTERVAL_MS", "10")
+    _promote(tmp_path, "seg_a", "a1", b=-10.0)
+
+    with TestClient(api.app) as client:
+        assert _p(client, "/predict/seg_a") < 0.01
+        assert api._get_watcher("seg_a").running
+
+        _promote(tmp_path, "seg_a", "a2", b=10.0)
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline and api._named_models().peek("seg_a").run_id != "a2":
+            time.sleep(0.01)
+        assert _p(client, "/predict/seg_a") > 0.99
+
+    assert api._WATCHERS == {}
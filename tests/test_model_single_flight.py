@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.tracking.init_db import init_db
+
+
+def _set_env(tmp_path: Path) -> None:
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+
+
+def _promote(tmp_path: Path, run_id: str, b: float) -> None:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}_dummy.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=b), cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={})
+
+
+@pytest.fixture()
+def slow_api(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+
+    real_load = joblib.load
+    calls: list[str] = []
+    gate = threading.Event()
+
+    def _slow_load(path, *args, **kwargs):
+        calls.append(str(path))
+        gate.wait(timeout=5.0)
+        return real_load(path, *args, **kwargs)
+
+    monkeypatch.setattr(api_main.joblib, "load", _slow_load)
+    return api_main, calls, gate
+
+
+def test_concurrent_cold_start_loads_once(tmp_path: Path, slow_api):
+    api_main, calls, gate = slow_api
+    _promote(tmp_path, "r1", 0.0)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futs = [ex.submit(api_main._get_model) for _ in range(8)]
+        time.sleep(0.1)
+        gate.set()
+        models = [f.result(timeout=5.0) for f in futs]
+
+    assert len(calls) == 1
+    assert all(m is models[0] for m in models)
+    assert api_main._MODEL_CACHE.load_count == 1
+    assert api_main._MODEL_LOADS.get(result="ok") == 1
+
+
+def test_followers_keep_serving_previous_model_during_reload(tmp_path: Path, slow_api):
+    api_main, calls, gate = slow_api
+    _promote(tmp_path, "r1", -10.0)
+    gate.set()
+    old = api_main._get_model()
+
+    gate.clear()
+    _promote(tmp_path, "r2", 10.0)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        leader = ex.submit(api_main._get_model)
+        time.sleep(0.1)
+        followers = [ex.submit(api_main._get_model) for _ in range(3)]
+        assert all(f.result(timeout=5.0) is old for f in followers)
+
+        gate.set()
+        new = leader.result(timeout=5.0)
+
+    assert new is not old
+    assert api_main._get_model() is new
+    assert len(calls) == 2
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.registry.watch import CurrentModelWatcher
+from balanceops.tracking.init_db import init_db
+
+
+def _set_env(tmp_path: Path) -> None:
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+
+
+def _promote(tmp_path: Path, run_id: str, b: float) -> None:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}_dummy.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=b), cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={})
+
+
+def _watcher(tmp_path: Path) -> CurrentModelWatcher:
+    return CurrentModelWatcher(
+        str(tmp_path / "balanceops.db"),
+        artifacts_dir=str(tmp_path / "artifacts"),
+        fallback_path=os.environ["BALANCEOPS_CURRENT_MODEL"],
+    )
+
+
+def test_watcher_requeries_only_when_data_version_changes(tmp_path: Path):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+    _promote(tmp_path, "r1", 0.0)
+
+    w = _watcher(tmp_path)
+    try:
+        assert w.poll().run_id == "r1"
+
+        statements: list[str] = []
+        w._connection().set_trace_callback(statements.append)
+
+        # 변경 없음: PRAGMA만 실행
+        assert w.poll().run_id == "r1"
+        assert not any("SELECT" in q.upper() for q in statements)
+
+        # 다른 커넥션이 promote → 다음 poll에서 다시 SELECT
+        _promote(tmp_path, "r2", 1.0)
+        assert w.poll().run_id == "r2"
+        assert any("FROM MODELS" in q.upper() for q in statements)
+    finally:
+        w.close()
+
+
+def test_watcher_returns_none_without_current(tmp_path: Path):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+
+    w = _watcher(tmp_path)
+    try:
+        assert w.poll() is None
+    finally:
+        w.close()
+
+
+def test_background_watcher_picks_up_promotion(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _set_env(tmp_path)
+    monkeypatch.setenv("BALANCEOPS_MODEL_WATCH_INTERVAL_MS", "20")
+    init_db(str(tmp_path / "balanceops.db"))
+    _promote(tmp_path, "r1", -10.0)
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+
+    with TestClient(api_main.app) as client:
+        assert api_main._get_watcher().running
+
+        r1 = client.post("/predict", json={"features": [0.0] * 8})
+        assert r1.json()["p_win"] < 0.01
+
+        _promote(tmp_path, "r2", 10.0)
+
+        deadline = time.monotonic() + 5.0
+        p = r1.json()["p_win"]
+        while time.monotonic() < deadline and p < 0.99:
+            time.sleep(0.02)
+            p = client.post("/predict", json={"features": [0.0] * 8}).json()["p_win"]
+        assert p > 0.99
+
+    assert not api_main._get_watcher().running
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.tracking.init_db import init_db
+
+
+def _set_env(tmp_path: Path) -> None:
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+
+
+def _promote_dummy(tmp_path: Path, *, w: np.ndarray, b: float, run_id: str = "r1") -> None:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}_dummy.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=w, b=b), cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={})
+
+
+def test_predict_batch_matches_single_predict(tmp_path: Path):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+    _promote_dummy(tmp_path, w=np.linspace(-1.0, 1.0, 8), b=0.1)
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+
+    rows = np.random.default_rng(0).normal(size=(5, 8)).tolist()
+
+    with TestClient(api_main.app) as client:
+        r = client.post("/predict/batch", json={"rows": rows})
+        assert r.status_code == 200
+        data = r.json()
+        assert data["count"] == 5
+        assert data["n_ok"] == 5
+        assert data["errors"] == []
+
+        for row, p in zip(rows, data["p_win"]):
+            single = client.post("/predict", json={"features": row}).json()["p_win"]
+            assert abs(single - p) < 1e-12
+
+
+def test_predict_batch_reports_per_row_errors(tmp_path: Path):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+    _promote_dummy(tmp_path, w=np.zeros(8), b=0.0)
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+
+    rows = [[0.0] * 8, [0.0] * 3, [0.0] * 8]
+
+    with TestClient(api_main.app) as client:
+        r = client.post("/predict/batch", json={"rows": rows})
+        assert r.status_code == 200
+        data = r.json()
+
+        assert data["n_ok"] == 2
+        assert data["p_win"][1] is None
+        assert 0.49 < data["p_win"][0] < 0.51
+        assert 0.49 < data["p_win"][2] < 0.51
+
+        assert len(data["errors"]) == 1
+        err = data["errors"][0]
+        assert err["index"] == 1
+        assert err["code"] == "FEATURE_SIZE_MISMATCH"
+        assert err["details"] == {"expected_n_features": 8, "got_n_features": 3}
+
+
+def test_predict_batch_empty_rows_is_validation_error(tmp_path: Path):
+    _set_env(tmp_path)
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+
+    with TestClient(api_main.app) as client:
+        r = client.post("/predict/batch", json={"rows": []})
+        assert r.status_code == 422
+        assert r.json()["error"]["code"] == "VALIDATION_ERROR"
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving.codec import PayloadError, decode_npy, decode_raw, encode_npy
+from balanceops.tracking.init_db import init_db
+
+NPY = "application/x-npy"
+RAW = "application/octet-stream"
+
+
+def _npy(arr: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    np.save(buf, arr)
+    return buf.getvalue()
+
+
+@pytest.fixture()
+def client(tmp_path: Path):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    init_db(str(tmp_path / "balanceops.db"))
+
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.linspace(-1.0, 1.0, 8), b=0.1), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as c:
+        yield c
+
+
+def _json_p(client: TestClient, rows: np.ndarray) -> np.ndarray:
+    r = client.post("/predict/batch", json={"rows": rows.tolist()})
+    assert r.status_code == 200
+    return np.asarray(r.json()["p_win"], dtype=float)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_npy_roundtrip_matches_json(client: TestClient, dtype: str):
+    X = np.random.default_rng(0).normal(size=(6, 8)).astype(dtype)
+
+    r = client.post("/predict/batch", content=_npy(X), headers={"Content-Type": NPY})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == NPY
+    assert r.headers["X-Shape"] == "6"
+    p = np.load(io.BytesIO(r.content))
+    assert p.dtype == np.float64 and p.shape == (6,)
+    np.testing.assert_allclose(p, _json_p(client, X.astype(float)), atol=1e-6)
+
+
+def test_raw_roundtrip_on_predict(client: TestClient):
+    X = np.random.default_rng(1).normal(size=(3, 8))
+
+    r = client.post(
+        "/predict",
+        content=X.astype("<f8").tobytes(),
+        headers={"Content-Type": RAW, "X-Shape": "3,8"},
+    )
+    assert r.status_code == 200
+    p = np.frombuffer(r.content, dtype="<f8")
+    np.testing.assert_allclose(p, _json_p(client, X), atol=1e-12)
+
+    single = client.post("/predict", json={"features": X[0].tolist()}).json()["p_win"]
+    assert abs(single - p[0]) < 1e-12
+
+
+def test_binary_errors_use_standard_envelope(client: TestClient):
+    r = client.post(
+        "/predict", content=b"\x00" * 10, headers={"Content-Type": RAW, "X-Shape": "1,8"}
+    )
+    assert r.status_code == 400
+    assert r.json()["error"]["code"] == "INVALID_PAYLOAD"
+
+    r = client.post("/predict", content=_npy(np.zeros((2, 5))), headers={"Content-Type": NPY})
+    assert r.status_code == 400
+    assert r.json()["error"]["code"] == "FEATURE_SIZE_MISMATCH"
+
+    X = np.zeros((3, 8))
+    X[1, 2] = np.nan
+    r = client.post("/predict", content=_npy(X), headers={"Content-Type": NPY})
+    assert r.status_code == 422
+    assert r.json()["error"]["code"] == "NON_FINITE_FEATURE"
+    assert r.json()["error"]["details"] == {"rows": [1]}
+
+    raw = np.full((1, 8), np.inf, dtype="<f8").tobytes()
+    r = client.post("/predict", content=raw, headers={"Content-Type": RAW, "X-Shape": "1,8"})
+    assert r.status_code == 422
+    assert r.json()["error"]["code"] == "NON_FINITE_FEATURE"
+
+    # batch는 row 단위로 NaN 처리
+    r = client.post("/predict/batch", content=_npy(X), headers={"Content-Type": NPY})
+    assert r.status_code == 200
+    assert r.headers["X-N-Ok"] == "2"
+    p = np.load(io.BytesIO(r.content))
+    assert np.isnan(p[1]) and np.isfinite(p[[0, 2]]).all()
+
+
+def test_single_json_rejects_non_finite_features(client: TestClient):
+    # 1e400은 JSON 파싱 시 inf가 된다
+    body = b'{"features": [1e400, 0, 0, 0, 0, 0, 0, 0]}'
+    r = client.post("/predict", content=body, headers={"Content-Type": "application/json"})
+    assert r.status_code == 422
+    assert r.json()["error"]["code"] == "NON_FINITE_FEATURE"
+    assert r.json()["error"]["details"] == {"rows": [0]}
+
+
+def test_json_validation_errors_still_422(client: TestClient):
+    r = client.post("/predict", content=b"{not json", headers={"Content-Type": "application/json"})
+    assert r.status_code == 422
+    assert r.json()["error"]["code"] == "VALIDATION_ERROR"
+
+    r = client.post("/predict", json={"features": "x"})
+    assert r.status_code == 422
+    assert r.json()["error"]["details"][0]["loc"][:2] == ["body", "features"]
+
+
+def test_decoders_are_zero_copy_views():
+    X = np.arange(12, dtype="<f8").reshape(3, 4)
+    body = _npy(X)
+    got = decode_npy(body)
+    np.testing.assert_array_equal(got, X)
+    assert not got.flags.owndata and not got.flags.writeable
+
+    fortran = _npy(np.asfortranarray(X))
+    np.testing.assert_array_equal(decode_npy(fortran), X)
+
+    raw = decode_raw(X.astype("<f4").tobytes(), shape="3,4", dtype="float32")
+    assert raw.dtype == np.float32 and not raw.flags.owndata
+
+    assert decode_raw(X[0].tobytes(), shape="4", dtype=None).shape == (1, 4)
+    assert np.load(io.BytesIO(encode_npy(np.ones(2)))).tolist() == [1.0, 1.0]
+
+
+@pytest.mark.parametrize(
+    "body,shape,dtype",
+    [
+        (b"", None, None),
+        (b"\x00" * 8, "1,1", "int64"),
+        (b"\x00" * 8, "a,b", None),
+        (b"\x00" * 8, "1,1,1", None),
+    ],
+)
+def test_decode_raw_rejects_bad_headers(body: bytes, shape: str | None, dtype: str | None):
+    with pytest.raises(PayloadError):
+        decode_raw(body, shape=shape, dtype=dtype)
+
+
+def test_decode_npy_rejects_non_float():
+    with pytest.raises(PayloadError):
+        decode_npy(_npy(np.zeros((2, 2), dtype=np.int64)))
+    with pytest.raises(PayloadError):
+        decode_npy(b"not an npy file")
+
+
+def test_bench_tool_reports_all_formats(client: TestClient):
+    from balanceops.tools.bench_predict_formats import run_bench
+
+    results = run_bench(client, rows=50, n_features=8, repeat=1)
+    assert [r["format"] for r in results] == ["json", "npy", "raw"]
+    assert all(r["rows_per_sec"] > 0 for r in results)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import ClientDisconnect
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving.stream import NdjsonRowParser, StreamError, iter_lines
+from balanceops.tracking.init_db import init_db
+
+
+@pytest.fixture()
+def client(tmp_path: Path):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    init_db(str(tmp_path / "balanceops.db"))
+
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.linspace(-1.0, 1.0, 8), b=0.1), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as c:
+        yield c
+
+
+def _batch_p(client: TestClient, rows: list[list[float]]) -> list[float]:
+    return client.post("/predict/batch", json={"rows": rows}).json()["p_win"]
+
+
+def test_ndjson_stream_matches_batch_and_echoes_ids(client: TestClient):
+    rows = np.random.default_rng(0).normal(size=(25, 8)).round(6).tolist()
+
+    def _body():
+        # 줄 경계와 무관하게 잘린 조각으로 전송
+        data = "".join(
+            json.dumps({"id": f"r{i}", "features": r}) + "\n" for i, r in enumerate(rows)
+        )
+        raw = data.encode("utf-8")
+        for i in range(0, len(raw), 37):
+            yield raw[i : i + 37]
+
+    r = client.post(
+        "/predict/stream?chunk_size=4",
+        content=_body(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+
+    out = [json.loads(line) for line in r.text.splitlines()]
+    assert [o["id"] for o in out] == [f"r{i}" for i in range(25)]
+    expected = _batch_p(client, rows)
+    for o, p in zip(out, expected):
+        assert abs(o["p_win"] - p) < 1e-12
+
+
+def test_ndjson_row_errors_are_reported_in_place(client: TestClient):
+    lines = [
+        json.dumps([0.0] * 8),
+        json.dumps({"id": 7, "features": [0.0] * 3}),
+        "not json",
+        json.dumps({"id": "nan", "features": [0.0] * 7 + [float("nan")]}),
+        "",
+        json.dumps({"id": "ok", "features": [1.0] * 8}),
+    ]
+    r = client.post(
+        "/predict/stream",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    out = [json.loads(line) for line in r.text.splitlines()]
+
+    assert len(out) == 5
+    assert "id" not in out[0] and 0.0 < out[0]["p_win"] < 1.0
+    assert out[1] == {
+        "id": 7,
+        "line": 2,
+        "error": {
+            "code": "FEATURE_SIZE_MISMATCH",
+            "message": "Feature length mismatch (expected 8, got 3).",
+        },
+    }
+    assert out[2]["line"] == 3 and out[2]["error"]["code"] == "INVALID_ROW"
+    assert out[3]["id"] == "nan" and out[3]["error"]["code"] == "NON_FINITE_FEATURE"
+    assert out[4]["id"] == "ok" and "error" not in out[4]
+
+
+def test_csv_stream_with_id_header(client: TestClient):
+    rows = np.random.default_rng(1).normal(size=(3, 8)).round(6).tolist()
+    body = "id,f1,f2,f3,f4,f5,f6,f7,f8\n" + "".join(
+        f"a{i}," + ",".join(map(str, r)) + "\n" for i, r in enumerate(rows)
+    )
+    body += "bad,1,2\n"
+
+    body += 'q1,"1,2\n'  # 닫히지 않은 따옴표
+    body += "q2,1,2,3,4,5,6,7,x\n"
+
+    r = client.post("/predict/stream", content=body, headers={"Content-Type": "text/csv"})
+    assert r.status_code == 200
+    out = list(csv.reader(io.StringIO(r.text)))
+    assert out[0] == ["id", "p_win", "error_code", "error_message", "line"]
+
+    expected = _batch_p(client, rows)
+    for i, (row, p) in enumerate(zip(out[1:4], expected)):
+        assert row[0] == f"a{i}" and row[2:] == ["", "", ""] and abs(float(row[1]) - p) < 1e-12
+    assert out[4] == [
+        "bad",
+        "",
+        "FEATURE_SIZE_MISMATCH",
+        "Feature length mismatch (expected 8, got 2).",
+        "5",
+    ]
+    # CSV 파서 메시지와 줄 번호를 그대로 남긴다
+    assert out[5][2] == "INVALID_ROW" and out[5][4] == "6"
+    assert out[5][3].startswith("Invalid CSV:")
+    assert out[6][0] == "q2" and "cell 8: 'x'" in out[6][3] and out[6][4] == "7"
+
+
+def test_client_disconnect_mid_body_ends_stream_quietly():
+    import apps.api.main as api_main
+
+    class _Gone:
+        async def stream(self):
+            yield b"[0,0,0,0,0,0,0,0]\n"
+            raise ClientDisconnect()
+
+    class _Model:
+        def predict_proba(self, X):
+            return np.full((len(X), 2), 0.5)
+
+    async def _run() -> list[bytes]:
+        gen = api_main._stream_scores(_Gone(), _Model(), 8, NdjsonRowParser(), 1000)
+        return [chunk async for chunk in gen]
+
+    assert asyncio.run(_run()) == []
+
+
+def test_stream_without_model_uses_standard_error(tmp_path: Path):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(tmp_path / "missing.joblib")
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as c:
+        r = c.post("/predict/stream", content=b"[0,0,0,0,0,0,0,0]\n")
+        assert r.status_code == 404
+        assert r.json()["error"]["code"] == "NO_CURRENT_MODEL"
+
+
+def _collect(chunks: list[bytes], **kwargs) -> list[tuple[int, bytes]]:
+    async def _gen():
+        for c in chunks:
+            yield c
+
+    async def _run():
+        return [x async for x in iter_lines(_gen(), **kwargs)]
+
+    return asyncio.run(_run())
+
+
+def test_iter_lines_splits_across_chunks_and_keeps_line_numbers():
+    got = _collect([b"a\nb", b"b\n\nc", b"c\r\n", b"d"])
+    assert got == [(1, b"a"), (2, b"bb"), (4, b"cc\r"), (5, b"d")]
+
+
+def test_iter_lines_rejects_unbounded_line():
+    with pytest.raises(StreamError):
+        _collect([b"x" * 10, b"y" * 10], max_line_bytes=15)
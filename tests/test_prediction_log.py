@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.serving.prediction_log import (
+    NdjsonSink,
+    PredictionLogger,
+    PredictionRecord,
+    SqliteSink,
+    finite_rows,
+    make_sink,
+)
+from balanceops.tracking.init_db import init_db
+
+
+def _record(n: int, request_id: str = "req") -> PredictionRecord:
+    return PredictionRecord(
+        created_at="2026-01-01T00:00:00.000+00:00",
+        request_id=request_id,
+        model_name="balance_model",
+        run_id="r1",
+        X=np.arange(n * 2, dtype=float).reshape(n, 2),
+        p_win=np.full(n, 0.25),
+        latency_ms=1.5,
+    )
+
+
+def _count(reg: MetricsRegistry, result: str) -> float:
+    return reg.counter("balanceops_prediction_log_rows_total", "", ["result"]).get(result=result)
+
+
+def test_full_buffer_drops_instead_of_blocking(tmp_path: Path):
+    reg = MetricsRegistry()
+    plog = PredictionLogger(
+        NdjsonSink(tmp_path / "logs"), capacity_rows=5, batch_rows=5, metrics=reg
+    )
+    assert plog.log(_record(3))
+    assert not plog.log(_record(3))  # 3 + 3 > 5
+    assert plog.log(_record(2))
+
+    assert _count(reg, "queued") == 5 and _count(reg, "dropped") == 3
+    assert plog.flush() == 5
+    assert _count(reg, "written") == 5
+
+
+def test_sqlite_sink_writes_one_row_per_prediction_and_stop_flushes(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    plog = PredictionLogger(SqliteSink(db), flush_interval_s=60.0)
+    plog.start()
+    plog.log(_record(2, "a"))
+    plog.log(_record(1, "b"))
+    plog.stop()  # 주기 전에 종료해도 버퍼는 모두 기록
+
+    con = sqlite3.connect(db)
+    rows = con.execute(
+        "SELECT request_id, run_id, features_json, p_win, latency_ms FROM prediction_log"
+    ).fetchall()
+    con.close()
+    assert [r[0] for r in rows] == ["a", "a", "b"]
+    assert json.loads(rows[1][2]) == [2.0, 3.0]
+    assert rows[0][1] == "r1" and rows[0][3] == 0.25 and rows[0][4] == 1.5
+
+
+def test_ndjson_sink_rotates_by_size(tmp_path: Path):
+    sink = NdjsonSink(tmp_path / "logs", max_bytes=200)
+    plog = PredictionLogger(sink)
+    for i in range(4):
+        plog.log(_record(2, f"r{i}"))
+        plog.flush()
+
+    files = sorted((tmp_path / "logs").glob("predictions-*.ndjson"))
+    assert len(files) >= 2
+    lines = [json.loads(line) for f in files for line in f.read_text().splitlines()]
+    assert len(lines) == 8
+    assert lines[0]["features"] == [0.0, 1.0] and lines[-1]["request_id"] == "r3"
+
+
+def test_make_sink_rejects_unknown_mode(tmp_path: Path):
+    assert make_sink("off", db_path="x.db", directory=tmp_path, rotate_bytes=1) is None
+    with pytest.raises(ValueError):
+        make_sink("parquet", db_path="x.db", directory=tmp_path, rotate_bytes=1)
+
+
+def test_api_logs_predictions_with_request_id_and_run_id(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    db = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_DB"] = db
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    monkeypatch.setenv("BALANCEOPS_PREDICTION_LOG", "sqlite")
+    init_db(db)
+
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.linspace(-1.0, 1.0, 8), b=0.0), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        r = client.post("/predict", json={"features": [0.5] * 8}, headers={"X-Request-ID": "one"})
+        p_one = r.json()["p_win"]
+        client.post(
+            "/predict/batch",
+            json={"rows": [[0.0] * 8, [1.0] * 3, [1.0] * 8]},
+            headers={"X-Request-ID": "batch"},
+        )
+        buf = io.BytesIO()
+        np.save(buf, np.zeros((4, 8)))
+        client.post(
+            "/predict",
+            content=buf.getvalue(),
+            headers={"Content-Type": "application/x-npy", "X-Request-ID": "npy"},
+        )
+        client.post(
+            "/predict/stream",
+            content=b"[0,0,0,0,0,0,0,0]\n[1,2]\n[1,1,1,1,1,1,1,1]\n",
+            headers={"Content-Type": "application/x-ndjson", "X-Request-ID": "stream"},
+        )
+    # lifespan 종료 시 flush
+
+    con = sqlite3.connect(db)
+    rows = con.execute(
+        "SELECT request_id, model_name, run_id, p_win, latency_ms FROM prediction_log"
+    ).fetchall()
+    con.close()
+
+    by_req: dict[str, list[tuple]] = {}
+    for row in rows:
+        by_req.setdefault(row[0], []).append(row)
+    assert {k: len(v) for k, v in by_req.items()} == {"one": 1, "batch": 2, "npy": 4, "stream": 2}
+    one = by_req["one"][0]
+    assert one[1:3] == ("balance_model", "r1")
+    assert abs(one[3] - p_one) < 1e-12 and one[4] > 0
+
+
+def test_bad_record_does_not_kill_flusher_or_lose_batch(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    reg = MetricsRegistry()
+    plog = PredictionLogger(SqliteSink(db), flush_interval_s=0.01, metrics=reg)
+    plog.start()
+
+    bad = PredictionRecord(
+        created_at="2026-01-01T00:00:00.000+00:00",
+        request_id="bad",
+        model_name="balance_model",
+        run_id="r1",
+        X=np.array([[np.inf, 0.0]]),
+        p_win=np.array([1.0]),
+        latency_ms=None,
+    )
+    plog.log(bad)
+    plog.log(_record(2, "same-batch"))
+    plog.flush()
+    plog.log(_record(1, "later"))
+    time.sleep(0.1)  # 백그라운드 flusher가 계속 돈다
+    assert plog.running
+    plog.stop()
+
+    con = sqlite3.connect(db)
+    got = [r[0] for r in con.execute("SELECT request_id FROM prediction_log")]
+    con.close()
+    assert got == ["same-batch", "same-batch", "later"]
+    assert _count(reg, "error") == 1 and _count(reg, "written") == 3
+
+
+def test_finite_rows_drops_non_finite_features():
+    X = np.array([[1.0, 2.0], [np.inf, 0.0], [0.0, np.nan], [3.0, 4.0]])
+    X_ok, p_ok = finite_rows(X, np.array([0.1, 0.2, 0.3, np.nan]))
+    assert X_ok.tolist() == [[1.0, 2.0]] and p_ok.tolist() == [0.1]
+
+
+def test_api_inf_feature_request_does_not_stop_prediction_log(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    db = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_DB"] = db
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    monkeypatch.setenv("BALANCEOPS_PREDICTION_LOG", "sqlite")
+    monkeypatch.setenv("BALANCEOPS_PREDICTION_LOG_FLUSH_MS", "10")
+    init_db(db)
+
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.linspace(-1.0, 1.0, 8), b=0.0), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        client.post(
+            "/predict",
+            content=b'{"features": [1e400, 0, 0, 0, 0, 0, 0, 0]}',
+            headers={"Content-Type": "application/json", "X-Request-ID": "inf"},
+        )
+        time.sleep(0.1)
+        for i in range(3):
+            r = client.post(
+                "/predict", json={"features": [0.5] * 8}, headers={"X-Request-ID": f"ok{i}"}
+            )
+            assert r.status_code == 200
+        time.sleep(0.1)
+        assert api_main._PRED_LOG.running
+
+    con = sqlite3.connect(db)
+    got = [r[0] for r in con.execute("SELECT request_id FROM prediction_log")]
+    con.close()
+    assert got == ["ok0", "ok1", "ok2"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.tracking.init_db import init_db
+
+
+@pytest.fixture()
+def api(tmp_path: Path):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    return api_main
+
+
+def _promote(tmp_path: Path, run_id: str) -> None:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=0.0), cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={})
+
+
+def _wait_ready(client: TestClient, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        r = client.get("/ready")
+        if r.status_code == 200 or time.monotonic() >= deadline:
+            return r
+        time.sleep(0.01)
+
+
+def test_ready_is_503_without_promoted_model(api):
+    with TestClient(api.app) as client:
+        assert client.get("/health").status_code == 200
+        r = client.get("/ready")
+        assert r.status_code == 503
+        assert r.json()["reason"] == "no_current_model"
+
+
+def test_lifespan_loads_eagerly_and_ready_waits_for_warm_up(
+    tmp_path: Path, api, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("BALANCEOPS_EAGER_LOAD", "1")
+    _promote(tmp_path, "r1")
+
+    real_load = joblib.load
+    gate = threading.Event()
+
+    def _gated_load(path, *args, **kwargs):
+        gate.wait(timeout=5.0)
+        return real_load(path, *args, **kwargs)
+
+    monkeypatch.setattr(api.joblib, "load", _gated_load)
+
+    with TestClient(api.app) as client:
+        r = client.get("/ready")
+        assert r.status_code == 503
+        assert r.json()["reason"] == "loading"
+
+        gate.set()
+        r = _wait_ready(client)
+        assert r.status_code == 200
+        body = r.json()
+        assert body["status"] == "ready"
+        assert body["model"]["run_id"] == "r1"
+        assert body["model"]["load_seconds"] > 0
+        assert body["model"]["compiled"] is True
+
+        # 요청 없이도 이미 로딩됨
+        assert api._MODEL_LOADS.get(result="ok") == 1
+
+
+def test_ready_kicks_off_load_when_nothing_is_loading(tmp_path: Path, api):
+    _promote(tmp_path, "r1")  # eager load 꺼짐(conftest) → 기동 후에도 미로딩
+
+    with TestClient(api.app) as client:
+        r = client.get("/ready")
+        assert r.status_code == 503
+        assert r.json()["reason"] in ("not_loaded", "loading")
+
+        assert _wait_ready(client).json()["model"]["run_id"] == "r1"
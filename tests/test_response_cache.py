@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.serving.response_cache import ResponseCache, feature_key
+from balanceops.tracking.init_db import init_db
+
+
+def _cache(max_entries: int = 10, ttl_s: float = 60.0) -> tuple[ResponseCache, MetricsRegistry]:
+    reg = MetricsRegistry()
+    return ResponseCache(max_entries=max_entries, ttl_s=ttl_s, metrics=reg), reg
+
+
+def _lookups(reg: MetricsRegistry, result: str) -> float:
+    return reg.counter("balanceops_response_cache_lookups_total", "", ["result"]).get(result=result)
+
+
+def test_feature_key_is_dtype_insensitive_and_model_scoped():
+    ident = ("m", "r1", "/p", 1)
+    assert feature_key(ident, [1, 2, 3]) == feature_key(ident, np.array([1.0, 2.0, 3.0]))
+    assert feature_key(ident, [1.0, 2.0]) != feature_key(("m", "r2", "/p", 1), [1.0, 2.0])
+
+
+def test_lru_eviction_and_ttl():
+    cache, reg = _cache(max_entries=2)
+    k = [feature_key(("m",), [float(i)]) for i in range(3)]
+    cache.put(k[0], 0.1)
+    cache.put(k[1], 0.2)
+    assert cache.get(k[0]) == 0.1  # k[1]이 LRU
+    cache.put(k[2], 0.3)
+
+    assert cache.get(k[1]) is None
+    assert cache.get(k[0]) == 0.1 and cache.get(k[2]) == 0.3
+    assert reg.counter("balanceops_response_cache_evictions_total", "").get() == 1
+
+    short, reg2 = _cache(ttl_s=0.01)
+    short.put(k[0], 0.5)
+    time.sleep(0.02)
+    assert short.get(k[0]) is None
+    assert _lookups(reg2, "expired") == 1 and len(short) == 0
+
+
+def test_invalidate_only_drops_that_model_name():
+    cache, _ = _cache()
+    cache.put(feature_key(("a", "r1"), [1.0]), 0.1)
+    cache.put(feature_key(("a", "r1"), [2.0]), 0.2)
+    cache.put(feature_key(("b", "r1"), [1.0]), 0.3)
+
+    assert cache.invalidate("a") == 2
+    assert len(cache) == 1
+
+
+@pytest.fixture()
+def client_factory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    monkeypatch.setenv("BALANCEOPS_RESPONSE_CACHE_MAX_ENTRIES", "100")
+    init_db(str(tmp_path / "balanceops.db"))
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    return api_main
+
+
+def _promote(tmp_path: Path, run_id: str, b: float) -> None:
+    cand = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=b), cand)
+    promote_run(run_id=run_id, model_path=str(cand), metrics={})
+
+
+def test_api_hits_cache_and_promotion_invalidates(tmp_path: Path, client_factory):
+    api = client_factory
+    _promote(tmp_path, "r1", b=-10.0)
+    body = {"features": [0.5] * 8}
+
+    with TestClient(api.app) as client:
+        p1 = [client.post("/predict", json=body).json()["p_win"] for _ in range(3)]
+        assert p1[0] < 0.01 and p1 == [p1[0]] * 3
+        assert _lookups(api._METRICS, "hit") == 2
+        assert _lookups(api._METRICS, "miss") == 1
+
+        _promote(tmp_path, "r2", b=10.0)
+        assert client.post("/predict", json=body).json()["p_win"] > 0.99
+        text = client.get("/metrics").text
+
+    assert 'balanceops_response_cache_lookups_total{result="hit"} 2' in text
+    assert "balanceops_response_cache_invalidations_total 1" in text
+    assert "balanceops_response_cache_entries 1" in text
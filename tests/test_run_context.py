@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from balanceops.tracking.init_db import init_db
+from balanceops.tracking.log_run import RunContext, create_run, log_artifacts, log_metrics
+from balanceops.tracking.read import get_run_detail
+
+
+def _count(db: str, table: str) -> int:
+    con = sqlite3.connect(db)
+    n = con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    con.close()
+    return n
+
+
+def test_log_metrics_and_artifacts_bulk(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    create_run(db, "r1", params={})
+    log_metrics(db, "r1", {"acc": 0.5, "bal_acc": 0.4})
+    log_metrics(db, "r1", {"acc": 0.7})  # upsert
+    log_artifacts(db, "r1", [("model_candidate", "/a.joblib"), ("dataset_meta", Path("/d.json"))])
+
+    d = get_run_detail(db, run_id="r1")
+    assert d["metrics"] == {"acc": 0.7, "bal_acc": 0.4}
+    assert {(a["kind"], a["path"]) for a in d["artifacts"]} == {
+        ("model_candidate", "/a.joblib"),
+        ("dataset_meta", "/d.json"),
+    }
+
+
+def test_run_context_commits_once_on_exit(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    with RunContext(db, "r1", params={"kind": "t"}, note="n") as run:
+        run.log_metric("acc", 0.1)
+        run.log_metrics({"acc": 0.9, "loss": 0.3})
+        run.log_artifact("model_candidate", "/a.joblib")
+        assert _count(db, "runs") == 0 and run.pending == 4
+
+    assert run.flushes == 1 and run.pending == 0
+    d = get_run_detail(db, run_id="r1")
+    assert d["params"] == {"kind": "t"} and d["note"] == "n"
+    assert d["metrics"] == {"acc": 0.9, "loss": 0.3}
+
+
+def test_run_context_flushes_on_error_and_by_interval(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    with pytest.raises(RuntimeError):
+        with RunContext(db, "r1", params={}) as run:
+            run.log_metric("acc", 0.5)
+            raise RuntimeError("boom")
+    assert _count(db, "metrics") == 1
+
+    run = RunContext(db, "r2", flush_interval_ms=0)  # 기록할 때마다 commit
+    run.log_metric("acc", 0.5)
+    assert _count(db, "metrics") == 2 and run.pending == 0
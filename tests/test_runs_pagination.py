@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.tools import bench_runs_pagination
+from balanceops.tracking.init_db import SCHEMA_VERSION, init_db
+from balanceops.tracking.read import decode_run_cursor, encode_run_cursor, list_runs_summary
+
+
+def _insert_runs(db: str, rows: list[tuple[str, str]]) -> None:
+    con = sqlite3.connect(db)
+    with con:
+        con.executemany(
+            "INSERT INTO runs(run_id, created_at, git_dirty, params_json) VALUES (?, ?, 0, '{}')",
+            rows,
+        )
+    con.close()
+
+
+def test_init_db_migrates_existing_database(tmp_path: Path):
+    db = str(tmp_path / "old.db")
+    con = sqlite3.connect(db)
+    con.execute("CREATE TABLE runs (run_id TEXT PRIMARY KEY, created_at TEXT NOT NULL)")
+    con.execute("INSERT INTO runs VALUES ('r1', '2024-01-01T00:00:00')")
+    con.commit()
+    con.close()
+
+    init_db(db)
+    init_db(db)  # 재실행해도 그대로
+
+    con = sqlite3.connect(db)
+    assert con.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    indexes = {r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert {"idx_runs_created_at", "idx_artifacts_run_id"} <= indexes
+    assert con.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+    con.close()
+
+
+def test_cursor_pages_cover_all_runs_once_including_ties(tmp_path: Path):
+    db = str(tmp_path / "balanceops.db")
+    init_db(db)
+    # created_at이 같은 run이 있어도 run_id로 순서가 정해짐
+    _insert_runs(db, [(f"r{i:02d}", f"2024-01-01T00:00:{i // 3:02d}") for i in range(10)])
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = list_runs_summary(db, limit=4, cursor=cursor, include_metrics=False)
+        seen.extend(r["run_id"] for r in page)
+        if len(page) < 4:
+            break
+        cursor = encode_run_cursor(page[-1]["created_at"], page[-1]["run_id"])
+
+    assert seen == [f"r{i:02d}" for i in reversed(range(10))]
+    assert seen == [r["run_id"] for r in list_runs_summary(db, limit=10, include_metrics=False)]
+
+
+def test_decode_run_cursor_rejects_garbage():
+    assert decode_run_cursor(encode_run_cursor("t", "r")) == ("t", "r")
+    for bad in ("not-base64!", encode_run_cursor("t", "r")[:-3], "W10"):
+        with pytest.raises(ValueError):
+            decode_run_cursor(bad)
+
+
+def test_runs_api_returns_next_cursor(tmp_path: Path):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    init_db(os.environ["BALANCEOPS_DB"])
+    _insert_runs(os.environ["BALANCEOPS_DB"], [(f"r{i}", f"2024-01-0{i + 1}") for i in range(5)])
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    client = TestClient(api_main.app)
+
+    first = client.get("/runs", params={"limit": 3, "include_metrics": False}).json()
+    assert [r["run_id"] for r in first["items"]] == ["r4", "r3", "r2"]
+    second = client.get(
+        "/runs", params={"limit": 3, "include_metrics": False, "cursor": first["next_cursor"]}
+    ).json()
+    assert [r["run_id"] for r in second["items"]] == ["r1", "r0"]
+    assert second["next_cursor"] is None
+
+    r = client.get("/runs", params={"cursor": "%%%"})
+    assert r.status_code == 400 and r.json()["error"]["code"] == "INVALID_CURSOR"
+
+
+def test_bench_runs_pagination_smoke(tmp_path: Path):
+    db = str(tmp_path / "bench.db")
+    init_db(db)
+    bench_runs_pagination.populate(db, 50)
+    results = bench_runs_pagination.run_bench(db, n=50, limit=5, depth=0.5, repeat=1)
+    assert [r["case"] for r in results][-1] == "cursor skip=25"
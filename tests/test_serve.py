@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import sys
+import types
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving import serve
+from balanceops.tracking.init_db import init_db
+
+_SERVE_ENV = (
+    *serve.BLAS_THREAD_ENV_VARS,
+    "BALANCEOPS_PRELOAD_MODEL",
+    "BALANCEOPS_SERVE_LAUNCHED_AT",
+)
+
+
+def test_plan_workers_splits_cpus_between_workers():
+    assert serve.plan_workers(workers=None, blas_threads=None, cpus=8) == (8, 1)
+    assert serve.plan_workers(workers=2, blas_threads=None, cpus=8) == (2, 4)
+    assert serve.plan_workers(workers=16, blas_threads=None, cpus=8) == (16, 1)
+    assert serve.plan_workers(workers=2, blas_threads=3, cpus=8) == (2, 3)
+
+
+def test_available_cpus_respects_cgroup_quota(tmp_path: Path):
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+    assert serve.cgroup_cpu_limit(str(tmp_path)) == 1.5
+    assert serve.available_cpus(str(tmp_path)) <= 2
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert serve.cgroup_cpu_limit(str(tmp_path)) is None
+
+    v1 = tmp_path / "v1"
+    (v1 / "cpu").mkdir(parents=True)
+    (v1 / "cpu" / "cpu.cfs_quota_us").write_text("100000\n")
+    (v1 / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    assert serve.available_cpus(str(v1)) == 1
+    assert serve.cgroup_cpu_limit(str(tmp_path / "missing")) is None
+
+
+def test_bad_env_int_is_a_usage_error(monkeypatch: pytest.MonkeyPatch, capsys):
+    monkeypatch.setenv("BALANCEOPS_WORKERS", "four")
+    with pytest.raises(SystemExit) as e:
+        serve.build_parser().parse_args([])
+    assert e.value.code == 2 and "--workers" in capsys.readouterr().err
+
+    monkeypatch.setenv("BALANCEOPS_WORKERS", " 3 ")
+    monkeypatch.delenv("BALANCEOPS_PORT", raising=False)
+    args = serve.build_parser().parse_args([])
+    assert args.workers == 3 and args.port == 8000
+
+
+def test_apply_thread_env_keeps_explicit_values_unless_overridden():
+    env = {"OMP_NUM_THREADS": "6"}
+    applied = serve.apply_thread_env(env, 2, override=False)
+    assert applied["OMP_NUM_THREADS"] == "6"
+    assert applied["OPENBLAS_NUM_THREADS"] == "2"
+
+    assert serve.apply_thread_env(env, 1, override=True)["OMP_NUM_THREADS"] == "1"
+
+
+def test_main_configures_env_and_runs_uvicorn(monkeypatch: pytest.MonkeyPatch):
+    for key in _SERVE_ENV:
+        monkeypatch.setenv(key, "")
+        monkeypatch.delenv(key)
+    monkeypatch.setattr(serve, "available_cpus", lambda: 8)
+
+    calls: list[tuple[str, dict]] = []
+    fake = types.ModuleType("uvicorn")
+    fake.run = lambda app, **kwargs: calls.append((app, kwargs))
+    monkeypatch.setitem(sys.modules, "uvicorn", fake)
+
+    assert serve.main(["--workers", "4", "--port", "9001"]) == 0
+
+    app, kwargs = calls[0]
+    assert app == "apps.api.main:app"
+    assert kwargs["workers"] == 4 and kwargs["port"] == 9001
+    assert os.environ["OMP_NUM_THREADS"] == "2"
+    assert os.environ["OPENBLAS_NUM_THREADS"] == "2"
+    assert os.environ["BALANCEOPS_PRELOAD_MODEL"] == "1"
+    assert float(os.environ["BALANCEOPS_SERVE_LAUNCHED_AT"]) > 0
+
+
+def test_lifespan_preloads_and_warms_current_model(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    monkeypatch.setenv("BALANCEOPS_PRELOAD_MODEL", "1")
+    init_db(str(tmp_path / "balanceops.db"))
+
+    cand = tmp_path / "artifacts" / "models" / "candidates" / "r1.joblib"
+    cand.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=0.0), cand)
+    promote_run(run_id="r1", model_path=str(cand), metrics={})
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        # 요청 전에 이미 로딩/워밍업 완료
+        assert api_main._MODEL_CACHE.run_id == "r1"
+        assert api_main._MODEL_LOADS.get(result="ok") == 1
+
+        client.post("/predict", json={"features": [0.0] * 8})
+        assert api_main._MODEL_LOADS.get(result="ok") == 1
+        assert "balanceops_startup_seconds" in client.get("/metrics").text
+
+
+def test_preload_without_promoted_model_still_starts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    os.environ["BALANCEOPS_DB"] = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(tmp_path / "missing.joblib")
+    monkeypatch.setenv("BALANCEOPS_PRELOAD_MODEL", "1")
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    with TestClient(api_main.app) as client:
+        assert client.get("/health").status_code == 200
+        assert api_main._MODEL_CACHE.model is None
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import balanceops.common.config as config
+
+
+def _set_env(monkeypatch: pytest.MonkeyPatch, root: Path) -> None:
+    monkeypatch.setenv("BALANCEOPS_DB", str(root / "data" / "balanceops.db"))
+    monkeypatch.setenv("BALANCEOPS_ARTIFACTS", str(root / "artifacts"))
+    monkeypatch.setenv("BALANCEOPS_CURRENT_MODEL", str(root / "models" / "current.joblib"))
+
+
+def test_get_settings_is_cached_and_creates_dirs_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _set_env(monkeypatch, tmp_path)
+
+    mkdir_calls: list[Path] = []
+    orig_ensure = config.ensure_dirs
+
+    def _spy(s: config.Settings) -> None:
+        mkdir_calls.append(Path(s.db_path))
+        orig_ensure(s)
+
+    monkeypatch.setattr(config, "ensure_dirs", _spy)
+
+    s1 = config.get_settings()
+    s2 = config.get_settings()
+
+    assert s1 is s2
+    assert len(mkdir_calls) == 1
+    assert (tmp_path / "data").is_dir()
+    assert (tmp_path / "models").is_dir()
+
+
+def test_get_settings_rebuilds_when_env_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _set_env(monkeypatch, tmp_path / "a")
+    s1 = config.get_settings()
+
+    _set_env(monkeypatch, tmp_path / "b")
+    s2 = config.get_settings()
+
+    assert s1 is not s2
+    assert s2.db_path == str(tmp_path / "b" / "data" / "balanceops.db")
+
+
+def test_reload_settings_rereads_dotenv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_env(monkeypatch, tmp_path)
+
+    calls: list[bool] = []
+    monkeypatch.setattr(config, "load_dotenv", lambda override=False: calls.append(override))
+    monkeypatch.setattr(config, "_DOTENV_LOADED", False)
+
+    s1 = config.get_settings()
+    config.get_settings()
+    assert len(calls) == 1
+
+    s2 = config.reload_settings()
+    assert len(calls) == 2
+    assert s2 is not s1
+    assert s2 == s1
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from balanceops.models.dummy import DummyBalanceModel
+from balanceops.registry.promote import promote_run
+from balanceops.serving.metrics import MetricsRegistry
+from balanceops.serving.shadow import ShadowScorer
+from balanceops.tracking.init_db import init_db
+from balanceops.tracking.log_run import create_run, log_artifact
+
+
+def _dump(tmp_path: Path, run_id: str, b: float) -> Path:
+    path = tmp_path / "artifacts" / "models" / "candidates" / f"{run_id}.joblib"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(DummyBalanceModel(seed=1, w=np.zeros(8), b=b), path)
+    return path
+
+
+def _register_candidate(db: str, tmp_path: Path, run_id: str, b: float) -> Path:
+    path = _dump(tmp_path, run_id, b)
+    create_run(db, run_id, params={})
+    log_artifact(db, run_id, "model_candidate", str(path))
+    return path
+
+
+def test_submit_never_blocks_and_drops_when_queue_full(tmp_path: Path):
+    reg = MetricsRegistry()
+    shadow = ShadowScorer(
+        str(tmp_path / "x.db"), loader=joblib.load, sample_rate=1.0, queue_size=2, metrics=reg
+    )
+    # worker를 시작하지 않았으므로 큐가 비워지지 않음
+    results = [shadow.submit([0.0] * 8, 0.5, "r1") for _ in range(5)]
+
+    assert results == [True, True, False, False, False]
+    summary = shadow.summary()
+    assert summary["queued"] == 2 and summary["dropped"] == 3 and summary["queue_depth"] == 2
+
+
+def test_zero_sample_rate_skips_everything(tmp_path: Path):
+    shadow = ShadowScorer(str(tmp_path / "x.db"), loader=joblib.load, sample_rate=0.0)
+    assert not shadow.submit([0.0] * 8, 0.5, None)
+    assert shadow.summary()["queued"] == 0
+
+
+@pytest.fixture()
+def api(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    db = str(tmp_path / "balanceops.db")
+    os.environ["BALANCEOPS_DB"] = db
+    os.environ["BALANCEOPS_ARTIFACTS"] = str(tmp_path / "artifacts")
+    os.environ["BALANCEOPS_CURRENT_MODEL"] = str(
+        tmp_path / "artifacts" / "models" / "current.joblib"
+    )
+    monkeypatch.setenv("BALANCEOPS_SHADOW", "1")
+    monkeypatch.setenv("BALANCEOPS_SHADOW_SAMPLE_RATE", "1.0")
+    init_db(db)
+
+    import importlib
+
+    import apps.api.main as api_main
+
+    importlib.reload(api_main)
+    return api_main
+
+
+def test_predict_is_shadow_scored_against_latest_candidate(tmp_path: Path, api):
+    db = str(tmp_path / "balanceops.db")
+    promote_run(run_id="cur", model_path=str(_dump(tmp_path, "cur", -10.0)), metrics={})
+    _register_candidate(db, tmp_path, "cand", b=10.0)
+
+    with TestClient(api.app) as client:
+        for _ in range(3):
+            r = client.post("/predict", json={"features": [0.0] * 8})
+            assert r.status_code == 200
+            assert r.json()["p_win"] < 0.01  # 응답은 항상 current 결과
+        assert api._SHADOW.drain()
+
+        summary = client.get("/shadow").json()
+        text = client.get("/metrics").text
+
+    assert summary["enabled"] is True
+    assert summary["candidate_run_id"] == "cand"
+    assert summary["scored"] == 3
+    assert summary["agreement_rate"] == 0.0  # ~0 vs ~1 → 0.5 임계값 기준 불일치
+    assert 'balanceops_shadow_requests_total{result="scored"} 3' in text
+
+    con = sqlite3.connect(db)
+    rows = con.execute(
+        "SELECT current_run_id, candidate_run_id, p_current, p_candidate FROM shadow_scores"
+    ).fetchall()
+    con.close()
+    assert len(rows) == 3
+    for cur, cand, p_cur, p_cand in rows:
+        assert (cur, cand) == ("cur", "cand")
+        assert p_cur < 0.01 and p_cand > 0.99
+
+
+def test_candidate_equal_to_current_is_skipped(tmp_path: Path, api):
+    db = str(tmp_path / "balanceops.db")
+    path = _register_candidate(db, tmp_path, "same", b=0.0)
+    promote_run(run_id="same", model_path=str(path), metrics={})
+
+    with TestClient(api.app) as client:
+        client.post("/predict", json={"features": [0.0] * 8})
+        assert api._SHADOW.drain()
+        assert client.get("/shadow").json()["scored"] == 0
+
+    con = sqlite3.connect(db)
+    assert con.execute("SELECT COUNT(*) FROM shadow_scores").fetchone()[0] == 0
+    con.close()
+
+
+def test_shadow_run_id_comes_from_the_model_that_scored(
+    tmp_path: Path, api, monkeypatch: pytest.MonkeyPatch
+):
+    promote_run(run_id="cur", model_path=str(_dump(tmp_path, "cur", -10.0)), metrics={})
+    submitted: list[str | None] = []
+
+    with TestClient(api.app) as client:
+        assert client.post("/predict", json={"features": [0.0] * 8}).status_code == 200
+        monkeypatch.setattr(api._SHADOW, "submit", lambda f, p, run_id: submitted.append(run_id))
+        assert client.post("/predict", json={"features": [0.0] * 8}).status_code == 200
+        assert submitted == ["cur"]
+
+        # 스코어링 도중 모델이 교체됨 → 새 run_id로 잘못 기록하지 않고 샘플을 버린다
+        old = api._MODEL_CACHE.model
+
+        class Swapping:
+            def predict_proba(self, X):
+                with api._MODEL_LOCK:
+                    api._MODEL_CACHE.model = old
+                    api._MODEL_CACHE.run_id = "next"
+                return old.predict_proba(X)
+
+        with api._MODEL_LOCK:
+            api._MODEL_CACHE.model = Swapping()
+        assert client.post("/predict", json={"features": [0.0] * 8}).status_code == 200
+        assert submitted == ["cur"]
+
+
+def test_shadow_disabled_by_default(tmp_path: Path, api, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("BALANCEOPS_SHADOW")
+    with TestClient(api.app) as client:
+        assert client.get("/shadow").json() == {"enabled": False}
+    assert api._SHADOW is None
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from balanceops.tracking import db as db_module
+from balanceops.tracking.db import (
+    close_pooled_connections,
+    connect,
+    get_sqlite_options,
+    pooled_connection,
+)
+from balanceops.tracking.init_db import init_db
+from balanceops.tracking.log_run import log_metric
+
+
+def test_connect_applies_wal_normal_and_busy_timeout(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("BALANCEOPS_SQLITE_BUSY_TIMEOUT_MS", "1234")
+    con = connect(str(tmp_path / "a.db"))
+    assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert con.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert con.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+    con.close()
+
+    monkeypatch.setenv("BALANCEOPS_SQLITE_JOURNAL_MODE", "wal2")
+    with pytest.raises(ValueError):
+        get_sqlite_options()
+
+
+def test_pooled_connection_is_reused_per_thread(tmp_path: Path):
+    db = str(tmp_path / "a.db")
+    with pooled_connection(db) as c1:
+        pass
+    with pooled_connection(db) as c2:
+        assert c2 is c1
+
+    other: list[sqlite3.Connection] = []
+
+    def _use() -> None:
+        with pooled_connection(db) as c:
+            other.append(c)
+
+    t = threading.Thread(target=_use)
+    t.start()
+    t.join()
+    assert other[0] is not c1
+
+    close_pooled_connections()
+    with pooled_connection(db) as c3:
+        assert c3 is not c1
+
+
+def test_pool_reconnects_when_db_file_is_replaced(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(db_module, "_IDENTITY_CHECK_INTERVAL_S", 0.0)
+    db = tmp_path / "a.db"
+    init_db(str(db))
+    log_metric(str(db), "r1", "acc", 0.5)
+    with pooled_connection(str(db)) as c1:
+        pass
+
+    # 다른 프로세스가 DB를 지우고 새로 만든 상황(열린 연결은 예전 inode를 가리킴)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db}{suffix}").unlink(missing_ok=True)
+    init_db(str(db))
+
+    with pooled_connection(str(db)) as c2:
+        assert c2 is not c1
+        assert c2.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 0
+
+
+def test_file_identity_is_checked_at_interval_or_after_error(tmp_path: Path, monkeypatch):
+    db = str(tmp_path / "a.db")
+    init_db(db)
+    calls: list[str] = []
+    real = db_module._file_identity
+
+    def _counting(path: str):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(db_module, "_file_identity", _counting)
+    with pooled_connection(db):
+        pass
+    n = len(calls)
+    for _ in range(100):
+        with pooled_connection(db):
+            pass
+    assert len(calls) == n  # 주기 안에서는 stat 없이 재사용
+
+    with pytest.raises(sqlite3.OperationalError):
+        with pooled_connection(db) as con:
+            con.execute("SELECT * FROM no_such_table")
+    with pooled_connection(db):
+        pass
+    assert len(calls) == n + 1  # 오류 직후에는 바로 확인
+
+
+def test_uncommitted_write_is_rolled_back_on_release(tmp_path: Path):
+    db = str(tmp_path / "a.db")
+    init_db(db)
+    with pytest.raises(RuntimeError):
+        with pooled_connection(db) as con:
+            con.execute("INSERT INTO metrics(run_id, key, value) VALUES ('r', 'k', 1.0)")
+            raise RuntimeError("boom")
+
+    with pooled_connection(db) as con:
+        assert not con.in_transaction
+        assert con.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 0
+
+
+def test_reader_is_not_blocked_by_open_write_transaction(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("BALANCEOPS_SQLITE_BUSY_TIMEOUT_MS", "0")
+    db = str(tmp_path / "a.db")
+    init_db(db)
+    log_metric(db, "r1", "acc", 0.5)
+
+    writer = connect(db)
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("UPDATE metrics SET value = 0.9")
+    try:
+        reader = connect(db)
+        assert reader.execute("SELECT value FROM metrics").fetchone()[0] == 0.5
+        reader.close()
+    finally:
+        writer.rollback()
+        writer.close()
+
+
+def test_pool_can_be_disabled(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("BALANCEOPS_SQLITE_POOL", "0")
+    db = str(tmp_path / "a.db")
+    with pooled_connection(db) as c1:
+        pass
+    with pytest.raises(sqlite3.ProgrammingError):
+        c1.execute("SELECT 1")  # 사용 후 닫힘
@@ -1,9 +1,11 @@
 import os
 from pathlib import Path
 
+import joblib
 import pandas as pd
 
 from balanceops.datasets import DatasetSpec
+from balanceops.models.feature_stats import FeatureStats
 from balanceops.pipeline.train_tabular_baseline import train_tabular_baseline_run
 from balanceops.tracking.init_db import init_db
 
@@ -39,3 +41,8 @@ def test_train_tabular_baseline_on_csv(tmp_path: Path) -> None:
     assert set(out["metrics"].keys()) >= {"acc", "bal_acc", "recall_1"}
     assert out["promoted"] is True
     assert Path(os.environ["BALANCEOPS_CURRENT_MODEL"]).exists()
+
+    # 서빙 드리프트 모니터용 학습 통계가 래퍼에 함께 저장됨
+    wrapper = joblib.load(out["candidate_path"])
+    stats = FeatureStats.from_dict(wrapper["feature_stats"])
+    assert stats.names == ["f1", "f2"] and stats.count > 0